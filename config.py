@@ -38,6 +38,55 @@ def load_icons():
 BASE_PATH = "data/contents/topics"
 TASK_BASE_PATH = "data/contents/my_tasks.json"
 
+# --- Backend Penyimpanan ---
+# "json" = satu file per subject (bawaan), "sqlite" = satu database berbasis baris.
+# Saat "sqlite" dipakai pertama kali, isi folder JSON dimigrasi otomatis.
+STORAGE_BACKEND = "json"
+SQLITE_DB_PATH = "data/contents/repetition.db"
+
+# --- Cache Konten Subject ---
+CONTENT_CACHE_MAX_ENTRIES = 32
+CONTENT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# --- Penyimpanan di Belakang Layar (Write-Behind) ---
+# Simpan beruntun ke file yang sama dalam jendela ini digabung menjadi satu penulisan
+SAVE_DEBOUNCE_SECONDS = 0.5
+SAVE_MAX_DELAY_SECONDS = 3.0
+
+# --- Indeks Pencarian ---
+# Indeks disimpan saat aplikasi ditutup; subject yang versinya tidak berubah tidak dibaca ulang saat dibuka
+SEARCH_INDEX_PATH = "data/contents/search_index.json"
+
+# --- Pencarian Saat Mengetik ---
+# Query baru dijalankan setelah pengguna berhenti mengetik selama jeda ini
+LIVE_SEARCH_DEBOUNCE_MS = 250
+
+# --- Pencarian Fuzzy (Trigram) ---
+# Porsi minimal trigram query yang harus ditemukan di sebuah teks agar dianggap cocok
+FUZZY_SEARCH_MIN_SIMILARITY = 0.5
+FUZZY_SEARCH_MAX_RESULTS = 500
+
+# --- Patch Tampilan Konten ---
+# Perubahan baris di atas batas ini membuat content pane di-reset, bukan di-patch
+CONTENT_DIFF_MAX_ROW_CHANGES = 200
+# Sama untuk daftar subject: di atas batas ini daftar diisi ulang dari awal
+SUBJECT_LIST_DIFF_MAX_ROW_CHANGES = 200
+
+# --- Ringkasan Jatuh Tempo ---
+# Jika True, ringkasan inkremental dicocokkan dengan pemindaian penuh setiap kali disimpan
+VERIFY_DUE_SUMMARY = False
+# Ringkasan yang disimpan (satu per subject); ringkasan hanya berlaku untuk objek
+# konten yang sama, jadi batasnya mengikuti cache konten
+DUE_SUMMARY_CACHE_MAX_ENTRIES = CONTENT_CACHE_MAX_ENTRIES
+
+# --- Sesi Review ---
+# Jumlah subject berikutnya yang dibaca lebih awal di thread pekerja
+REVIEW_PREFETCH_SUBJECTS = 2
+
+# --- Jurnal Operasi Task ---
+# Jurnal my_tasks.journal dilipat ke my_tasks.json setelah melewati ukuran ini
+TASK_JOURNAL_COMPACT_BYTES = 64 * 1024
+
 # --- Ikon Default ---
 DEFAULT_TOPIC_ICON = "📁"
 DEFAULT_SUBJECT_ICON = "📚"
@@ -67,6 +116,9 @@ UI_SCALE_CONFIG = {
 DEFAULT_SCALE = "Sedang"
 
 # --- Kode Repetisi ---
+# Tangga repetisi bawaan. Tangga global dan per topic bisa diganti lewat
+# Review > Atur Tangga Repetisi dan disimpan di REPETITION_LADDERS_PATH.
+REPETITION_LADDERS_PATH = "data/contents/repetition_ladders.json"
 REPETITION_CODES = ["R0D", "R1D", "R3D", "R7D", "R7D2", "R7D3", "R30D", "Finish"]
 
 REPETITION_CODES_DAYS = {
@@ -79,6 +131,41 @@ REPETITION_CODES_DAYS = {
     "R30D": 30,
 }
 
+# --- Penjadwalan Adaptif (FSRS) ---
+# Bobot hasil penyesuaian disimpan di file ini; tanpa file dipakai SRS_DEFAULT_WEIGHTS
+SRS_PARAMETERS_PATH = "data/contents/srs_parameters.json"
+SRS_DEFAULT_WEIGHTS = [
+    0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+    0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+]
+# Peluang ingat yang dituju saat item jatuh tempo
+SRS_DESIRED_RETENTION = 0.9
+SRS_MAXIMUM_INTERVAL = 36500
+SRS_FIT_ITERATIONS = 40
+SRS_FIT_MIN_REVIEWS = 50
+
+# --- Perkiraan dan Penyeimbangan Beban Review ---
+FORECAST_DAYS = 30
+# Tanggal baru digeser paling jauh round(interval * RATIO) hari, dibatasi MAX_DAYS;
+# interval di bawah MIN_INTERVAL tidak pernah digeser
+LOAD_BALANCE_RATIO = 0.1
+LOAD_BALANCE_MAX_DAYS = 7
+LOAD_BALANCE_MIN_INTERVAL = 3
+
+# --- Log Review ---
+# Setiap perubahan kode repetisi ditambahkan ke log ini (JSON per baris, tidak pernah ditulis ulang)
+REVIEW_LOG_PATH = "data/contents/review_log.jsonl"
+# Agregat harian beserta offset log yang sudah dihitung
+REVIEW_LOG_AGGREGATES_PATH = "data/contents/review_log_stats.json"
+REVIEW_LOG_CHUNK_BYTES = 1024 * 1024
+
+# --- Statistik ---
+# Warna kalender review: hari tanpa review lalu empat tingkat kepadatan
+STATS_HEATMAP_COLORS = ["#ebedf0", "#9be9a8", "#40c463", "#30a14e", "#216e39"]
+STATS_HEATMAP_CELL_SIZE = 13
+# Item yang selesai dalam sekian hari terakhir dihitung di kolom "Selesai Baru-baru Ini"
+STATS_FINISHED_RECENT_DAYS = 30
+
 # --- Memuat Stylesheets dari File Eksternal ---
 DARK_STYLESHEET = load_stylesheet("dark.qss")
 LIGHT_STYLESHEET = load_stylesheet("light.qss")
@@ -0,0 +1,259 @@
+# file: core/adaptive_scheduler.py
+
+import os
+import json
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional; tanpa NumPy penjadwalan tetap jalan, penyesuaian parameter tidak
+    np = None
+
+import config
+
+# Nilai jawaban seperti FSRS: 1 = lupa, 2 = sulit, 3 = baik, 4 = mudah
+GRADE_AGAIN, GRADE_HARD, GRADE_GOOD, GRADE_EASY = 1, 2, 3, 4
+
+# Status memori disimpan di setiap point (atau diskusi tanpa point) di bawah key ini
+SRS_KEY = "srs"
+
+# Kurva lupa FSRS: R(t, S) = (1 + FACTOR * t / S) ^ DECAY, sehingga R(S, S) = 0.9
+DECAY = -0.5
+FACTOR = 19 / 81
+
+MIN_STABILITY = 0.01
+
+# Batas bobot saat penyesuaian (urutan sama dengan config.SRS_DEFAULT_WEIGHTS)
+_WEIGHT_BOUNDS = [
+    (0.01, 100.0), (0.01, 100.0), (0.01, 100.0), (0.01, 100.0),
+    (1.0, 10.0), (0.01, 4.0), (0.01, 4.0), (0.0, 0.75),
+    (0.0, 4.5), (0.0, 0.8), (0.01, 3.5), (0.1, 5.0),
+    (0.01, 0.25), (0.01, 0.9), (0.01, 4.0), (0.0, 1.0), (1.0, 6.0),
+]
+
+def grade_for_code(ladder, old_code, new_code):
+    """
+    Menerjemahkan perubahan kode di tangga repetisi menjadi jawaban review:
+    kembali ke anak tangga pertama = lupa, turun = sulit, tetap atau naik satu = baik,
+    melompat lebih dari satu anak tangga = mudah.
+    """
+    new_rank = ladder.rank(new_code)
+    if new_rank == 0:
+        return GRADE_AGAIN
+    old_rank = ladder.rank(old_code)
+    if old_rank >= ladder.unknown_rank:
+        return GRADE_GOOD
+    if new_rank < old_rank:
+        return GRADE_HARD
+    if new_rank <= old_rank + 1:
+        return GRADE_GOOD
+    return GRADE_EASY
+
+def _next_memory(w, stability, difficulty, elapsed, grade, xp):
+    """
+    Satu langkah model memori FSRS untuk stabilitas, kesulitan, jarak hari sejak
+    review terakhir, dan jawaban. xp adalah modul NumPy; semua argumen boleh array
+    (w[i] juga boleh array untuk banyak set bobot sekaligus saat penyesuaian).
+    """
+    retrievability = (1 + FACTOR * elapsed / stability) ** DECAY
+    new_difficulty = difficulty - w[6] * (grade - 3)
+    # Kembali perlahan ke kesulitan awal jawaban "baik" (w[4])
+    new_difficulty = w[7] * w[4] + (1 - w[7]) * new_difficulty
+    new_difficulty = xp.clip(new_difficulty, 1, 10)
+
+    hard_penalty = xp.where(grade == GRADE_HARD, w[15], 1)
+    easy_bonus = xp.where(grade == GRADE_EASY, w[16], 1)
+    recalled = stability * (1 + xp.exp(w[8]) * (11 - difficulty) * stability ** -w[9]
+                            * (xp.exp(w[10] * (1 - retrievability)) - 1) * hard_penalty * easy_bonus)
+    forgotten = (w[11] * difficulty ** -w[12] * ((stability + 1) ** w[13] - 1)
+                 * xp.exp(w[14] * (1 - retrievability)))
+    new_stability = xp.where(grade > GRADE_AGAIN, recalled, xp.minimum(forgotten, stability))
+    return xp.maximum(new_stability, MIN_STABILITY), new_difficulty, retrievability
+
+class _MathOps:
+    """Pengganti NumPy untuk satu item saat NumPy tidak terpasang."""
+    clip = staticmethod(lambda value, low, high: min(max(value, low), high))
+    where = staticmethod(lambda condition, a, b: a if condition else b)
+    exp = staticmethod(math.exp)
+    minimum = staticmethod(min)
+    maximum = staticmethod(max)
+
+class AdaptiveScheduler:
+    """
+    Penjadwal adaptif bergaya FSRS sebagai alternatif interval tetap tangga repetisi.
+
+    Setiap item menyimpan status memori di record[SRS_KEY]: stabilitas (hari sampai
+    peluang ingat turun ke 90%), kesulitan 1-10, jumlah review dan lupa, serta
+    tanggal review terakhir; riwayat untuk penyesuaian bobot diambil dari log
+    review (lihat ReviewLog). Kode repetisi yang dipilih tetap disimpan untuk tampilan dan urutan,
+    tetapi tanggal berikutnya dihitung dari stabilitas dan target retensi.
+    """
+    def __init__(self, weights=None, desired_retention=None, maximum_interval=None):
+        self.weights = list(weights or config.SRS_DEFAULT_WEIGHTS)
+        self.desired_retention = desired_retention or config.SRS_DESIRED_RETENTION
+        self.maximum_interval = maximum_interval or config.SRS_MAXIMUM_INTERVAL
+        # Pengali interval: I = S * (R^(1/DECAY) - 1) / FACTOR
+        self._interval_factor = (self.desired_retention ** (1 / DECAY) - 1) / FACTOR
+
+    @classmethod
+    def load(cls, path=None):
+        """Memuat bobot hasil penyesuaian dari config.SRS_PARAMETERS_PATH (bawaan jika belum ada)."""
+        path = path or config.SRS_PARAMETERS_PATH
+        weights = None
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    weights = json.load(f).get("weights")
+                if not isinstance(weights, list) or len(weights) != len(config.SRS_DEFAULT_WEIGHTS):
+                    raise ValueError("jumlah bobot tidak sesuai")
+            except (json.JSONDecodeError, IOError, AttributeError, ValueError) as e:
+                print(f"Peringatan: Parameter penjadwal adaptif di '{path}' tidak bisa dibaca, memakai bawaan: {e}")
+                weights = None
+        return cls(weights)
+
+    def save(self, path=None):
+        path = path or config.SRS_PARAMETERS_PATH
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"weights": [round(weight, 4) for weight in self.weights]}, f, indent=4)
+
+    # --- Interval ---
+
+    def next_interval(self, stability):
+        """Jumlah hari sampai peluang ingat turun ke target retensi (1..maximum_interval)."""
+        return min(max(int(round(stability * self._interval_factor)), 1), self.maximum_interval)
+
+    def next_intervals(self, stabilities):
+        """next_interval untuk banyak stabilitas sekaligus (vektor NumPy jika tersedia)."""
+        if np is None:
+            return [self.next_interval(stability) for stability in stabilities]
+        intervals = np.rint(np.asarray(stabilities, dtype=float) * self._interval_factor)
+        return np.clip(intervals, 1, self.maximum_interval).astype(int).tolist()
+
+    # --- Review ---
+
+    def review(self, state, grade, today):
+        """Status memori baru setelah satu review (state None = item belum pernah dijadwalkan adaptif)."""
+        return self.review_batch([state], [grade], today)[0]
+
+    def review_batch(self, states, grades, today):
+        """Status memori baru untuk banyak item sekaligus; perhitungannya satu langkah vektor."""
+        w = self.weights
+        # Tanpa stabilitas (belum pernah, atau diulang setelah batal selesai) = review pertama
+        fresh = [not state or "stability" not in state for state in states]
+        stabilities = [1.0 if is_fresh else state["stability"] for state, is_fresh in zip(states, fresh)]
+        difficulties = [5.0 if is_fresh else state["difficulty"] for state, is_fresh in zip(states, fresh)]
+        elapsed = [0 if is_fresh else max(today - state["last_review"], 0) for state, is_fresh in zip(states, fresh)]
+
+        if np is not None:
+            new_stability, new_difficulty, _ = _next_memory(
+                np.asarray(w), np.asarray(stabilities, dtype=float), np.asarray(difficulties, dtype=float),
+                np.asarray(elapsed, dtype=float), np.asarray(grades), np
+            )
+            new_stability, new_difficulty = new_stability.tolist(), new_difficulty.tolist()
+        else:
+            new_stability, new_difficulty = [], []
+            for values in zip(stabilities, difficulties, elapsed, grades):
+                stability, difficulty, _ = _next_memory(w, *values, _MathOps)
+                new_stability.append(stability)
+                new_difficulty.append(difficulty)
+
+        results = []
+        for index, (state, grade) in enumerate(zip(states, grades)):
+            state = state or {}
+            if fresh[index]:
+                # Review pertama: nilai awal langsung dari bobot jawaban
+                stability = w[grade - 1]
+                difficulty = min(max(w[4] - w[5] * (grade - 3), 1), 10)
+            else:
+                stability, difficulty = new_stability[index], new_difficulty[index]
+            results.append({
+                "stability": round(stability, 4),
+                "difficulty": round(difficulty, 4),
+                "reps": state.get("reps", 0) + 1,
+                "lapses": state.get("lapses", 0) + (1 if grade == GRADE_AGAIN and not fresh[index] else 0),
+                "last_review": today,
+            })
+        return results
+
+    # --- Penyesuaian Bobot ---
+
+    def fit(self, histories, iterations=None, progress=None):
+        """
+        Menyesuaikan bobot dengan riwayat review: list [(ordinal, jawaban), ...] per item.
+        Semua item diputar ulang bersamaan sebagai matriks (item x review) dan semua
+        set bobot yang diuji (satu per bobot untuk gradien beda hingga) dihitung dalam
+        satu array, sehingga satu iterasi hanya beberapa puluh operasi vektor.
+        Mengembalikan (jumlah review yang dipakai, loss awal, loss akhir), atau None
+        jika NumPy tidak tersedia atau riwayatnya terlalu sedikit.
+        """
+        if np is None:
+            return None
+        histories = [history for history in histories if len(history) >= 2]
+        steps = max((len(history) for history in histories), default=0)
+        if not histories:
+            return None
+        ordinals = np.zeros((len(histories), steps))
+        grades = np.full((len(histories), steps), GRADE_GOOD)
+        mask = np.zeros((len(histories), steps), dtype=bool)
+        for row, history in enumerate(histories):
+            ordinals[row, :len(history)] = [ordinal for ordinal, _ in history]
+            grades[row, :len(history)] = [grade for _, grade in history]
+            mask[row, :len(history)] = True
+        elapsed = np.maximum(np.diff(ordinals, axis=1), 0)
+        review_count = int(mask[:, 1:].sum())
+        if review_count < config.SRS_FIT_MIN_REVIEWS:
+            return None
+
+        recalled = grades[:, 1:] > GRADE_AGAIN
+        lower = np.array([low for low, _ in _WEIGHT_BOUNDS])
+        upper = np.array([high for _, high in _WEIGHT_BOUNDS])
+
+        def losses(weight_sets):
+            """Log-loss rata-rata untuk setiap baris weight_sets (bentuk: set x bobot)."""
+            w = weight_sets.T[:, :, None]  # bobot x set x 1, disiarkan ke set x item
+            first = grades[:, 0] - 1
+            stability = w[first, :, 0].T
+            difficulty = np.clip(w[4] - w[5] * (grades[:, 0] - 3), 1, 10)
+            total = np.zeros(weight_sets.shape[0])
+            for step in range(1, steps):
+                active = mask[:, step]
+                new_stability, new_difficulty, retrievability = _next_memory(
+                    w, stability, difficulty, elapsed[:, step - 1], grades[:, step], np
+                )
+                retrievability = np.clip(retrievability, 1e-6, 1 - 1e-6)
+                step_loss = -np.where(recalled[:, step - 1], np.log(retrievability), np.log(1 - retrievability))
+                total += (step_loss * active).sum(axis=1)
+                stability = np.where(active, new_stability, stability)
+                difficulty = np.where(active, new_difficulty, difficulty)
+            return total / review_count
+
+        weights = np.clip(np.asarray(self.weights, dtype=float), lower, upper)
+        count = len(weights)
+        epsilon = 1e-4 * np.maximum(np.abs(weights), 1)
+        first_moment = np.zeros(count)
+        second_moment = np.zeros(count)
+        learning_rate = 0.02
+        initial_loss = best_loss = losses(weights[None, :])[0]
+        best_weights = weights.copy()
+        iterations = iterations or config.SRS_FIT_ITERATIONS
+        for iteration in range(1, iterations + 1):
+            # Baris 0 = bobot sekarang, baris i+1 = bobot i digeser epsilon
+            weight_sets = np.repeat(weights[None, :], count + 1, axis=0)
+            weight_sets[np.arange(1, count + 1), np.arange(count)] += epsilon
+            values = losses(weight_sets)
+            if values[0] < best_loss:
+                best_loss, best_weights = values[0], weights.copy()
+            gradient = (values[1:] - values[0]) / epsilon
+            # Langkah Adam, diskalakan dengan besar masing-masing bobot
+            first_moment = 0.9 * first_moment + 0.1 * gradient
+            second_moment = 0.999 * second_moment + 0.001 * gradient ** 2
+            step = (first_moment / (1 - 0.9 ** iteration)) / (np.sqrt(second_moment / (1 - 0.999 ** iteration)) + 1e-8)
+            weights = np.clip(weights - learning_rate * np.maximum(np.abs(weights), 0.1) * step, lower, upper)
+            if progress is not None and progress(iteration, iterations) is False:
+                break
+        final_loss = losses(weights[None, :])[0]
+        if final_loss < best_loss:
+            best_loss, best_weights = final_loss, weights
+        self.weights = best_weights.tolist()
+        return review_count, float(initial_loss), float(best_loss)
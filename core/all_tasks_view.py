@@ -0,0 +1,126 @@
+# file: core/all_tasks_view.py
+
+import bisect
+import itertools
+from datetime import datetime
+
+SORT_KEYS = ('date', 'count', 'name')
+
+# Task tanpa tanggal / dengan tanggal rusak diletakkan di akhir, sama seperti datetime.max sebelumnya
+_NO_DATE_KEY = (1, 0)
+
+def _date_key(entry):
+    """
+    Kunci tanggal berupa ordinal hasil parsing, dihitung sekali saat entri masuk
+    sehingga pengurutan tidak perlu mem-parsing ulang. Tanggal tanpa nol di depan
+    (mis. "2026-1-5") tetap terurut sesuai tanggalnya, bukan secara leksikal.
+    """
+    date_str = entry.get('date', '')
+    if date_str:
+        try:
+            return (0, datetime.strptime(date_str, "%Y-%m-%d").toordinal())
+        except (ValueError, TypeError):
+            return _NO_DATE_KEY
+    return _NO_DATE_KEY
+
+_KEY_FUNCTIONS = {
+    'date': _date_key,
+    'count': lambda entry: entry.get('count', 0),
+    'name': lambda entry: entry.get('name', '').lower(),
+}
+
+class AllTasksView:
+    """
+    Tampilan gabungan "Semua Task" yang selalu terurut.
+
+    Setiap task disalin sekali menjadi entri dengan nama berawalan kategori.
+    Untuk tiap jenis urutan (tanggal, jumlah, nama) disimpan list (kunci, seq)
+    yang terurut; perubahan satu task hanya menghapus dan menyisipkan entrinya
+    dengan bisect, tanpa membangun dan mengurutkan ulang seluruh daftar.
+    List per urutan dibuat saat pertama kali diminta.
+    """
+    def __init__(self, categories):
+        self._seq = itertools.count()
+        self._entries = {}  # seq -> entri
+        self._records = {}  # (kategori, nama task) -> [seq, ...] sesuai urutan task
+        self._orders = {}   # sort_by -> [(kunci, seq), ...] terurut
+        for category in categories:
+            for task in category.get("tasks", []):
+                self._add(category.get('name'), task)
+
+    # --- Pembacaan ---
+
+    def tasks(self, sort_by='date', sort_order='asc'):
+        """
+        Mengembalikan daftar entri terurut.
+        Entri dipakai bersama dengan view ini, jadi jangan diubah oleh pemanggil.
+        """
+        if sort_by not in _KEY_FUNCTIONS:
+            sort_by = 'name'
+        order = self._orders.get(sort_by)
+        if order is None:
+            key_function = _KEY_FUNCTIONS[sort_by]
+            order = sorted((key_function(entry), seq) for seq, entry in self._entries.items())
+            self._orders[sort_by] = order
+        entries = self._entries
+        if sort_order == 'desc':
+            return [entries[seq] for _, seq in reversed(order)]
+        return [entries[seq] for _, seq in order]
+
+    def __len__(self):
+        return len(self._entries)
+
+    # --- Pembaruan Inkremental ---
+
+    def _add(self, category_name, task):
+        entry = task.copy()
+        entry['name'] = f"[{category_name}] {task.get('name')}"
+        entry['original_name'] = task.get('name')
+        entry['category'] = category_name
+        seq = next(self._seq)
+        self._entries[seq] = entry
+        self._records.setdefault((category_name, task.get('name')), []).append(seq)
+        for sort_by, order in self._orders.items():
+            bisect.insort(order, (_KEY_FUNCTIONS[sort_by](entry), seq))
+
+    def _remove_seq(self, seq):
+        entry = self._entries.pop(seq)
+        for sort_by, order in self._orders.items():
+            item = (_KEY_FUNCTIONS[sort_by](entry), seq)
+            index = bisect.bisect_left(order, item)
+            if index < len(order) and order[index] == item:
+                del order[index]
+
+    def _remove_record(self, category_name, task_name, first_only=False):
+        records = self._records.get((category_name, task_name))
+        if not records:
+            return
+        removed = records[:1] if first_only else records[:]
+        for seq in removed:
+            self._remove_seq(seq)
+        del records[:len(removed)]
+        if not records:
+            del self._records[(category_name, task_name)]
+
+    def task_saved(self, category_name, old_task_name, task, replaced):
+        """Task baru ditambahkan, atau task lama (yang pertama dengan nama itu) diganti."""
+        if replaced:
+            self._remove_record(category_name, old_task_name, first_only=True)
+        self._add(category_name, task)
+
+    def task_deleted(self, category_name, task_name):
+        self._remove_record(category_name, task_name)
+
+    def task_checked(self, category_name, task_name, checked):
+        # Status checklist bukan kunci urutan, cukup perbarui entrinya
+        for seq in self._records.get((category_name, task_name), [])[:1]:
+            self._entries[seq]['checked'] = checked
+
+    def category_renamed(self, old_name, new_name, tasks):
+        self.category_deleted(old_name)
+        for task in tasks:
+            self._add(new_name, task)
+
+    def category_deleted(self, category_name):
+        for key in [key for key in self._records if key[0] == category_name]:
+            self._remove_record(*key)
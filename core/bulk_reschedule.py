@@ -0,0 +1,146 @@
+# file: core/bulk_reschedule.py
+
+import os
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional; tanpa NumPy dipakai perhitungan Python biasa
+    np = None
+
+from core import content_ids
+from core.content_records import today_ordinal
+from core.scheduling import FINISH_CODE, apply_repetition_code
+from core.adaptive_scheduler import SRS_KEY
+
+# Ordinal 1970-01-01, titik nol datetime64
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Tanggal terjauh yang dianggap "semua yang terjadwal"
+_MAX_ORDINAL = date.max.toordinal()
+
+# Pilihan item untuk query (nama -> (since, until) relatif terhadap hari ini)
+DUE_FILTERS = {
+    "overdue": (None, -1),
+    "today": (0, 0),
+    "due": (None, 0),
+    "scheduled": (None, None),
+}
+
+def select_items(data_manager, due_filter="overdue", path_prefix=None, item_type=None, item_ids=None):
+    """
+    Memilih item terjadwal dari indeks jatuh tempo, mis. "semua point terlambat di
+    topic ini". path_prefix membatasi ke topic/subject; item_ids ({path: set(ID)})
+    membatasi ke item yang dipilih. Mengembalikan list (path, ID, kode sekarang).
+    """
+    today = today_ordinal()
+    since, until = DUE_FILTERS[due_filter]
+    since = None if since is None else today + since
+    until = _MAX_ORDINAL if until is None else today + until
+    prefix = os.path.normpath(path_prefix) if path_prefix else None
+
+    selected = []
+    for _, path, item_id, code, _, row_type in data_manager.due_index.due_items(until, since):
+        if item_type and row_type != item_type:
+            continue
+        if prefix and not (os.path.normpath(path) == prefix or os.path.normpath(path).startswith(prefix + os.sep)):
+            continue
+        if item_ids is not None and item_id not in item_ids.get(path, ()):
+            continue
+        selected.append((path, item_id, code))
+    return selected
+
+def compute_new_dates(days, today=None):
+    """
+    Ordinal tanggal baru untuk setiap interval (hari ini + jumlah hari dari tangga
+    repetisi item). Dengan NumPy dihitung sekaligus memakai aritmetika datetime64.
+    """
+    if today is None:
+        today = today_ordinal()
+    if np is None:
+        return [today + offset for offset in days]
+    base = np.datetime64(date.fromordinal(today).isoformat(), "D")
+    new_dates = base + np.array(days, dtype="timedelta64[D]")
+    return (new_dates.astype(np.int64) + _EPOCH_ORDINAL).tolist()
+
+class BulkRescheduler:
+    """
+    Menjadwalkan ulang banyak item sekaligus. Tanggal baru dihitung untuk semua
+    item dalam satu langkah, lalu setiap subject yang terdampak diubah di memori
+    dan disimpan tepat satu kali.
+    """
+    def __init__(self, data_manager, items, new_code=None):
+        """items: list (path, ID, kode sekarang); new_code None = pertahankan kode masing-masing."""
+        self.data_manager = data_manager
+        self.new_code = new_code
+        self.today = today_ordinal()
+        # Tanggal baru untuk seluruh batch dihitung sekaligus, lalu dikelompokkan per subject
+        codes = [new_code or code for _, _, code in items]
+        ladders = {path: data_manager.ladder_for(path) for path, _, _ in items}
+        days = [ladders[path].interval(code) for (path, _, _), code in zip(items, codes)]
+        new_dates = compute_new_dates(days, self.today)
+        self.by_subject = {}
+        for (path, item_id, _), code, new_date in zip(items, codes, new_dates):
+            self.by_subject.setdefault(path, []).append((item_id, code, new_date))
+        self.item_count = len(items)
+        # Satu balancer untuk seluruh batch, jadi item batch ini ikut dihitung sebagai beban
+        self.balancer = data_manager.load_balancer()
+        self.changed = 0
+        self.saved_paths = []
+
+    def run(self, progress=None):
+        """
+        Menerapkan jadwal baru per subject. progress(item selesai, total) dipanggil
+        setelah setiap subject dan boleh mengembalikan False untuk membatalkan;
+        subject yang sudah disimpan tetap tersimpan.
+        Mengembalikan True jika semua subject selesai diproses.
+        """
+        done = 0
+        for path, entries in self.by_subject.items():
+            self._apply_subject(path, entries)
+            done += len(entries)
+            if progress is not None and progress(done, self.item_count) is False:
+                return False
+        return True
+
+    def _apply_subject(self, path, entries):
+        content = self.data_manager.load_content(path)
+        locations = content_ids.build_location_map(content)
+        summary = self.data_manager.due_summary(path, content)
+        resolved = []
+        for item_id, code, new_date in entries:
+            location = locations.get(item_id)
+            record = content_ids.item_at(content, location) if location else None
+            if record is not None:
+                resolved.append((record, code, new_date))
+
+        # Penjadwalan adaptif: item yang sudah punya stabilitas dijadwalkan dari
+        # stabilitasnya (tanpa dicatat sebagai review), dihitung sekaligus per subject
+        scheduler = self.data_manager.adaptive_scheduler
+        if scheduler is not None:
+            adaptive = [index for index, (record, code, _) in enumerate(resolved)
+                        if code != FINISH_CODE and "stability" in (record.get(SRS_KEY) or {})]
+            intervals = scheduler.next_intervals([resolved[index][0][SRS_KEY]["stability"] for index in adaptive])
+            for index, interval in zip(adaptive, intervals):
+                record, code, _ = resolved[index]
+                resolved[index] = (record, code, self.today + interval)
+
+        changed = 0
+        logged = []
+        for record, code, new_date in resolved:
+            logged.append((record, record.get("repetition_code")))
+            if code == FINISH_CODE:
+                apply_repetition_code(record, code, self.today)
+            else:
+                if self.balancer is not None:
+                    new_date = self.balancer.choose(new_date)
+                record["repetition_code"] = code
+                record.date = new_date
+            summary.update(record)
+            changed += 1
+        if not changed:
+            return
+        self.data_manager.update_due_metadata(path, content)
+        self.data_manager.save_content(path, content)
+        self.data_manager.log_reviews(path, logged, self.today, reviewed=False)
+        self.changed += changed
+        self.saved_paths.append(path)
@@ -0,0 +1,77 @@
+# file: core/content_cache.py
+
+from collections import OrderedDict
+
+class ContentCache:
+    """
+    Cache LRU untuk konten subject yang sudah di-parse.
+
+    Setiap entri disimpan bersama versi file dari backend, misalnya (mtime_ns, size).
+    Entri hanya dipakai jika versinya masih sama, sehingga perubahan dari luar aplikasi
+    tetap terbaca. Cache dibatasi oleh jumlah entri dan perkiraan ukuran byte.
+    """
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # path -> (version, data, size)
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path, version):
+        """Mengembalikan data dari cache atau None jika tidak ada / sudah basi."""
+        entry = self._entries.get(path)
+        if entry is None or version is None or entry[0] != version:
+            self.misses += 1
+            if entry is not None:
+                self.invalidate(path)
+            return None
+        self._entries.move_to_end(path)
+        self.hits += 1
+        return entry[1]
+
+    def peek(self, path, version):
+        """Seperti get, tetapi tanpa mengubah urutan LRU maupun statistik hit/miss."""
+        entry = self._entries.get(path)
+        if entry is None or version is None or entry[0] != version:
+            return None
+        return entry[1]
+
+    def put(self, path, version, data, size):
+        """Menyimpan data ke cache lalu membuang entri terlama jika melebihi batas."""
+        self.invalidate(path)
+        if version is None:
+            return
+        self._entries[path] = (version, data, size)
+        self.total_bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, (_, _, old_size) = self._entries.popitem(last=False)
+            self.total_bytes -= old_size
+            self.evictions += 1
+
+    def invalidate(self, path):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def invalidate_prefix(self, prefix):
+        """Membuang semua entri di bawah sebuah folder (misal saat topic diganti nama)."""
+        for path in [p for p in self._entries if p == prefix or p.startswith(prefix + "/") or p.startswith(prefix + "\\")]:
+            self.invalidate(path)
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        """Ringkasan statistik cache untuk ditampilkan di dialog diagnostik."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
@@ -0,0 +1,76 @@
+# file: core/content_ids.py
+
+from core.search_index import DISCUSSION_LOCATION
+
+# Setiap diskusi dan point membawa ID bilangan bulat yang unik di dalam subject-nya
+ID_KEY = "id"
+# Disimpan di metadata agar ID item yang sudah dihapus tidak dipakai ulang
+NEXT_ID_KEY = "next_id"
+
+def assign_ids(data):
+    """
+    Memberi ID pada diskusi dan point yang belum punya (atau ID-nya kembar,
+    mis. hasil salin dari luar aplikasi). ID diberikan berurutan sesuai dokumen,
+    jadi file lama mendapat ID yang sama setiap kali dimuat sampai disimpan.
+    Mengembalikan True jika ada ID yang ditambahkan.
+    """
+    items = []
+    for discussion in data.get("content", []):
+        items.append(discussion)
+        items.extend(discussion.get("points") or [])
+
+    metadata = data.setdefault("metadata", {})
+    next_id = metadata.get(NEXT_ID_KEY) or 0
+    for item in items:
+        if isinstance(item.get(ID_KEY), int):
+            next_id = max(next_id, item[ID_KEY] + 1)
+
+    seen = set()
+    changed = False
+    for item in items:
+        item_id = item.get(ID_KEY)
+        if not isinstance(item_id, int) or item_id in seen:
+            item[ID_KEY] = item_id = next_id
+            next_id += 1
+            changed = True
+        seen.add(item_id)
+
+    if metadata.get(NEXT_ID_KEY) != next_id:
+        metadata[NEXT_ID_KEY] = next_id
+        changed = True
+    return changed
+
+def new_id(data):
+    """Mengambil ID berikutnya untuk item baru (tanpa memindai isi subject)."""
+    metadata = data.setdefault("metadata", {})
+    item_id = metadata.get(NEXT_ID_KEY) or 0
+    metadata[NEXT_ID_KEY] = item_id + 1
+    return item_id
+
+def build_location_map(data):
+    """{ID: (indeks diskusi, indeks point)}; diskusi memakai indeks point DISCUSSION_LOCATION."""
+    locations = {}
+    for disc_index, discussion in enumerate(data.get("content", [])):
+        locations[discussion.get(ID_KEY)] = (disc_index, DISCUSSION_LOCATION)
+        for point_index, point in enumerate(discussion.get("points") or []):
+            locations[point.get(ID_KEY)] = (disc_index, point_index)
+    return locations
+
+def item_at(data, location):
+    """Diskusi atau point pada lokasi tersebut, atau None jika lokasinya tidak valid."""
+    disc_index, point_index = location
+    try:
+        discussion = data.get("content", [])[disc_index]
+        if point_index == DISCUSSION_LOCATION:
+            return discussion
+        return discussion["points"][point_index]
+    except (IndexError, KeyError, TypeError):
+        return None
+
+def item_data_for_location(data, location):
+    """item_data content pane ({"type", "id"}) untuk sebuah lokasi, mis. dari hasil pencarian."""
+    item = item_at(data, location)
+    if item is None:
+        return None
+    item_type = "discussion" if location[1] == DISCUSSION_LOCATION else "point"
+    return {"type": item_type, "id": item.get(ID_KEY)}
@@ -0,0 +1,239 @@
+# file: core/content_records.py
+
+import sys
+from datetime import date, datetime
+
+import config
+
+# Penanda field yang tidak ada di JSON asli (beda dengan field bernilai null)
+_MISSING = object()
+
+# Tanggal disimpan sebagai ordinal (date.toordinal()). Jumlah tanggal yang berbeda
+# kecil, jadi hasil konversi dua arah disimpan agar setiap string cukup diurai sekali.
+# _TEXT_BY_ORDINAL hanya berisi bentuk kanonis (date.isoformat()), bukan teks masukan,
+# sehingga ejaan lain di satu file tidak ikut tertulis ke file lain.
+_ORDINAL_BY_TEXT = {}
+_TEXT_BY_ORDINAL = {}
+
+# Kode repetisi yang dikenal berbagi satu objek string, sehingga field kode
+# hanya berisi referensi ke tabel kecil ini (setara enum)
+_CODES = {code: sys.intern(code) for code in config.REPETITION_CODES}
+
+def date_to_ordinal(date_str):
+    """
+    "YYYY-MM-DD" -> ordinal. None/kosong menjadi None; string yang tidak valid
+    dikembalikan apa adanya agar tidak hilang saat disimpan kembali.
+    """
+    if not date_str:
+        return None
+    ordinal = _ORDINAL_BY_TEXT.get(date_str)
+    if ordinal is None:
+        try:
+            ordinal = date.fromisoformat(date_str).toordinal()
+        except (ValueError, TypeError):
+            # fromisoformat menolak tanggal tanpa nol di depan (mis. "2026-1-5")
+            try:
+                ordinal = datetime.strptime(date_str, "%Y-%m-%d").toordinal()
+            except (ValueError, TypeError):
+                return date_str
+        _ORDINAL_BY_TEXT[date_str] = ordinal
+    return ordinal
+
+def ordinal_to_date(ordinal):
+    """Kebalikan date_to_ordinal; string tidak valid dan None dilewatkan apa adanya."""
+    if not isinstance(ordinal, int):
+        return ordinal
+    text = _TEXT_BY_ORDINAL.get(ordinal)
+    if text is None:
+        text = date.fromordinal(ordinal).isoformat()
+        _TEXT_BY_ORDINAL[ordinal] = text
+        _ORDINAL_BY_TEXT[text] = ordinal
+    return text
+
+def today_ordinal():
+    return date.today().toordinal()
+
+def valid_ordinal(value):
+    """Ordinal tanggal, atau None jika field kosong atau tanggalnya tidak valid."""
+    return value if isinstance(value, int) else None
+
+def _intern_code(code):
+    if isinstance(code, str):
+        return _CODES.get(code) or sys.intern(code)
+    return code
+
+class _Record:
+    """
+    Dasar Discussion dan Point. Field disimpan di __slots__ dengan tanggal sebagai
+    ordinal; tetap bisa dibaca dan diubah seperti dict JSON lama (item["date"],
+    item.get("points"), "finished" in item, ...) sehingga handler tidak berubah.
+    Key yang tidak dikenal disimpan di extra dan ditulis kembali apa adanya.
+    """
+    __slots__ = ("id", "text", "date", "repetition_code", "finished", "finished_date", "extra")
+    # (key JSON, nama slot), sesuai urutan field di file JSON
+    FIELDS = ()
+    _SLOTS = {}
+
+    def __init__(self, text=_MISSING, date=_MISSING, repetition_code=_MISSING, item_id=_MISSING):
+        self.id = item_id
+        self.text = text
+        self.date = date_to_ordinal(date) if date is not _MISSING else _MISSING
+        self.repetition_code = _intern_code(repetition_code)
+        self.finished = _MISSING
+        self.finished_date = _MISSING
+        self.extra = None
+
+    @classmethod
+    def from_json(cls, data):
+        record = cls.__new__(cls)
+        for slot in cls.__slots__ + _Record.__slots__:
+            setattr(record, slot, _MISSING)
+        record.extra = None
+        for key, value in data.items():
+            record[key] = value
+        return record
+
+    def to_json(self):
+        data = {}
+        for key, slot in self.FIELDS:
+            value = getattr(self, slot)
+            if value is _MISSING:
+                continue
+            if slot == "date":
+                value = ordinal_to_date(value)
+            elif slot == "points":
+                value = [point.to_json() if isinstance(point, _Record) else dict(point) for point in value]
+            data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    # --- Antarmuka seperti dict ---
+
+    def _slot(self, key):
+        return self._SLOTS.get(key)
+
+    def __getitem__(self, key):
+        slot = self._slot(key)
+        if slot is None:
+            if self.extra and key in self.extra:
+                return self.extra[key]
+            raise KeyError(key)
+        value = getattr(self, slot)
+        if value is _MISSING:
+            raise KeyError(key)
+        return ordinal_to_date(value) if slot == "date" else value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        slot = self._slot(key)
+        if slot is None:
+            return bool(self.extra) and key in self.extra
+        return getattr(self, slot) is not _MISSING
+
+    def __setitem__(self, key, value):
+        slot = self._slot(key)
+        if slot is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        elif slot == "date":
+            self.date = date_to_ordinal(value)
+        elif slot == "repetition_code":
+            self.repetition_code = _intern_code(value)
+        elif slot == "points":
+            self.points = value if value is None else [
+                point if isinstance(point, Point) else Point.from_json(point) for point in value
+            ]
+        else:
+            setattr(self, slot, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        slot = self._slot(key)
+        if slot is None:
+            del self.extra[key]
+        else:
+            setattr(self, slot, _MISSING)
+
+    def keys(self):
+        keys = [key for key, slot in self.FIELDS if getattr(self, slot) is not _MISSING]
+        return keys + list(self.extra or ())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+class Point(_Record):
+    """Satu point di dalam diskusi."""
+    __slots__ = ()
+    FIELDS = (("point_text", "text"), ("repetition_code", "repetition_code"), ("date", "date"),
+              ("finished", "finished"), ("finished_date", "finished_date"), ("id", "id"))
+
+class Discussion(_Record):
+    """Satu diskusi; points bernilai _MISSING jika key "points" tidak ada di JSON."""
+    __slots__ = ("points",)
+    FIELDS = (("discussion", "text"), ("date", "date"), ("repetition_code", "repetition_code"),
+              ("finished", "finished"), ("finished_date", "finished_date"), ("points", "points"), ("id", "id"))
+
+    def __init__(self, text=_MISSING, date=_MISSING, repetition_code=_MISSING, item_id=_MISSING, points=_MISSING):
+        super().__init__(text, date, repetition_code, item_id)
+        self.points = points
+
+    def point_list(self):
+        """Daftar point (kosong jika diskusi tidak punya key points)."""
+        return self.points if self.points is not _MISSING and self.points else []
+
+Point._SLOTS = dict(Point.FIELDS)
+Discussion._SLOTS = dict(Discussion.FIELDS)
+
+def from_json(data):
+    """
+    Mengubah data subject dari JSON menjadi Discussion/Point. Metadata dan key
+    lain di level subject tetap berupa dict.
+    """
+    records = dict(data)
+    records["content"] = [Discussion.from_json(discussion) for discussion in data.get("content", [])]
+    return records
+
+def ensure_records(data):
+    """
+    Mengubah diskusi/point yang masih berupa dict (mis. baru ditambahkan) menjadi
+    record. Mengembalikan True jika ada yang diubah.
+    """
+    converted = False
+    for index, discussion in enumerate(data.get("content") or []):
+        if not isinstance(discussion, Discussion):
+            data["content"][index] = Discussion.from_json(discussion)
+            converted = True
+        else:
+            points = discussion.point_list()
+            for point_index, point in enumerate(points):
+                if not isinstance(point, Point):
+                    points[point_index] = Point.from_json(point)
+                    converted = True
+    return converted
+
+def to_json(data):
+    """Kebalikan from_json; dipanggil saat menyimpan. Dict biasa juga diterima."""
+    result = dict(data)
+    result["content"] = [
+        discussion.to_json() if isinstance(discussion, _Record) else discussion
+        for discussion in data.get("content", [])
+    ]
+    if isinstance(result.get("metadata"), dict):
+        result["metadata"] = dict(result["metadata"])
+    return result
@@ -4,9 +4,22 @@ import os
 import json
 import shutil
 import zipfile
+from collections import OrderedDict
 from datetime import datetime
 
 import config
+from core.storage import create_storage
+from core.storage.task_operations import make_operation
+from core.content_cache import ContentCache
+from core import content_ids, content_records
+from core.task_model import TaskModel
+from core.due_summary import DueSummary
+from core.search_index import SearchIndex
+from core.due_index import DueIndex
+from core.repetition_ladders import RepetitionLadders, FINISH_CODE
+from core.workload import LoadBalancer
+from core.review_log import ReviewLog, make_entry
+from core.adaptive_scheduler import grade_for_code
 
 # Fungsi bantuan untuk pengurutan tanggal
 def _get_sort_key_for_date(item):
@@ -24,13 +37,33 @@ def _get_sort_key_for_date(item):
 
 class DataManager:
     """Kelas untuk mengelola semua operasi file dan data."""
-    def __init__(self, base_path):
+    def __init__(self, base_path, storage=None):
         self.base_path = base_path
         # Path untuk file data task tunggal
         self.task_data_file = config.TASK_BASE_PATH
         
         # Pastikan direktori utama ada
         self.ensure_directory_exists(os.path.dirname(self.base_path))
+        # Backend penyimpanan (JSON per file atau SQLite), dipilih lewat config.STORAGE_BACKEND
+        self.storage = storage or create_storage(self.base_path, self.task_data_file)
+        # Cache konten subject yang sudah di-parse, divalidasi dengan (mtime_ns, size)
+        self.content_cache = ContentCache(config.CONTENT_CACHE_MAX_ENTRIES, config.CONTENT_CACHE_MAX_BYTES)
+        # Model task resident untuk backend yang tidak memegangnya sendiri
+        self._task_model = None
+        # Ringkasan jatuh tempo per subject, LRU seperti cache konten (lihat due_summary())
+        self._due_summaries = OrderedDict()
+        # Indeks jatuh tempo di semua topic; diisi bersama indeks pencarian
+        self.due_index = DueIndex()
+        # Indeks pencarian diskusi/point di semua topic, diisi di latar belakang
+        self.search_index = SearchIndex(companions=[self.due_index], persist_path=config.SEARCH_INDEX_PATH)
+        # Tangga repetisi global dan per topic (sudah dikompilasi menjadi tabel peringkat/interval)
+        self.repetition_ladders = RepetitionLadders(config.REPETITION_LADDERS_PATH)
+        # AdaptiveScheduler jika penjadwalan adaptif aktif, None = interval tetap tangga repetisi
+        self.adaptive_scheduler = None
+        # Jika True, tanggal jatuh tempo baru digeser ke hari yang lebih sepi (lihat load_balancer())
+        self.load_balancing = False
+        # Log append-only untuk setiap perubahan kode repetisi
+        self.review_log = ReviewLog(config.REVIEW_LOG_PATH, config.REVIEW_LOG_AGGREGATES_PATH)
         # Pastikan file task ada, jika tidak buat file kosong
         self.ensure_task_file_exists()
 
@@ -40,7 +73,7 @@ class DataManager:
 
     def ensure_task_file_exists(self):
         """Memastikan file task JSON ada. Jika tidak, buat struktur default."""
-        if not os.path.exists(self.task_data_file):
+        if not self.storage.tasks_exist():
             self.ensure_directory_exists(os.path.dirname(self.task_data_file))
             # Menggunakan list untuk 'categories' agar urutan terjaga
             self.save_tasks_data({"categories": []})
@@ -49,35 +82,11 @@ class DataManager:
 
     def get_topics(self):
         """Mendapatkan daftar semua topic beserta ikonnya."""
-        if not os.path.exists(self.base_path):
-            return []
-        topics_data = []
-        for d in sorted([d for d in os.listdir(self.base_path) if os.path.isdir(os.path.join(self.base_path, d))]):
-            config_path = os.path.join(self.base_path, d, 'topic_config.json')
-            icon = config.DEFAULT_TOPIC_ICON
-            if os.path.exists(config_path):
-                try:
-                    with open(config_path, 'r') as f:
-                        topic_config = json.load(f)
-                        icon = topic_config.get('icon', config.DEFAULT_TOPIC_ICON)
-                except (json.JSONDecodeError, IOError):
-                    pass 
-            topics_data.append({'name': d, 'icon': icon})
-        return topics_data
+        return self.storage.get_topics()
 
     def get_subjects(self, topic_path):
         """Mendapatkan daftar semua subject dalam sebuah topic, diurutkan berdasarkan tanggal terlama."""
-        if not topic_path or not os.path.exists(topic_path):
-            return []
-        subjects = []
-        for f in os.listdir(topic_path):
-            if f.endswith('.json') and f != 'topic_config.json':
-                content = self.load_content(os.path.join(topic_path, f))
-                metadata = content.get('metadata', {})
-                date = metadata.get('earliest_date')
-                code = metadata.get('earliest_code')
-                icon = metadata.get('icon', config.DEFAULT_SUBJECT_ICON)
-                subjects.append({'name': f.replace('.json', ''), 'date': date, 'code': code, 'icon': icon})
+        subjects = self.storage.get_subjects(topic_path)
         
         # Mengurutkan subject berdasarkan tanggal (yang terlama lebih dulu)
         subjects.sort(key=_get_sort_key_for_date)
@@ -85,52 +94,236 @@ class DataManager:
         # Mengubah format kembali ke tuple untuk kompatibilitas
         return [(s['name'], s['date'], s['code'], s['icon']) for s in subjects]
 
+    def content_exists(self, file_path):
+        """Mengecek apakah subject pada path tersebut sudah ada."""
+        return self.storage.content_exists(file_path)
 
     def load_content(self, file_path):
-        """Memuat konten dari file JSON generik."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            if file_path != self.task_data_file:
-                return {"content": [], "metadata": {}}
-            return {"categories": []} # Mengembalikan list kosong
+        """
+        Memuat konten dari file JSON generik.
+        Konten subject dilayani dari cache selama file-nya tidak berubah; objek
+        yang dikembalikan dipakai bersama, jadi simpan kembali lewat save_content.
+        """
+        if file_path == self.task_data_file:
+            data = self.storage.load_tasks()
+            return data if data is not None else {"categories": []} # Mengembalikan list kosong
+
+        # Signature diambil sebelum membaca agar perubahan di tengah pembacaan tetap terdeteksi
+        signature = self.storage.signature(file_path)
+        version = signature[0] if signature else None
+        data = self.content_cache.get(file_path, version)
+        if data is not None:
+            return data
+        version, size, data = self.read_content(file_path)
+        if data is None:
+            return {"content": [], "metadata": {}}
+        self.content_cache.put(file_path, version, data, size)
+        return data
+
+    def read_content(self, file_path):
+        """
+        Membaca dan mengurai subject tanpa menyentuh cache; aman dipanggil dari
+        thread pekerja (lihat ReviewSession). Mengembalikan (versi, ukuran, data).
+        """
+        signature = self.storage.signature(file_path)
+        version, size = signature if signature else (None, 0)
+        data = self.storage.load_content(file_path)
+        if data is None:
+            return version, size, None
+        # File lama mendapat ID di sini; ID baru ikut tersimpan pada save berikutnya
+        content_ids.assign_ids(data)
+        # Di memori subject disimpan sebagai record ringkas; JSON hanya dibuat lagi saat menyimpan
+        return version, size, content_records.from_json(data)
+
+    def prime_content(self, file_path, version, data, size):
+        """
+        Memasukkan hasil read_content dari thread lain ke cache, kecuali cache sudah
+        punya versi itu (objek yang mungkin sedang diedit tidak boleh diganti).
+        """
+        signature = self.storage.signature(file_path)
+        if data is None or signature is None or signature[0] != version:
+            return
+        if self.content_cache.peek(file_path, version) is None:
+            self.content_cache.put(file_path, version, data, size)
 
     def save_content(self, file_path, data):
         """Menyimpan data ke file JSON generik."""
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        if file_path == self.task_data_file:
+            self.storage.save_tasks(data)
+            self._task_model = None
+            return
+        # Diskusi/point yang baru ditambahkan belum punya ID (dan mungkin masih berupa dict)
+        content_records.ensure_records(data)
+        content_ids.assign_ids(data)
+        try:
+            self.storage.save_content(file_path, content_records.to_json(data))
+        except Exception:
+            self.content_cache.invalidate(file_path)
+            raise
+        signature = self.storage.signature(file_path)
+        version, size = signature if signature else (None, 0)
+        self.content_cache.put(file_path, version, data, size)
+        self.search_index.update_subject(file_path, data, version)
+        self.due_index.update_subject(file_path, data, version)
+
+    def due_summary(self, file_path, content, rebuild=False):
+        """
+        Ringkasan jatuh tempo (DueSummary) untuk konten sebuah subject.
+        Dibangun sekali dengan memindai subject, lalu diperbarui per item oleh handler.
+        Ringkasan disimpan per subject sehingga berpindah subject tidak memicu pemindaian
+        ulang; hanya dibangun ulang jika kontennya dimuat ulang dari disk.
+        """
+        summary = self._due_summaries.get(file_path)
+        if rebuild or summary is None or summary.content is not content:
+            summary = self._due_summaries[file_path] = DueSummary(file_path, content)
+        self._due_summaries.move_to_end(file_path)
+        while len(self._due_summaries) > config.DUE_SUMMARY_CACHE_MAX_ENTRIES:
+            self._due_summaries.popitem(last=False)
+        return summary
+
+    def update_due_metadata(self, file_path, content, rebuild=False):
+        """
+        Menyimpan tanggal dan kode repetisi paling awal ke metadata subject,
+        diambil dari ringkasan jatuh tempo (bukan memindai semua item).
+        """
+        summary = self.due_summary(file_path, content, rebuild)
+        if config.VERIFY_DUE_SUMMARY and not summary.verify():
+            print("Peringatan: Ringkasan jatuh tempo tidak sesuai dengan isi subject, dibangun ulang.")
+            summary = self.due_summary(file_path, content, rebuild=True)
+        earliest_date, earliest_code = summary.earliest()
+
+        if content.get("metadata") is None:
+            content["metadata"] = {}
+        if earliest_date:
+            content["metadata"]["earliest_date"] = content_records.ordinal_to_date(earliest_date)
+            content["metadata"]["earliest_code"] = earliest_code
+        else:
+            content["metadata"]["earliest_date"] = None
+            content["metadata"]["earliest_code"] = None
 
     def save_topic_config(self, topic_name, data):
         """Menyimpan konfigurasi (seperti ikon) untuk sebuah topic."""
-        config_path = os.path.join(self.base_path, topic_name, 'topic_config.json')
-        self.save_content(config_path, data)
+        self.storage.save_topic_config(topic_name, data)
+
+    def ladder_for(self, subject_path):
+        """Tangga repetisi yang berlaku untuk sebuah subject (tangga topic-nya atau tangga global)."""
+        return self.repetition_ladders.ladder_for_subject(subject_path)
+
+    def _is_topic_path(self, path):
+        return os.path.dirname(os.path.normpath(path)) == os.path.normpath(self.base_path)
 
     def create_directory(self, path):
-        os.makedirs(path, exist_ok=True)
+        self.storage.create_directory(path)
 
     def rename_path(self, old_path, new_path):
-        os.rename(old_path, new_path)
+        self.storage.rename_path(old_path, new_path)
+        self.content_cache.invalidate_prefix(old_path)
+        self.search_index.rename_prefix(old_path, new_path)
+        self.due_index.rename_prefix(old_path, new_path)
+        self.review_log.record_rename(old_path, new_path, self._is_topic_path(old_path))
+        if self._is_topic_path(old_path):
+            self.repetition_ladders.rename_topic(os.path.basename(old_path), os.path.basename(new_path))
 
     def delete_directory(self, path):
-        shutil.rmtree(path)
+        self.storage.delete_directory(path)
+        self.content_cache.invalidate_prefix(path)
+        self.search_index.remove_prefix(path)
+        self.due_index.remove_prefix(path)
+        if self._is_topic_path(path):
+            self.repetition_ladders.remove_topic(os.path.basename(path))
 
     def delete_file(self, path):
-        os.remove(path)
+        self.storage.delete_file(path)
+        self.content_cache.invalidate(path)
+        self.search_index.remove_subject(path)
+        self.due_index.remove_subject(path)
+
+    # --- Pencarian ---
+
+    def refresh_search_index(self):
+        """
+        Memperbarui indeks pencarian dan indeks jatuh tempo di latar belakang;
+        hanya subject yang berubah dibaca ulang.
+        """
+        self.search_index.start_background_refresh(self.storage)
+
+    def ensure_subject_indexed(self, file_path):
+        """Mengindeks ulang subject jika versinya di indeks sudah tertinggal."""
+        signature = self.storage.signature(file_path)
+        version = signature[0] if signature else None
+        if not self.search_index.is_current(file_path, version):
+            self.search_index.update_subject(file_path, self.load_content(file_path), version)
+
+    def search_subject(self, file_path, query, fuzzy=False):
+        """
+        Lokasi (indeks diskusi, indeks point) di satu subject yang memuat query.
+        Pada mode fuzzy hasilnya {lokasi: skor kemiripan}.
+        """
+        self.ensure_subject_indexed(file_path)
+        if fuzzy:
+            return self.search_index.fuzzy_locations(file_path, query)
+        return self.search_index.locations(file_path, query)
+
+    def search_all(self, query):
+        """Mencari query di semua topic tanpa membuka file subject. Mengembalikan {path: {lokasi: teks}}."""
+        return self.search_index.search(query)
+
+    def fuzzy_search_all(self, query):
+        """Pencarian fuzzy di semua topic. Mengembalikan list (skor, path, lokasi, teks), paling mirip dulu."""
+        return self.search_index.fuzzy_search(query, limit=config.FUZZY_SEARCH_MAX_RESULTS)
+
+    # --- Jatuh Tempo ---
+
+    def log_reviews(self, file_path, changes, today=None, reviewed=True):
+        """
+        Mencatat perubahan kode ke log review. changes: list (record, kode lama)
+        yang kode dan tanggalnya sudah diperbarui. reviewed=False untuk perubahan
+        yang bukan hasil review (mis. penjadwalan ulang massal): tercatat tanpa jawaban.
+        """
+        if today is None:
+            today = content_records.today_ordinal()
+        ladder = self.ladder_for(file_path)
+        entries = []
+        for record, old_code in changes:
+            new_code = record.get("repetition_code")
+            interval = record.date - today if isinstance(record.date, int) else None
+            grade = None
+            # Selesai dan batal selesai bukan jawaban review
+            if reviewed and not record.get("finished") and old_code != FINISH_CODE:
+                grade = grade_for_code(ladder, old_code, new_code)
+            entries.append(make_entry(file_path, record.get(content_ids.ID_KEY), old_code, new_code, interval, grade))
+        self.review_log.append(entries)
+
+    def load_balancer(self):
+        """LoadBalancer baru untuk satu aksi penjadwalan, atau None jika penyeimbangan tidak aktif."""
+        return LoadBalancer(self.due_index) if self.load_balancing else None
+
+    def get_due_items(self, until=None):
+        """Item yang jatuh tempo sampai until (bawaan: hari ini) di semua topic, dari indeks jatuh tempo."""
+        return self.due_index.due_items(until)
+
+    def set_save_error_handler(self, handler):
+        """Handler(path, error) dipanggil jika penyimpanan di belakang layar gagal."""
+        self.storage.set_error_handler(handler)
+
+    def flush(self):
+        """Memastikan semua penyimpanan yang tertunda sudah ditulis ke disk."""
+        self.storage.flush()
+
+    def close(self):
+        """Menulis semua yang tertunda lalu menutup backend penyimpanan saat aplikasi keluar."""
+        self.search_index.stop()
+        self.review_log.save_aggregates()
+        # Indeks disimpan setelah semua penulisan selesai agar versinya sesuai isi di disk
+        self.storage.flush()
+        self.search_index.save(self.storage)
+        self.storage.close()
         
     def create_backup_zip(self, zip_path):
         """Membuat backup dari semua folder topic dan file task ke dalam satu file zip."""
         base_dir_for_zip = os.path.dirname(self.base_path)
         with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            topics_path = self.base_path
-            if os.path.exists(topics_path):
-                for root, _, files in os.walk(topics_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        zipf.write(file_path, os.path.relpath(file_path, base_dir_for_zip))
-            
-            if os.path.exists(self.task_data_file):
-                zipf.write(self.task_data_file, os.path.relpath(self.task_data_file, base_dir_for_zip))
+            self.storage.write_backup(zipf, base_dir_for_zip)
 
     def import_backup_zip(self, zip_path):
         """
@@ -148,23 +341,23 @@ class DataManager:
             with zipfile.ZipFile(zip_path, 'r') as zipf:
                 zipf.extractall(temp_extract_path)
 
-            # --- Proses Tasks: Timpa file task yang lama dengan yang baru dari backup ---
+            # --- Proses Tasks: Timpa data task yang lama dengan yang baru dari backup ---
             backup_task_file_rel_path = os.path.relpath(self.task_data_file, os.path.dirname(self.base_path))
             backup_task_file_abs_path = os.path.join(temp_extract_path, backup_task_file_rel_path)
             
             if os.path.exists(backup_task_file_abs_path):
-                # Hapus file task lama jika ada
-                if os.path.exists(self.task_data_file):
-                    os.remove(self.task_data_file)
-                # Pindahkan file task dari backup ke lokasi seharusnya
-                shutil.move(backup_task_file_abs_path, self.task_data_file)
+                try:
+                    with open(backup_task_file_abs_path, 'r', encoding='utf-8') as f:
+                        self.save_tasks_data(json.load(f))
+                except json.JSONDecodeError:
+                    print("Peringatan: File task di dalam backup rusak, dilewati.")
 
             # --- Proses Topics: Tambahkan topic baru, ganti nama jika duplikat ---
             backup_topics_dir_rel_path = os.path.relpath(self.base_path, os.path.dirname(self.base_path))
             backup_topics_dir_abs_path = os.path.join(temp_extract_path, backup_topics_dir_rel_path)
 
             if os.path.isdir(backup_topics_dir_abs_path):
-                existing_topics = [d for d in os.listdir(self.base_path) if os.path.isdir(os.path.join(self.base_path, d))]
+                existing_topics = {topic['name'] for topic in self.get_topics()}
                 
                 for topic_name in os.listdir(backup_topics_dir_abs_path):
                     source_topic_path = os.path.join(backup_topics_dir_abs_path, topic_name)
@@ -177,12 +370,15 @@ class DataManager:
                         dest_topic_name = f"{topic_name} (new)"
                         # Antisipasi jika "topic (new)" juga sudah ada
                         counter = 1
-                        while os.path.exists(os.path.join(self.base_path, dest_topic_name)):
+                        while dest_topic_name in existing_topics:
                             counter += 1
                             dest_topic_name = f"{topic_name} (new {counter})"
 
-                    dest_topic_path = os.path.join(self.base_path, dest_topic_name)
-                    shutil.move(source_topic_path, dest_topic_path)
+                    self.storage.import_topic_directory(source_topic_path, dest_topic_name)
+                    existing_topics.add(dest_topic_name)
+
+                # Topic hasil impor belum ada di indeks pencarian
+                self.refresh_search_index()
 
         finally:
             # Bersihkan direktori sementara
@@ -193,11 +389,24 @@ class DataManager:
             self.ensure_directory_exists(self.base_path)
             self.ensure_task_file_exists()
 
-    # --- Metode untuk Tasks (Bekerja dengan Satu File) ---
+    # --- Metode untuk Tasks (Model Resident di Memori) ---
+
+    @property
+    def task_model(self):
+        """
+        TaskModel resident yang dimuat sekali lalu diperbarui oleh setiap operasi.
+        Jika backend sudah memegang model sendiri (JSON), model itu dipakai bersama.
+        """
+        model = self.storage.resident_task_model()
+        if model is not None:
+            return model
+        if self._task_model is None:
+            self._task_model = TaskModel(self.storage.load_tasks())
+        return self._task_model
 
     def load_tasks_data(self):
         """Memuat seluruh data task dari file my_tasks.json."""
-        return self.load_content(self.task_data_file)
+        return self.task_model.data
 
     def save_tasks_data(self, data):
         """Menyimpan seluruh data task ke file my_tasks.json."""
@@ -205,112 +414,71 @@ class DataManager:
 
     def get_task_categories(self):
         """Mendapatkan daftar semua kategori task dari file."""
-        tasks_data = self.load_tasks_data()
         # Data sekarang adalah list, bukan dictionary
-        return tasks_data.get("categories", [])
+        return self.task_model.categories
+
+    def apply_task_operation(self, op_type, **fields):
+        """Mengirim satu operasi task bertipe ke backend (dicatat di jurnal, bukan tulis ulang file)."""
+        op = make_operation(op_type, **fields)
+        if self.storage.resident_task_model() is not None:
+            return self.storage.apply_task_operation(op)
+        model = self.task_model
+        if not model.apply(op):
+            return False
+        self.storage.apply_task_operation(op, current_data=model.data)
+        return True
 
     def create_task_category(self, name):
         """Membuat kategori task baru dalam file JSON."""
-        tasks_data = self.load_tasks_data()
-        # Cek duplikasi nama
-        if not any(cat['name'] == name for cat in tasks_data.get("categories", [])):
-            new_category = {
-                "name": name, 
-                "icon": config.DEFAULT_CATEGORY_ICON, 
-                "tasks": []
-            }
-            tasks_data.setdefault("categories", []).append(new_category)
-            self.save_tasks_data(tasks_data)
+        self.apply_task_operation("create_category", name=name, icon=config.DEFAULT_CATEGORY_ICON)
 
     def rename_task_category(self, old_name, new_name):
         """Mengubah nama kategori task dalam file JSON."""
-        tasks_data = self.load_tasks_data()
-        categories = tasks_data.get("categories", [])
-        # Cek duplikasi nama baru
-        if any(cat['name'] == new_name for cat in categories):
-            return
-        for category in categories:
-            if category['name'] == old_name:
-                category['name'] = new_name
-                self.save_tasks_data(tasks_data)
-                break
+        self.apply_task_operation("rename_category", old_name=old_name, new_name=new_name)
     
     def update_task_category_icon(self, category_name, new_icon):
         """Memperbarui ikon untuk kategori task tertentu."""
-        tasks_data = self.load_tasks_data()
-        categories = tasks_data.get("categories", [])
-        for category in categories:
-            if category['name'] == category_name:
-                category['icon'] = new_icon
-                self.save_tasks_data(tasks_data)
-                break
+        self.apply_task_operation("set_category_icon", name=category_name, icon=new_icon)
 
     def delete_task_category(self, name):
         """Menghapus kategori task dari file JSON."""
-        tasks_data = self.load_tasks_data()
-        categories = tasks_data.get("categories", [])
-        tasks_data["categories"] = [cat for cat in categories if cat['name'] != name]
-        self.save_tasks_data(tasks_data)
+        self.apply_task_operation("delete_category", name=name)
+
+    def move_task_category(self, index, new_index):
+        """Menukar posisi kategori pada index dengan kategori pada new_index."""
+        return self.apply_task_operation("move_category", index=index, new_index=new_index)
         
     def get_tasks(self, category_name, sort_by='date', sort_order='asc'):
         """
         Mendapatkan semua task dari sebuah kategori.
         Pengurutan tidak lagi dilakukan di sini, tapi mengikuti urutan di JSON.
         """
-        tasks_data = self.load_tasks_data()
-        categories = tasks_data.get("categories", [])
-        for category in categories:
-            if category.get('name') == category_name:
-                return category.get("tasks", [])
-        return []
+        return self.task_model.get_tasks(category_name)
+
+    def get_task(self, category_name, task_name):
+        """Mengambil dict sebuah task berdasarkan kategori dan namanya (O(1))."""
+        return self.task_model.get_task(category_name, task_name)
 
     def get_all_tasks(self, sort_by='date', sort_order='asc'):
         """
         Mendapatkan semua task dari semua kategori.
         Pengurutan sekarang berdasarkan tanggal untuk semua task gabungan.
+        Daftar diambil dari tampilan gabungan yang selalu terurut (lihat AllTasksView).
         """
-        tasks_data = self.load_tasks_data()
-        all_tasks = []
-        for category in tasks_data.get("categories", []):
-            for task in category.get("tasks", []):
-                task_copy = task.copy()
-                task_copy['name'] = f"[{category.get('name')}] {task.get('name')}"
-                task_copy['original_name'] = task.get('name')
-                task_copy['category'] = category.get('name')
-                all_tasks.append(task_copy)
-
-        # Logika pengurutan
-        reverse_order = (sort_order == 'desc')
-        if sort_by == 'date':
-            all_tasks.sort(key=_get_sort_key_for_date, reverse=reverse_order)
-        elif sort_by == 'count':
-            all_tasks.sort(key=lambda x: x.get('count', 0), reverse=reverse_order)
-        else: # default ke 'name'
-            all_tasks.sort(key=lambda x: x.get('name', '').lower(), reverse=reverse_order)
-
-        return all_tasks
+        return self.task_model.all_tasks_view().tasks(sort_by, sort_order)
 
     def save_task(self, category_name, task_name, data):
         """Menyimpan data sebuah task ke dalam kategori di file JSON."""
-        tasks_data = self.load_tasks_data()
-        for category in tasks_data.get("categories", []):
-            if category.get('name') == category_name:
-                task_found = False
-                for i, task in enumerate(category.get("tasks", [])):
-                    if task.get('name') == task_name:
-                        category["tasks"][i] = data
-                        task_found = True
-                        break
-                if not task_found:
-                    category.setdefault("tasks", []).append(data)
-                self.save_tasks_data(tasks_data)
-                return
+        self.apply_task_operation("save_task", category=category_name, task_name=task_name, data=data)
 
     def delete_task(self, category_name, task_name):
         """Menghapus sebuah task dari kategori di file JSON."""
-        tasks_data = self.load_tasks_data()
-        for category in tasks_data.get("categories", []):
-            if category.get('name') == category_name:
-                category["tasks"] = [task for task in category.get("tasks", []) if task.get('name') != task_name]
-                self.save_tasks_data(tasks_data)
-                return
\ No newline at end of file
+        self.apply_task_operation("delete_task", category=category_name, task_name=task_name)
+
+    def set_task_checked(self, category_name, task_name, checked):
+        """Mengubah status checklist sebuah task."""
+        self.apply_task_operation("set_task_checked", category=category_name, task_name=task_name, checked=checked)
+
+    def move_task(self, category_name, index, new_index):
+        """Menukar posisi task pada index dengan task pada new_index di dalam kategori."""
+        return self.apply_task_operation("move_task", category=category_name, index=index, new_index=new_index)
@@ -0,0 +1,232 @@
+# file: core/due_index.py
+
+import bisect
+import os
+import threading
+
+from core import content_ids
+from core.content_records import date_to_ordinal, today_ordinal
+
+def _extract_due_items(content):
+    """
+    Membaca satu subject sekali jalan untuk setiap point, atau diskusi tanpa point.
+    Mengembalikan (items, ringkasan):
+    - items: {ID: (ordinal, kode, teks, tipe)} untuk item bertanggal valid yang belum selesai.
+    - ringkasan: {"items": jumlah, "finished": jumlah, "codes": {kode: jumlah},
+      "finished_days": {ordinal finished_date: jumlah}} untuk semua item.
+    Menerima dict JSON maupun record.
+    """
+    items = {}
+    codes = {}
+    finished_days = {}
+    total = finished = 0
+    for discussion in (content or {}).get("content", []):
+        points = discussion.get("points") or []
+        candidates = [(point, "point", "point_text") for point in points] if points else [(discussion, "discussion", "discussion")]
+        for item, item_type, text_key in candidates:
+            total += 1
+            code = item.get("repetition_code") or ""
+            codes[code] = codes.get(code, 0) + 1
+            if item.get("finished"):
+                finished += 1
+                finished_ordinal = date_to_ordinal(item.get("finished_date"))
+                if isinstance(finished_ordinal, int):
+                    finished_days[finished_ordinal] = finished_days.get(finished_ordinal, 0) + 1
+                continue
+            ordinal = date_to_ordinal(item.get("date"))
+            if not isinstance(ordinal, int):
+                continue
+            items[item.get(content_ids.ID_KEY)] = (ordinal, item.get("repetition_code"), item.get(text_key, ""), item_type)
+    summary = {"items": total, "finished": finished, "codes": codes, "finished_days": finished_days}
+    return items, summary
+
+class DueIndex:
+    """
+    Indeks jatuh tempo untuk seluruh koleksi: tanggal (ordinal) -> subject -> ID item.
+
+    Diisi bersama SearchIndex (subject yang sama cukup dibaca sekali) dan
+    diperbarui setiap kali subject disimpan, sehingga daftar item yang jatuh
+    tempo hari ini atau terlambat didapat tanpa membuka file subject mana pun.
+    Setiap subject juga menyimpan ringkasan kecil (jumlah per kode, jumlah selesai)
+    untuk jendela statistik.
+    Semua akses dilindungi lock karena pengisian awal berjalan di thread lain.
+    """
+    # Versi format export_subject(); dinaikkan setiap kali bentuk item atau ringkasan berubah
+    PERSIST_FORMAT = 2
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._subjects = {}  # path -> {"version", "items": {ID: (ordinal, kode, teks, tipe)}, "summary"}
+        self._by_date = {}  # ordinal -> {path: set(ID)}
+        self._dates = []  # ordinal yang ada di _by_date, terurut
+
+    def __len__(self):
+        with self._lock:
+            return len(self._subjects)
+
+    # --- Pembaruan ---
+
+    def is_current(self, path, version):
+        with self._lock:
+            entry = self._subjects.get(path)
+            return entry is not None and version is not None and entry["version"] == version
+
+    def update_subject(self, path, content, version):
+        """Mengindeks ulang satu subject (dipanggil setiap kali subject disimpan)."""
+        # Subject yang dibaca langsung dari penyimpanan bisa belum ber-ID; ID-nya
+        # diberikan dengan cara yang sama seperti DataManager.load_content
+        content_ids.assign_ids(content)
+        items, summary = _extract_due_items(content)
+        self._set_subject(path, items, summary, version)
+
+    def export_subject(self, path):
+        """Entri satu subject dalam bentuk JSON, untuk disimpan bersama indeks pencarian."""
+        with self._lock:
+            entry = self._subjects.get(path)
+            if entry is None:
+                return None
+            summary = dict(entry["summary"])
+            summary["finished_days"] = [[ordinal, count] for ordinal, count in summary["finished_days"].items()]
+            return {"items": [[item_id, ordinal, code, text, item_type]
+                              for item_id, (ordinal, code, text, item_type) in entry["items"].items()],
+                    "summary": summary}
+
+    def import_subject(self, path, data, version):
+        """Memuat entri hasil export_subject(); subject yang sudah diindeks tidak ditimpa."""
+        if data is None:
+            return
+        items = {item_id: (ordinal, code, text, item_type) for item_id, ordinal, code, text, item_type in data["items"]}
+        summary = dict(data["summary"])
+        summary["finished_days"] = {ordinal: count for ordinal, count in summary["finished_days"]}
+        self._set_subject(path, items, summary, version, replace=False)
+
+    def _set_subject(self, path, items, summary, version, replace=True):
+        with self._lock:
+            if not replace and path in self._subjects:
+                return
+            self._remove_locked(path)
+            self._subjects[path] = {"version": version, "items": items, "summary": summary}
+            for item_id, (ordinal, _, _, _) in items.items():
+                by_path = self._by_date.get(ordinal)
+                if by_path is None:
+                    by_path = self._by_date[ordinal] = {}
+                    bisect.insort(self._dates, ordinal)
+                by_path.setdefault(path, set()).add(item_id)
+
+    def remove_subject(self, path):
+        with self._lock:
+            self._remove_locked(path)
+
+    def remove_prefix(self, path_prefix):
+        """Menghapus semua subject di bawah sebuah topic (atau satu subject)."""
+        with self._lock:
+            for path in self._paths_under(path_prefix):
+                self._remove_locked(path)
+
+    def rename_prefix(self, old_prefix, new_prefix):
+        """Memindahkan entri setelah topic atau subject diganti namanya."""
+        with self._lock:
+            for old_path in self._paths_under(old_prefix):
+                entry = self._subjects[old_path]
+                self._remove_locked(old_path)
+                new_path = new_prefix + old_path[len(old_prefix):]
+                self._subjects[new_path] = entry
+                for item_id, (ordinal, _, _, _) in entry["items"].items():
+                    by_path = self._by_date.get(ordinal)
+                    if by_path is None:
+                        by_path = self._by_date[ordinal] = {}
+                        bisect.insort(self._dates, ordinal)
+                    by_path.setdefault(new_path, set()).add(item_id)
+
+    def prune(self, existing_paths):
+        """Membuang subject yang sudah tidak ada di penyimpanan."""
+        with self._lock:
+            for path in [path for path in self._subjects if path not in existing_paths]:
+                self._remove_locked(path)
+
+    def _paths_under(self, path_prefix):
+        prefix = os.path.normpath(path_prefix)
+        return [path for path in self._subjects
+                if os.path.normpath(path) == prefix or os.path.normpath(path).startswith(prefix + os.sep)]
+
+    def _remove_locked(self, path):
+        entry = self._subjects.pop(path, None)
+        if entry is None:
+            return
+        for ordinal in {ordinal for ordinal, _, _, _ in entry["items"].values()}:
+            by_path = self._by_date.get(ordinal)
+            if by_path is None:
+                continue
+            by_path.pop(path, None)
+            if not by_path:
+                del self._by_date[ordinal]
+                del self._dates[bisect.bisect_left(self._dates, ordinal)]
+
+    # --- Kueri ---
+
+    def due_items(self, until=None, since=None):
+        """
+        Item dengan tanggal since <= tanggal <= until (bawaan: semua sampai hari ini),
+        terurut dari yang paling lama. Mengembalikan list (ordinal, path, ID, kode, teks, tipe).
+        """
+        if until is None:
+            until = today_ordinal()
+        results = []
+        with self._lock:
+            start = 0 if since is None else bisect.bisect_left(self._dates, since)
+            end = bisect.bisect_right(self._dates, until)
+            for ordinal in self._dates[start:end]:
+                for path, item_ids in self._by_date[ordinal].items():
+                    items = self._subjects[path]["items"]
+                    for item_id in item_ids:
+                        _, code, text, item_type = items[item_id]
+                        results.append((ordinal, path, item_id, code, text, item_type))
+        results.sort(key=lambda result: (result[0], result[1], result[2]))
+        return results
+
+    def daily_counts(self, since, until):
+        """{ordinal: jumlah item} untuk setiap tanggal since..until yang punya item."""
+        with self._lock:
+            start = bisect.bisect_left(self._dates, since)
+            end = bisect.bisect_right(self._dates, until)
+            return {ordinal: sum(len(item_ids) for item_ids in self._by_date[ordinal].values())
+                    for ordinal in self._dates[start:end]}
+
+    def count_on(self, ordinal):
+        """Jumlah item yang jatuh tempo tepat pada tanggal ini."""
+        with self._lock:
+            by_path = self._by_date.get(ordinal)
+            return sum(len(item_ids) for item_ids in by_path.values()) if by_path else 0
+
+    def count_due(self, until=None):
+        """Jumlah item yang jatuh tempo sampai tanggal until (bawaan: hari ini)."""
+        if until is None:
+            until = today_ordinal()
+        with self._lock:
+            end = bisect.bisect_right(self._dates, until)
+            return sum(len(item_ids) for ordinal in self._dates[:end]
+                       for item_ids in self._by_date[ordinal].values())
+
+    def collection_summary(self, finished_since=None):
+        """
+        Ringkasan seluruh koleksi dari ringkasan per subject (tanpa membuka file):
+        {"codes": {kode: jumlah item}, "topics": {topic: {"subjects", "items",
+        "finished", "finished_recent"}}}. finished_recent menghitung item dengan
+        finished_date >= finished_since.
+        """
+        codes = {}
+        topics = {}
+        with self._lock:
+            for path, entry in self._subjects.items():
+                summary = entry["summary"]
+                for code, count in summary["codes"].items():
+                    codes[code] = codes.get(code, 0) + count
+                topic = topics.setdefault(os.path.basename(os.path.dirname(path)),
+                                          {"subjects": 0, "items": 0, "finished": 0, "finished_recent": 0})
+                topic["subjects"] += 1
+                topic["items"] += summary["items"]
+                topic["finished"] += summary["finished"]
+                if finished_since is not None:
+                    topic["finished_recent"] += sum(count for ordinal, count in summary["finished_days"].items()
+                                                    if ordinal >= finished_since)
+        return {"codes": codes, "topics": topics}
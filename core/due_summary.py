@@ -0,0 +1,99 @@
+# file: core/due_summary.py
+
+import bisect
+
+from core.content_records import Discussion, valid_ordinal, today_ordinal
+
+def is_due_item(record):
+    """
+    True jika record ikut dijadwalkan: point, atau diskusi tanpa point, yang
+    punya tanggal valid dan belum selesai (sama seperti pemindaian lama).
+    """
+    if isinstance(record, Discussion) and record.point_list():
+        return False
+    return valid_ordinal(record.date) is not None and not record.get("finished")
+
+def iter_due_items(content):
+    """Semua record terjadwal dari sebuah subject, sesuai urutan dokumen."""
+    for discussion in content.get("content", []):
+        points = discussion.point_list()
+        if points:
+            for point in points:
+                if is_due_item(point):
+                    yield point
+        elif is_due_item(discussion):
+            yield discussion
+
+class DueSummary:
+    """
+    Ringkasan jatuh tempo satu subject yang diperbarui per item.
+
+    Item terjadwal disimpan dalam list terurut (ordinal, ID) yang dijaga dengan
+    bisect, sehingga tanggal paling awal dan jumlah item terlambat / hari ini /
+    mendatang didapat tanpa memindai semua diskusi dan point. Handler memanggil
+    update() untuk setiap record yang diubah atau ditambahkan dan remove() untuk
+    record yang dihapus.
+    """
+    def __init__(self, path, content):
+        self.path = path
+        self.content = content
+        self._entries = {}  # ID -> (ordinal, kode)
+        self._sorted = []  # (ordinal, ID)
+        for record in iter_due_items(content):
+            self._entries[record.id] = (record.date, record.repetition_code)
+            self._sorted.append((record.date, record.id))
+        self._sorted.sort()
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def update(self, record):
+        """Menyamakan entri record (dan point-nya jika diskusi) dengan isinya sekarang."""
+        self._sync(record)
+        if isinstance(record, Discussion):
+            for point in record.point_list():
+                self._sync(point)
+
+    def _sync(self, record):
+        self._discard(record.id)
+        if is_due_item(record):
+            self._entries[record.id] = (record.date, record.repetition_code)
+            bisect.insort(self._sorted, (record.date, record.id))
+
+    def remove(self, record):
+        """Membuang record; untuk diskusi, point-nya ikut dibuang."""
+        self._discard(record.id)
+        if isinstance(record, Discussion):
+            for point in record.point_list():
+                self._discard(point.id)
+
+    def _discard(self, item_id):
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+        position = bisect.bisect_left(self._sorted, (entry[0], item_id))
+        del self._sorted[position]
+
+    def earliest(self):
+        """(ordinal, kode) item dengan tanggal paling awal, atau (None, None)."""
+        if not self._sorted:
+            return None, None
+        ordinal, item_id = self._sorted[0]
+        return ordinal, self._entries[item_id][1]
+
+    def counts(self, today=None):
+        """Jumlah item terlambat, jatuh tempo hari ini, dan mendatang."""
+        if today is None:
+            today = today_ordinal()
+        start_today = bisect.bisect_left(self._sorted, (today,))
+        start_tomorrow = bisect.bisect_left(self._sorted, (today + 1,))
+        return {
+            "overdue": start_today,
+            "today": start_tomorrow - start_today,
+            "upcoming": len(self._sorted) - start_tomorrow,
+        }
+
+    def verify(self):
+        """Membandingkan dengan pemindaian penuh; True jika ringkasan masih sama."""
+        expected = sorted((record.date, record.id) for record in iter_due_items(self.content))
+        return expected == self._sorted
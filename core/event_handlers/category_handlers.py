@@ -9,20 +9,20 @@ class CategoryHandlers:
         self.win = main_window
         self.data_manager = main_window.data_manager
 
+    def task_category_name(self, item):
+        """Nama kategori dari item daftar kategori (teks item diawali ikon)."""
+        if not item:
+            return None
+        text = item.text()
+        if text == "Semua Task":
+            return "Semua Task"
+        parts = text.split(" ", 1)
+        return parts[1] if len(parts) > 1 else parts[0]
+
     def task_category_selected(self, current, previous):
         """Handler saat kategori task dipilih."""
-        if not current:
-            self.win.current_task_category = None
-        else:
-            text = current.text()
-            if text == "Semua Task":
-                self.win.current_task_category = "Semua Task"
-            else:
-                parts = text.split(" ", 1)
-                self.win.current_task_category = parts[1] if len(parts) > 1 else parts[0]
-                
+        self.win.current_task_category = self.task_category_name(current)
         self.win.refresh_manager.refresh_task_list()
-        self.update_button_states()
 
     def create_task_category(self):
         """Membuat kategori task baru."""
@@ -52,7 +52,6 @@ class CategoryHandlers:
                 if current_name == new_name:
                     self.win.task_category_list.setCurrentItem(list_item)
                     break
-            self.win.refresh_manager.refresh_task_list()
             
     def change_task_category_icon(self):
         """Mengubah ikon untuk kategori yang dipilih."""
@@ -98,16 +97,8 @@ class CategoryHandlers:
         current_row = self.win.task_category_list.currentRow()
         if current_row <= 0: return
 
-        tasks_data = self.data_manager.load_tasks_data()
-        categories = tasks_data.get("categories", [])
-        
         cat_index = current_row - 1
-        
-        if 0 <= cat_index < len(categories):
-            new_index = cat_index + direction
-            if 0 <= new_index < len(categories):
-                categories[cat_index], categories[new_index] = categories[new_index], categories[cat_index]
-                self.data_manager.save_tasks_data(tasks_data)
-                
-                self.win.refresh_manager.refresh_task_category_list()
-                self.win.task_category_list.setCurrentRow(new_index + 1)
\ No newline at end of file
+        new_index = cat_index + direction
+        if self.data_manager.move_task_category(cat_index, new_index):
+            self.win.refresh_manager.refresh_task_category_list()
+            self.win.task_category_list.setCurrentRow(new_index + 1)
\ No newline at end of file
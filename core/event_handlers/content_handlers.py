@@ -1,10 +1,23 @@
 # file: core/event_handlers/content_handlers.py
 
-from datetime import datetime, timedelta
-from PyQt6.QtWidgets import QInputDialog, QMessageBox, QComboBox
+import os
+from datetime import datetime
+from PyQt6.QtWidgets import QInputDialog, QMessageBox, QProgressDialog
 from PyQt6.QtCore import Qt
 import config
 from core.ui_components.date_dialog import DateDialog
+from core.ui_components.search_dialog import GlobalSearchDialog
+from core.ui_components.due_dialog import DueTodayDialog
+from core.ui_components.review_dialog import ReviewSessionDialog
+from core.ui_components.bulk_reschedule_dialog import BulkRescheduleDialog
+from core.ui_components.ladder_dialog import RepetitionLadderDialog
+from core.ui_components.forecast_dialog import WorkloadForecastDialog
+from core.ui_components.stats_dialog import StatisticsDialog
+from core.bulk_reschedule import BulkRescheduler
+from core.adaptive_scheduler import AdaptiveScheduler
+from core.search_index import DISCUSSION_LOCATION
+from core import content_ids, content_records, scheduling, adaptive_scheduler
+from core.content_records import Discussion, Point
 
 class ContentHandlers:
     """Berisi handler untuk event terkait Content Tree (Diskusi dan Point)."""
@@ -13,37 +26,20 @@ class ContentHandlers:
         self.data_manager = main_window.data_manager
     
     # >>>>>>>> MULAI KODE BARU <<<<<<<<
+    def due_summary(self, rebuild=False):
+        """Ringkasan jatuh tempo subject yang sedang dibuka (lihat DueSummary)."""
+        return self.data_manager.due_summary(self.win.current_subject_path, self.win.current_content, rebuild)
+
     def update_earliest_date_in_metadata(self):
-        """Mencari tanggal dan kode repetisi paling awal dan menyimpannya di metadata."""
+        """Menyimpan tanggal dan kode repetisi paling awal ke metadata, diambil dari ringkasan jatuh tempo."""
         if not self.win.current_content:
             return
 
-        earliest_date = None
-        earliest_code = None
-        
-        for item in self.win.current_content.get("content", []):
-            items_to_check = []
-            if item.get("points"):
-                items_to_check.extend(item["points"])
-            else:
-                items_to_check.append(item)
-
-            for sub_item in items_to_check:
-                if sub_item.get("date") and not sub_item.get("finished"):
-                    current_date = datetime.strptime(sub_item["date"], "%Y-%m-%d")
-                    if earliest_date is None or current_date < earliest_date:
-                        earliest_date = current_date
-                        earliest_code = sub_item.get("repetition_code")
-
-        if "metadata" not in self.win.current_content:
-            self.win.current_content["metadata"] = {}
-
-        if earliest_date:
-            self.win.current_content["metadata"]["earliest_date"] = earliest_date.strftime("%Y-%m-%d")
-            self.win.current_content["metadata"]["earliest_code"] = earliest_code
-        else:
-            self.win.current_content["metadata"]["earliest_date"] = None
-            self.win.current_content["metadata"]["earliest_code"] = None
+        # Item yang ditambahkan sebagai dict diubah dulu menjadi record; ringkasannya dibangun ulang
+        converted = content_records.ensure_records(self.win.current_content)
+        if converted:
+            content_ids.assign_ids(self.win.current_content)
+        self.data_manager.update_due_metadata(self.win.current_subject_path, self.win.current_content, rebuild=converted)
     # >>>>>>>> SELESAI KODE BARU <<<<<<<<
 
     def add_discussion(self):
@@ -51,14 +47,17 @@ class ContentHandlers:
         text, ok = QInputDialog.getText(self.win, "Tambah Diskusi", "Teks Diskusi:")
         if ok and text:
             date_str = datetime.now().strftime("%Y-%m-%d")
-            new_discussion = { "discussion": text, "date": date_str, "repetition_code": "R0D", "points": [] }
+            new_discussion = Discussion(text, date_str, "R0D", content_ids.new_id(self.win.current_content), points=[])
             self.win.current_content["content"].append(new_discussion)
+            self.due_summary().update(new_discussion)
             self.win.refresh_manager.save_and_refresh_content()
 
     def edit_discussion(self):
-        item = self.win.content_tree.currentItem()
-        if not item or item.data(0, Qt.ItemDataRole.UserRole)["type"] != "discussion": return
-        idx = item.data(0, Qt.ItemDataRole.UserRole)["index"]
+        data = self.win.content_tree.current_item_data()
+        if not data or data["type"] != "discussion": return
+        location = self.get_item_location(data)
+        if not location: return
+        idx = location[0]
         old_text = self.win.current_content["content"][idx]["discussion"]
         new_text, ok = QInputDialog.getText(self.win, "Edit Diskusi", "Teks Diskusi:", text=old_text)
         if ok and new_text:
@@ -66,24 +65,25 @@ class ContentHandlers:
             self.win.refresh_manager.save_and_refresh_content()
 
     def delete_discussion(self):
-        item = self.win.content_tree.currentItem()
-        if not item or item.data(0, Qt.ItemDataRole.UserRole)["type"] != "discussion": return
-        idx = item.data(0, Qt.ItemDataRole.UserRole)["index"]
+        data = self.win.content_tree.current_item_data()
+        if not data or data["type"] != "discussion": return
+        location = self.get_item_location(data)
+        if not location: return
+        idx = location[0]
         if QMessageBox.question(self.win, "Konfirmasi", "Yakin hapus diskusi ini?") == QMessageBox.StandardButton.Yes:
-            del self.win.current_content["content"][idx]
+            removed = self.win.current_content["content"].pop(idx)
+            self.due_summary().remove(removed)
             self.win.refresh_manager.save_and_refresh_content()
 
     def add_point(self):
-        parent_item = self.win.content_tree.currentItem()
-        if not parent_item: return
-        if parent_item.parent(): parent_item = parent_item.parent()
-        data = parent_item.data(0, Qt.ItemDataRole.UserRole)
-        if data["type"] != "discussion": return
-        parent_idx = data["index"]
+        location = self.get_item_location(self.win.content_tree.current_item_data())
+        if not location: return
+        # Point terpilih: tambahkan ke diskusi induknya
+        parent_idx = location[0]
         text, ok = QInputDialog.getText(self.win, "Tambah Point", "Teks Point:")
         if ok and text:
             date_str = datetime.now().strftime("%Y-%m-%d")
-            new_point = { "point_text": text, "repetition_code": "R0D", "date": date_str }
+            new_point = Point(text, date_str, "R0D", content_ids.new_id(self.win.current_content))
             discussion = self.win.current_content["content"][parent_idx]
             if "points" not in discussion:
                 discussion["points"] = []
@@ -91,13 +91,17 @@ class ContentHandlers:
                 discussion["date"] = None
                 discussion["repetition_code"] = None
             discussion["points"].append(new_point)
+            summary = self.due_summary()
+            summary.update(new_point)
+            summary.update(discussion)
             self.win.refresh_manager.save_and_refresh_content()
 
     def edit_point(self):
-        item = self.win.content_tree.currentItem()
-        if not item or item.data(0, Qt.ItemDataRole.UserRole)["type"] != "point": return
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        parent_idx, point_idx = data["parent_index"], data["index"]
+        data = self.win.content_tree.current_item_data()
+        if not data or data["type"] != "point": return
+        location = self.get_item_location(data)
+        if not location: return
+        parent_idx, point_idx = location
         old_text = self.win.current_content["content"][parent_idx]["points"][point_idx]["point_text"]
         new_text, ok = QInputDialog.getText(self.win, "Edit Point", "Teks Point:", text=old_text)
         if ok and new_text:
@@ -105,23 +109,24 @@ class ContentHandlers:
             self.win.refresh_manager.save_and_refresh_content()
 
     def delete_point(self):
-        item = self.win.content_tree.currentItem()
-        if not item or item.data(0, Qt.ItemDataRole.UserRole)["type"] != "point": return
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        parent_idx, point_idx = data["parent_index"], data["index"]
+        data = self.win.content_tree.current_item_data()
+        if not data or data["type"] != "point": return
+        location = self.get_item_location(data)
+        if not location: return
+        parent_idx, point_idx = location
         if QMessageBox.question(self.win, "Konfirmasi", "Yakin hapus point ini?") == QMessageBox.StandardButton.Yes:
             discussion = self.win.current_content["content"][parent_idx]
-            del discussion["points"][point_idx]
+            removed = discussion["points"].pop(point_idx)
             if not discussion["points"]:
                 discussion["date"] = datetime.now().strftime("%Y-%m-%d")
                 discussion["repetition_code"] = "R0D"
+            summary = self.due_summary()
+            summary.remove(removed)
+            summary.update(discussion)
             self.win.refresh_manager.save_and_refresh_content()
 
     def toggle_finish_status(self):
-        item = self.win.content_tree.currentItem()
-        if not item: return
-
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = self.win.content_tree.current_item_data()
         item_dict = self.get_item_dict(item_data)
         if not item_dict: return
         
@@ -134,11 +139,10 @@ class ContentHandlers:
                                          QMessageBox.StandardButton.No)
             
             if reply == QMessageBox.StandardButton.Yes:
-                today_str = datetime.now().strftime("%Y-%m-%d")
-                item_dict["finished"] = True
-                item_dict["repetition_code"] = "Finish"
-                item_dict["finished_date"] = today_str
-                item_dict["date"] = None
+                old_code = item_dict.get("repetition_code")
+                scheduling.finish_item(item_dict)
+                self.due_summary().update(item_dict)
+                self.data_manager.log_reviews(self.win.current_subject_path, [(item_dict, old_code)])
                 message = "Status diubah menjadi Selesai."
                 self.win.refresh_manager.save_and_refresh_content()
                 self.win.status_bar.showMessage(message, 4000)
@@ -149,20 +153,16 @@ class ContentHandlers:
                                          QMessageBox.StandardButton.No)
 
             if reply == QMessageBox.StandardButton.Yes:
-                item_dict["finished"] = False
-                item_dict["repetition_code"] = "R0D"
-                item_dict["date"] = datetime.now().strftime("%Y-%m-%d")
-                if "finished_date" in item_dict:
-                    del item_dict["finished_date"]
+                old_code = item_dict.get("repetition_code")
+                scheduling.restart_item(item_dict, ladder=self.data_manager.ladder_for(self.win.current_subject_path))
+                self.due_summary().update(item_dict)
+                self.data_manager.log_reviews(self.win.current_subject_path, [(item_dict, old_code)])
                 message = "Status Selesai dibatalkan."
                 self.win.refresh_manager.save_and_refresh_content()
                 self.win.status_bar.showMessage(message, 4000)
 
     def change_date_manually(self):
-        item = self.win.content_tree.currentItem()
-        if not item: return
-        
-        item_data = item.data(0, Qt.ItemDataRole.UserRole)
+        item_data = self.win.content_tree.current_item_data()
         item_dict = self.get_item_dict(item_data)
         
         if not item_dict: return
@@ -177,6 +177,7 @@ class ContentHandlers:
             item_dict["date"] = new_date
             if not item_dict.get("repetition_code"):
                 item_dict["repetition_code"] = "R0D"
+            self.due_summary().update(item_dict)
             self.win.refresh_manager.save_and_refresh_content()
             self.win.status_bar.showMessage(f"Tanggal berhasil diubah menjadi {new_date}", 4000)
 
@@ -187,32 +188,229 @@ class ContentHandlers:
             return
     
         original_date_str = item_dict.get("date", "tidak ada")
-    
-        base_date = datetime.now()
-        days_to_add = config.REPETITION_CODES_DAYS.get(new_code, 0)
-        new_date_str = (base_date + timedelta(days=days_to_add)).strftime("%Y-%m-%d")
+
+        ladder = self.data_manager.ladder_for(self.win.current_subject_path)
+        # "Finish" dari editor kode tetap hanya mengganti kode dan tanggal seperti sebelumnya;
+        # kode lain dicatat sebagai review jika penjadwalan adaptif aktif
+        scheduler = self.data_manager.adaptive_scheduler if new_code != scheduling.FINISH_CODE else None
+        balancer = self.data_manager.load_balancer() if new_code != scheduling.FINISH_CODE else None
+        new_date_str = content_records.ordinal_to_date(
+            scheduling.preview_review_date(item_dict, new_code, ladder=ladder, scheduler=scheduler, balancer=balancer)
+        )
     
         if new_code == item_dict.get("repetition_code") and original_date_str == new_date_str:
             self.win.refresh_manager.refresh_content_tree()
             return
-    
+
+        basis = "penjadwalan adaptif" if scheduler is not None else "berdasarkan tanggal hari ini"
+        if balancer is not None:
+            basis += ", digeser ke hari yang lebih sepi"
         reply = QMessageBox.question(self.win, "Konfirmasi Perubahan",
             f"Anda akan mengubah kode repetisi menjadi <b>{new_code}</b>.<br>"
-            f"Tanggal akan diperbarui dari {original_date_str} ke <b>{new_date_str}</b> (berdasarkan tanggal hari ini).<br><br>"
+            f"Tanggal akan diperbarui dari {original_date_str} ke <b>{new_date_str}</b> ({basis}).<br><br>"
             "Apakah Anda yakin?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
             
         if reply == QMessageBox.StandardButton.Yes:
-            item_dict["date"] = new_date_str
-            item_dict["repetition_code"] = new_code
+            old_code = item_dict.get("repetition_code")
+            if scheduler is not None:
+                scheduling.apply_repetition_code(item_dict, new_code, ladder=ladder, scheduler=scheduler, balancer=balancer)
+            else:
+                item_dict["date"] = new_date_str
+                item_dict["repetition_code"] = new_code
+            self.due_summary().update(item_dict)
+            self.data_manager.log_reviews(self.win.current_subject_path, [(item_dict, old_code)])
             self.win.refresh_manager.save_and_refresh_content()
         else:
             self.win.refresh_manager.refresh_content_tree()
     
     def on_search_text_changed(self):
-        query = self.win.search_content_input.text()
-        self.win.search_query = query
+        """Enter ditekan: jalankan pencarian segera tanpa menunggu jeda ketik."""
+        self.win.live_search.start_search()
+
+    def on_search_text_edited(self):
+        """Setiap ketikan menjadwalkan pencarian di latar belakang (jika pencarian langsung aktif)."""
+        self.win.live_search.schedule()
+
+    def set_live_search(self, enabled):
+        self.win.settings.setValue("live_search", enabled)
+
+    def set_fuzzy_search(self, enabled):
+        """Mengganti mode pencarian (substring persis / fuzzy trigram) lalu menerapkan ulang query."""
+        self.win.settings.setValue("fuzzy_search", enabled)
+        if self.win.search_query:
+            self.win.refresh_manager.refresh_content_tree()
+
+    def show_global_search_dialog(self):
+        """Membuka dialog pencarian di semua topic lalu melompat ke hasil yang dipilih."""
+        # Subject yang diubah dari luar aplikasi ikut diindeks ulang
+        self.data_manager.refresh_search_index()
+        fuzzy = self.win.settings.value("fuzzy_search", False, type=bool)
+        dialog = GlobalSearchDialog(self.data_manager, self.win, self.win.search_content_input.text(), fuzzy)
+        if dialog.exec() and dialog.selected_result:
+            self.navigate_to_search_result(*dialog.selected_result)
+
+    def navigate_to_search_result(self, subject_path, location):
+        """Memilih topic, subject, lalu diskusi/point dari hasil pencarian."""
+        if not self.select_subject_path(subject_path):
+            return
+        target = content_ids.item_data_for_location(self.win.current_content, location)
+        self.select_content_item(target)
+
+    def show_due_today_dialog(self):
+        """Membuka daftar item yang jatuh tempo hari ini atau terlambat di semua topic."""
+        # Subject yang diubah dari luar aplikasi ikut diindeks ulang
+        self.data_manager.refresh_search_index()
+        date_format = self.win.settings.value("date_format", "long")
+        dialog = DueTodayDialog(self.data_manager, self.win, date_format)
+        if dialog.exec() and dialog.selected_result:
+            subject_path, item_data = dialog.selected_result
+            if self.select_subject_path(subject_path):
+                self.select_content_item(item_data)
+
+    def show_review_session(self):
+        """Memulai sesi review untuk semua item yang jatuh tempo, lalu merefresh tampilan."""
+        self.data_manager.refresh_search_index()
+        date_format = self.win.settings.value("date_format", "long")
+        dialog = ReviewSessionDialog(self.data_manager, self.win, date_format)
+        dialog.exec()
+        if dialog.session.reviewed:
+            self.win.refresh_manager.refresh_subject_list()
+            self.win.refresh_manager.refresh_content_tree()
+            self.win.status_bar.showMessage(f"Sesi review selesai: {dialog.session.reviewed} item dijadwalkan ulang.", 5000)
+
+    def show_bulk_reschedule_dialog(self):
+        """Menjadwalkan ulang banyak item sekaligus; setiap subject disimpan satu kali."""
+        self.data_manager.refresh_search_index()
+        selected_ids = None
+        location = self.get_item_location(self.win.content_tree.current_item_data())
+        if location:
+            # Diskusi terpilih mencakup point-point-nya
+            discussion = self.win.current_content["content"][location[0]]
+            item = content_ids.item_at(self.win.current_content, location)
+            ids = {item.get(content_ids.ID_KEY)}
+            if item is discussion:
+                ids.update(point.get(content_ids.ID_KEY) for point in discussion.point_list())
+            selected_ids = {self.win.current_subject_path: ids}
+
+        dialog = BulkRescheduleDialog(self.data_manager, self.win, self.win.current_topic_path,
+                                      self.win.current_subject_path, selected_ids)
+        if not dialog.exec():
+            return
+        items = dialog.selected_items()
+        if not items:
+            return
+        rescheduler = BulkRescheduler(self.data_manager, items, dialog.new_code())
+
+        progress = QProgressDialog("Menjadwalkan ulang item...", "Batal", 0, rescheduler.item_count, self.win)
+        progress.setWindowTitle("Jadwalkan Ulang Massal")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def report(done, total):
+            progress.setValue(done)
+            return not progress.wasCanceled()
+
+        completed = rescheduler.run(report)
+        progress.close()
+
+        self.win.refresh_manager.refresh_subject_list()
         self.win.refresh_manager.refresh_content_tree()
+        message = f"{rescheduler.changed} item di {len(rescheduler.saved_paths)} subject dijadwalkan ulang."
+        if not completed:
+            message = "Dibatalkan. " + message
+        self.win.status_bar.showMessage(message, 6000)
+
+    def set_adaptive_scheduling(self, enabled):
+        """Mengganti penjadwalan antara interval tetap tangga repetisi dan penjadwal adaptif."""
+        self.win.settings.setValue("adaptive_scheduling", enabled)
+        self.data_manager.adaptive_scheduler = AdaptiveScheduler.load() if enabled else None
+
+    def set_load_balancing(self, enabled):
+        """Mengaktifkan penggeseran tanggal jatuh tempo baru ke hari yang lebih sepi."""
+        self.win.settings.setValue("load_balancing", enabled)
+        self.data_manager.load_balancing = enabled
+
+    def show_workload_forecast(self):
+        """Menampilkan perkiraan jumlah review per hari untuk semua topic."""
+        self.data_manager.refresh_search_index()
+        date_format = self.win.settings.value("date_format", "long")
+        WorkloadForecastDialog(self.data_manager, self.win, date_format).exec()
+
+    def show_statistics(self):
+        """Menampilkan statistik review dan koleksi dari agregat log review dan indeks."""
+        self.data_manager.refresh_search_index()
+        date_format = self.win.settings.value("date_format", "long")
+        StatisticsDialog(self.data_manager, self.win, date_format).exec()
+
+    def fit_adaptive_parameters(self):
+        """Menyesuaikan bobot penjadwal adaptif dengan riwayat review semua item, lalu menyimpannya."""
+        if adaptive_scheduler.np is None:
+            QMessageBox.warning(self.win, "NumPy Diperlukan",
+                                "Penyesuaian parameter membutuhkan NumPy. Pasang NumPy lalu coba lagi.")
+            return
+        # Riwayat diambil dari log review (dibaca per potongan), bukan dari file subject
+        histories = list(self.data_manager.review_log.histories().values())
+
+        scheduler = AdaptiveScheduler.load()
+        progress = QProgressDialog("Menyesuaikan parameter...", "Batal", 0, config.SRS_FIT_ITERATIONS, self.win)
+        progress.setWindowTitle("Penjadwalan Adaptif")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+
+        def report(done, total):
+            progress.setValue(done)
+            return not progress.wasCanceled()
+
+        result = scheduler.fit(histories, progress=report)
+        canceled = progress.wasCanceled()
+        progress.close()
+        if result is None:
+            QMessageBox.information(self.win, "Riwayat Belum Cukup",
+                f"Dibutuhkan minimal {config.SRS_FIT_MIN_REVIEWS} review berulang di log review "
+                "sebelum parameter bisa disesuaikan.")
+            return
+        if canceled:
+            return
+        review_count, initial_loss, final_loss = result
+        scheduler.save()
+        if self.data_manager.adaptive_scheduler is not None:
+            self.data_manager.adaptive_scheduler = scheduler
+        QMessageBox.information(self.win, "Parameter Disesuaikan",
+            f"{review_count} review dari {len(histories)} item dipakai.<br>"
+            f"Log-loss: {initial_loss:.4f} → <b>{final_loss:.4f}</b>")
+
+    def show_repetition_ladder_dialog(self):
+        """Mengatur tangga repetisi global dan per topic, lalu menampilkan ulang content pane."""
+        topic_names = [topic['name'] for topic in self.data_manager.get_topics()]
+        current_topic = os.path.basename(self.win.current_topic_path) if self.win.current_topic_path else None
+        dialog = RepetitionLadderDialog(self.data_manager.repetition_ladders, topic_names, self.win, current_topic)
+        if dialog.exec():
+            self.win.refresh_manager.refresh_content_tree()
+            self.win.status_bar.showMessage("Tangga repetisi disimpan.", 4000)
+
+    def select_subject_path(self, subject_path):
+        """Memilih topic dan subject dari path file subject. True jika berhasil."""
+        topic_name = os.path.basename(os.path.dirname(subject_path))
+        subject_name = os.path.splitext(os.path.basename(subject_path))[0]
+
+        for i in range(self.win.topic_list.count()):
+            if self.win.topic_list.item(i).text().split(" ", 1)[1] == topic_name:
+                self.win.topic_list.setCurrentRow(i)
+                break
+        else:
+            return False
+        for i in range(self.win.subject_list.count()):
+            if self.win.subject_list.item(i).data(Qt.ItemDataRole.UserRole) == subject_name:
+                self.win.subject_list.setCurrentRow(i)
+                return True
+        return False
+
+    def select_content_item(self, item_data):
+        """Memilih diskusi/point di content pane; memberi tahu jika tersembunyi oleh filter."""
+        if item_data and self.win.content_tree.select_item_data(item_data, scroll=True):
+            return
+        self.win.status_bar.showMessage("Item ditemukan, tetapi tersembunyi oleh filter yang aktif.", 5000)
 
     def sort_by_column(self, column_index):
         if self.win.sort_column == column_index:
@@ -224,36 +422,26 @@ class ContentHandlers:
         self.win.content_tree.header().setSortIndicator(self.win.sort_column, self.win.sort_order)
         self.win.refresh_manager.refresh_content_tree()
         
-    def get_item_dict(self, item_data):
-        if not item_data: return None
-        content_list = self.win.current_content.get("content", [])
-        try:
-            if item_data["type"] == "discussion":
-                return content_list[item_data["index"]]
-            elif item_data["type"] == "point":
-                return content_list[item_data["parent_index"]]["points"][item_data["index"]]
-        except (IndexError, KeyError):
+    def get_item_location(self, item_data):
+        """
+        Lokasi (indeks diskusi, indeks point) item di current_content, dicari lewat
+        ID-nya di peta yang dibangun saat refresh. Peta hanya dibangun ulang jika
+        sudah usang (konten berubah sejak refresh terakhir).
+        """
+        if not item_data or not self.win.current_content: return None
+        item_id = item_data.get("id")
+        location = self.win.content_locations.get(item_id)
+        item = content_ids.item_at(self.win.current_content, location) if location else None
+        if item is None or item.get(content_ids.ID_KEY) != item_id:
+            self.win.content_locations = content_ids.build_location_map(self.win.current_content)
+            location = self.win.content_locations.get(item_id)
+        if location is None:
             return None
-        return None
-
-    def create_repetition_combobox(self, item, column, current_code, item_data):
-        combo = QComboBox()
-        combo.addItems(config.REPETITION_CODES)
-        if current_code:
-             combo.setCurrentText(current_code)
-        
-        item_dict = self.get_item_dict(item_data)
-        can_have_date = False
-        if item_data.get("type") == "point":
-            can_have_date = True
-        elif item_data.get("type") == "discussion" and not (item_dict and item_dict.get("points")):
-            can_have_date = True
-        
-        combo.setEnabled(can_have_date)
-
-        if can_have_date:
-            combo.currentTextChanged.connect(
-                lambda new_code, data=item_data: self.repetition_code_changed(new_code, data)
-            )
+        if (item_data.get("type") == "discussion") != (location[1] == DISCUSSION_LOCATION):
+            return None
+        return location
 
-        self.win.content_tree.setItemWidget(item, column, combo)
\ No newline at end of file
+    def get_item_dict(self, item_data):
+        location = self.get_item_location(item_data)
+        if not location: return None
+        return content_ids.item_at(self.win.current_content, location)
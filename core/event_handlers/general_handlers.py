@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from PyQt6.QtWidgets import QMessageBox, QFileDialog
+from core.refresh_manager.panes import BUTTONS
 
 class GeneralHandlers:
     """Berisi handler untuk fungsionalitas umum dan utilitas."""
@@ -63,6 +64,13 @@ class GeneralHandlers:
                 )
 
     def update_button_states(self):
+        """
+        Meminta status tombol diperbarui. Dipanggil dari banyak refresh dan sinyal
+        pilihan, jadi pembaruannya digabung menjadi sekali per putaran event loop.
+        """
+        self.win.refresh_manager.request_refresh(BUTTONS)
+
+    def apply_button_states(self):
         """Memperbarui status aktif/nonaktif semua tombol berdasarkan konteks."""
         topic_selected = self.win.topic_list.currentItem() is not None
         subject_selected = self.win.subject_list.currentItem() is not None
@@ -78,20 +86,18 @@ class GeneralHandlers:
         self.win.btn_change_subject_icon.setEnabled(subject_selected)
         
         # Tombol Content
-        item = self.win.content_tree.currentItem()
+        data = self.win.content_tree.current_item_data()
         disc_sel, point_sel, item_can_have_date, item_can_be_finished = False, False, False, False
-        if item and subject_selected:
-            data = item.data(0, self.win.Qt.ItemDataRole.UserRole)
-            if data:
-                item_dict = self.get_item_dict(data)
-                item_can_be_finished = True
-                if data.get("type") == "discussion":
-                    disc_sel = True
-                    if not (item_dict and item_dict.get("points")):
-                        item_can_have_date = True
-                elif data.get("type") == "point":
-                    point_sel, disc_sel = True, True
+        if data and subject_selected:
+            item_dict = self.get_item_dict(data)
+            item_can_be_finished = True
+            if data.get("type") == "discussion":
+                disc_sel = True
+                if not (item_dict and item_dict.get("points")):
                     item_can_have_date = True
+            elif data.get("type") == "point":
+                point_sel, disc_sel = True, True
+                item_can_have_date = True
         
         self.win.btn_tambah_diskusi.setEnabled(subject_selected)
         self.win.btn_edit_diskusi.setEnabled(disc_sel and not point_sel)
@@ -23,6 +23,11 @@ class SubjectHandlers:
             subject_file_name = f"{subject_name}.json"
             self.win.current_subject_path = os.path.join(self.win.current_topic_path, subject_file_name)
             self.win.refresh_manager.refresh_content_tree()
+            counts = self.due_summary().counts()
+            self.win.status_bar.showMessage(
+                f"{subject_name}: {counts['overdue']} terlambat, {counts['today']} jatuh tempo hari ini, "
+                f"{counts['upcoming']} mendatang", 5000
+            )
         self.update_button_states()
 
     def create_subject(self):
@@ -37,7 +42,7 @@ class SubjectHandlers:
 
             file_path = os.path.join(self.win.current_topic_path, f"{name}.json")
 
-            if os.path.exists(file_path):
+            if self.data_manager.content_exists(file_path):
                 QMessageBox.warning(self.win, "Gagal", f"Subject dengan nama '{name}' sudah ada.")
                 return
 
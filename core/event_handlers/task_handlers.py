@@ -39,15 +39,7 @@ class TaskHandlers:
         old_task_name = task_info.get("original_name")
         category_name = task_info.get("category")
 
-        tasks_data = self.data_manager.load_tasks_data()
-        original_task_data = None
-        for cat in tasks_data.get("categories", []):
-            if cat['name'] == category_name:
-                for task in cat.get("tasks", []):
-                    if task['name'] == old_task_name:
-                        original_task_data = task
-                        break
-                break
+        original_task_data = self.data_manager.get_task(category_name, old_task_name)
         
         if not original_task_data:
             QMessageBox.warning(self.win, "Error", "Data task tidak ditemukan.")
@@ -95,23 +87,11 @@ class TaskHandlers:
         category_name = task_info.get("category")
         current_index = task_info.get("index")
         
-        tasks_data = self.data_manager.load_tasks_data()
-        categories = tasks_data.get("categories", [])
-
-        for category in categories:
-            if category['name'] == category_name:
-                tasks = category.get("tasks", [])
-                if 0 <= current_index < len(tasks):
-                    new_index = current_index + direction
-                    if 0 <= new_index < len(tasks):
-                        tasks[current_index], tasks[new_index] = tasks[new_index], tasks[current_index]
-                        self.data_manager.save_tasks_data(tasks_data)
-                        
-                        self.win.refresh_manager.refresh_task_list()
-                        new_item_to_select = self.win.task_tree.topLevelItem(new_index)
-                        if new_item_to_select:
-                            self.win.task_tree.setCurrentItem(new_item_to_select)
-                        break
+        if self.data_manager.move_task(category_name, current_index, current_index + direction):
+            self.win.refresh_manager.refresh_task_list()
+            new_item_to_select = self.win.task_tree.topLevelItem(current_index + direction)
+            if new_item_to_select:
+                self.win.task_tree.setCurrentItem(new_item_to_select)
 
     def task_item_changed(self, item, column):
         """Handler saat status checklist sebuah task diubah."""
@@ -123,11 +103,4 @@ class TaskHandlers:
             task_name = task_info.get("original_name")
             is_checked = item.checkState(0) == Qt.CheckState.Checked
 
-            tasks_data = self.data_manager.load_tasks_data()
-            for category in tasks_data.get("categories", []):
-                if category['name'] == category_name:
-                    for task in category.get("tasks", []):
-                        if task['name'] == task_name:
-                            task['checked'] = is_checked
-                            self.data_manager.save_tasks_data(tasks_data)
-                            return
\ No newline at end of file
+            self.data_manager.set_task_checked(category_name, task_name, is_checked)
\ No newline at end of file
@@ -0,0 +1,110 @@
+# file: core/live_search.py
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+import config
+
+# Versi pengganti untuk hasil yang dihitung saat indeks subject berubah di tengah query
+_STALE = object()
+
+class _SearchSignals(QObject):
+    """Meneruskan hasil dari thread pekerja ke thread UI."""
+    finished = pyqtSignal(int, str, str, object, object)
+
+class _SearchTask(QRunnable):
+    """Mencocokkan query terhadap indeks pencarian satu subject di thread pekerja."""
+    def __init__(self, live_search, generation, subject_path, query, fuzzy):
+        super().__init__()
+        self.live_search = live_search
+        self.generation = generation
+        self.subject_path = subject_path
+        self.query = query
+        self.fuzzy = fuzzy
+
+    def run(self):
+        # Query yang sudah tergantikan ketikan baru tidak perlu dikerjakan
+        if self.generation != self.live_search.generation:
+            return
+        search_index = self.live_search.search_index
+        try:
+            # Hasil berupa lokasi (indeks diskusi, indeks point), jadi hanya berlaku untuk versi
+            # subject yang dicari; versi dicatat agar hasil dari konten lama bisa dibuang
+            version = search_index.version(self.subject_path)
+            if self.fuzzy:
+                matches = search_index.fuzzy_locations(self.subject_path, self.query)
+            else:
+                matches = search_index.locations(self.subject_path, self.query)
+            if search_index.version(self.subject_path) != version:
+                version = _STALE
+        except Exception as e:
+            print(f"Peringatan: Pencarian '{self.query}' gagal: {e}")
+            return
+        self.live_search.signals.finished.emit(self.generation, self.subject_path, self.query, matches, version)
+
+class LiveSearch:
+    """
+    Pencarian saat mengetik untuk search_content_input.
+
+    Ketikan ditunda (debounce) selama config.LIVE_SEARCH_DEBOUNCE_MS, lalu
+    pencocokan dijalankan di QThreadPool. Setiap query diberi nomor generasi;
+    hanya hasil dari generasi terbaru yang diterapkan ke content_tree, dan hanya
+    jika versi subject di indeks masih sama dengan saat query dijalankan.
+    """
+    def __init__(self, main_window):
+        self.win = main_window
+        self.data_manager = main_window.data_manager
+        self.search_index = main_window.data_manager.search_index
+        self.generation = 0
+        self.pool = QThreadPool()
+        # Satu pekerja cukup: query lama dibatalkan, bukan dijalankan paralel
+        self.pool.setMaxThreadCount(1)
+        self.signals = _SearchSignals()
+        self.signals.finished.connect(self._apply_result)
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(config.LIVE_SEARCH_DEBOUNCE_MS)
+        self.timer.timeout.connect(self.start_search)
+
+    @property
+    def enabled(self):
+        return self.win.settings.value("live_search", True, type=bool)
+
+    def schedule(self):
+        """Dipanggil setiap ketikan; memulai ulang jeda debounce."""
+        if not self.enabled:
+            return
+        self.generation += 1
+        self.timer.start()
+
+    def start_search(self):
+        """Menjalankan query terbaru sekarang juga (juga dipakai saat Enter ditekan)."""
+        self.timer.stop()
+        self.generation += 1
+        query = self.win.search_content_input.text()
+        subject_path = self.win.current_subject_path
+        if not query or not subject_path:
+            # Mengosongkan query cukup murah, langsung terapkan di thread UI
+            self.win.search_query = query
+            self.win.refresh_manager.refresh_content_tree()
+            return
+        # Indeks subject disegarkan di thread UI (butuh cache konten); pencocokan di thread pekerja
+        self.data_manager.ensure_subject_indexed(subject_path)
+        fuzzy = self.win.settings.value("fuzzy_search", False, type=bool)
+        self.pool.start(_SearchTask(self, self.generation, subject_path, query, fuzzy))
+
+    def _apply_result(self, generation, subject_path, query, matches, version):
+        if generation != self.generation:
+            return
+        if subject_path != self.win.current_subject_path or version != self.search_index.version(subject_path):
+            # Subject berganti atau disimpan selama query berjalan (lokasinya bisa sudah
+            # bergeser); ulangi untuk konten yang sekarang
+            self.start_search()
+            return
+        self.win.search_query = query
+        self.win.refresh_manager.refresh_content_tree(search_matches=matches)
+
+    def stop(self):
+        """Membatalkan query yang tertunda dan menunggu pekerja selesai."""
+        self.timer.stop()
+        self.generation += 1
+        self.pool.waitForDone()
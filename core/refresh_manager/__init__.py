@@ -1,13 +1,25 @@
 # file: core/refresh_manager/__init__.py
 
+from PyQt6.QtCore import QTimer
 from .topic_refresher import TopicRefresher
 from .subject_refresher import SubjectRefresher
 from .content_refresher import ContentRefresher
 from .task_refresher import TaskRefresher
 from .task_category_refresher import TaskCategoryRefresher
+from .panes import TOPICS, SUBJECTS, CONTENT, TASK_CATEGORIES, TASKS, BUTTONS, PANE_ORDER
 
 class RefreshManager:
-    """Kelas untuk mengelola semua operasi refresh UI."""
+    """
+    Kelas untuk mengelola semua operasi refresh UI.
+
+    Refresh yang tidak perlu langsung terlihat oleh pemanggilnya diminta lewat
+    request_refresh(): panelnya hanya ditandai kotor lalu di-refresh sekali saat
+    kembali ke event loop (QTimer 0 ms), berapa kali pun diminta dalam satu aksi.
+    Method refresh_*() tetap langsung dijalankan untuk pemanggil yang segera
+    membaca isi widget, dan sekaligus membatalkan permintaan tertunda untuk
+    panel yang sama. Permintaan yang tergabung atau batal dihitung di
+    suppressed_refreshes untuk dialog diagnostik.
+    """
     def __init__(self, main_window):
         self.win = main_window
         self.data_manager = main_window.data_manager
@@ -20,36 +32,105 @@ class RefreshManager:
         self.task = TaskRefresher(main_window)
         self.task_category = TaskCategoryRefresher(main_window)
 
+        self._dirty = set()
+        self._flush_scheduled = False
+        self._flushing = False
+        self._stopped = False
+        self.refreshes_run = 0
+        self.suppressed_refreshes = 0
+
+    # --- Refresh Tertunda ---
+
+    def request_refresh(self, *panes):
+        """Menandai panel kotor; semuanya di-refresh sekali pada putaran event loop berikutnya."""
+        if self._stopped:
+            return
+        for pane in panes:
+            if pane in self._dirty:
+                self.suppressed_refreshes += 1
+            else:
+                self._dirty.add(pane)
+        if self._dirty and not self._flush_scheduled and not self._flushing:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """Menjalankan semua refresh tertunda sekarang, sesuai PANE_ORDER."""
+        self._flush_scheduled = False
+        if self._flushing:
+            return
+        self._flushing = True
+        try:
+            # Refresh satu panel bisa meminta panel lain (mis. status tombol); ulangi sampai bersih
+            while self._dirty:
+                pane = next(pane for pane in PANE_ORDER if pane in self._dirty)
+                self._dirty.discard(pane)
+                self._run(pane)
+        finally:
+            self._flushing = False
+
+    def stop(self):
+        """Membuang refresh tertunda saat jendela ditutup (penyimpanan sudah/akan ditutup)."""
+        self._stopped = True
+        self.suppressed_refreshes += len(self._dirty)
+        self._dirty.clear()
+
+    def _run(self, pane):
+        self.refreshes_run += 1
+        if pane == TOPICS:
+            self.topic.refresh_topic_list()
+        elif pane == SUBJECTS:
+            self.subject.refresh_subject_list()
+        elif pane == CONTENT:
+            self.content.refresh_content_tree()
+        elif pane == TASK_CATEGORIES:
+            self.task_category.refresh_task_category_list()
+        elif pane == TASKS:
+            self.task.refresh_task_list()
+        elif pane == BUTTONS:
+            self.win.handlers.apply_button_states()
+
+    def _refreshing_now(self, pane):
+        """Dipanggil sebelum refresh langsung: permintaan tertunda untuk panel ini tidak perlu lagi."""
+        if pane in self._dirty:
+            self._dirty.discard(pane)
+            self.suppressed_refreshes += 1
+        self.refreshes_run += 1
+
     def refresh_all_views(self):
-        """Memanggil semua fungsi refresh."""
-        self.topic.refresh_topic_list()
-        self.subject.refresh_subject_list()
-        self.content.refresh_content_tree()
-        self.task_category.refresh_task_category_list()
-        self.task.refresh_task_list()
+        """Meminta refresh semua panel (dijalankan sekali di putaran event loop berikutnya)."""
+        self.request_refresh(*PANE_ORDER)
 
     def save_and_refresh_content(self):
         """Menyimpan konten saat ini dan merefresh tampilan."""
         self.win.handlers.update_earliest_date_in_metadata()
         self.data_manager.save_content(self.win.current_subject_path, self.win.current_content)
-        self.content.refresh_content_tree()
-        self.subject.refresh_subject_list()
+        self.refresh_content_tree()
+        # Daftar subject hanya menampilkan ringkasan tanggal; cukup di-refresh sekali per aksi
+        self.request_refresh(SUBJECTS)
         
     def reselect_task(self, task_name_to_select, category_name_to_select):
         """Memilih kembali item task setelah operasi."""
         self.task.reselect_task(task_name_to_select, category_name_to_select)
 
+    # --- Refresh Langsung ---
+
     def refresh_topic_list(self):
+        self._refreshing_now(TOPICS)
         self.topic.refresh_topic_list()
 
     def refresh_subject_list(self):
+        self._refreshing_now(SUBJECTS)
         self.subject.refresh_subject_list()
 
-    def refresh_content_tree(self):
-        self.content.refresh_content_tree()
+    def refresh_content_tree(self, search_matches=None):
+        self._refreshing_now(CONTENT)
+        self.content.refresh_content_tree(search_matches)
 
     def refresh_task_category_list(self):
+        self._refreshing_now(TASK_CATEGORIES)
         self.task_category.refresh_task_category_list()
 
     def refresh_task_list(self):
+        self._refreshing_now(TASKS)
         self.task.refresh_task_list()
\ No newline at end of file
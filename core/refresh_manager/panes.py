@@ -0,0 +1,13 @@
+# file: core/refresh_manager/panes.py
+
+# Nama panel untuk RefreshManager.request_refresh()
+TOPICS = "topics"
+SUBJECTS = "subjects"
+CONTENT = "content"
+TASK_CATEGORIES = "task_categories"
+TASKS = "tasks"
+BUTTONS = "buttons"
+
+# Urutan flush: panel induk dulu agar panel turunannya membaca pilihan terbaru,
+# status tombol terakhir karena hampir semua refresh memintanya
+PANE_ORDER = (TOPICS, SUBJECTS, CONTENT, TASK_CATEGORIES, TASKS, BUTTONS)
@@ -1,34 +1,12 @@
 # file: core/refresh_manager/sorting.py
-from datetime import datetime
+from core.repetition_ladders import DEFAULT_LADDER
 
-def get_content_sort_key(item_data):
+def get_content_sort_key(record, ladder=DEFAULT_LADDER):
     """
-    Menghasilkan kunci pengurutan untuk diskusi atau poin.
-    - Prioritas 1: Kode repetisi (R0D, R1D, ..., Finish). 'Finish' akan dianggap paling akhir.
-    - Prioritas 2: Tanggal (terlama ke terbaru).
+    Menghasilkan kunci pengurutan untuk diskusi atau poin (Discussion/Point).
+    - Prioritas 1: Peringkat kode repetisi di tangga subject (urutan tangga, 'Finish' paling akhir).
+    - Prioritas 2: Tanggal (terlama ke terbaru), memakai ordinal yang sudah diurai saat dimuat.
+    Peringkat diambil dari tabel tangga yang sudah dikompilasi, jadi R7D2 berada
+    di antara R7D dan R7D3, bukan dianggap 72.
     """
-    repetition_code = item_data.get("repetition_code")
-    date_str = item_data.get("date")
-
-    # Memberikan nilai default yang besar untuk item tanpa tanggal atau dengan kode 'Finish'
-    # agar mereka diletakkan di akhir.
-    order_key = float('inf')
-    date_key = datetime.max
-
-    if repetition_code and repetition_code != "Finish":
-        try:
-            numeric_part = ''.join(filter(str.isdigit, repetition_code))
-            if numeric_part:
-                order_key = int(numeric_part)
-            else:
-                order_key = float('inf')
-        except (ValueError, TypeError):
-            order_key = float('inf')
-
-    if date_str:
-        try:
-            date_key = datetime.strptime(date_str, "%Y-%m-%d")
-        except (ValueError, TypeError):
-            date_key = datetime.max
-
-    return (order_key, date_key)
\ No newline at end of file
+    return ladder.sort_key(record)
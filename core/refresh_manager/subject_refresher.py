@@ -1,6 +1,9 @@
 # file: core/refresh_manager/subject_refresher.py
 from PyQt6.QtWidgets import QListWidgetItem
+from PyQt6.QtCore import Qt
+import config
 import utils
+from core.row_diff import diff_keyed_rows
 
 class SubjectRefresher:
     def __init__(self, main_window):
@@ -9,26 +12,53 @@ class SubjectRefresher:
         self.settings = main_window.settings
 
     def refresh_subject_list(self):
-        current_item_text = self.win.subject_list.currentItem().text() if self.win.subject_list.currentItem() else None
-        self.win.subject_list.blockSignals(True)
-        self.win.subject_list.clear()
+        """
+        Menyamakan daftar subject dengan data terbaru. Item diidentifikasi lewat
+        nama subject; hanya item yang berubah, pindah, hilang, atau baru yang disentuh.
+        Jika perubahannya terlalu banyak, daftar diisi ulang dari awal.
+        """
+        subject_list = self.win.subject_list
+        current_item = subject_list.currentItem()
+        current_name = current_item.data(Qt.ItemDataRole.UserRole) if current_item else None
+        subject_list.blockSignals(True)
 
         subjects = self.data_manager.get_subjects(self.win.current_topic_path)
-        item_to_reselect = None
         date_format = self.settings.value("date_format", "long")
 
+        display_texts = {}
         for name, date, code, icon in subjects:
             display_text = f"{icon} {name}"
             if date and code:
                 formatted_date = utils.format_date(date, date_format)
                 display_text += f"\n  ({formatted_date} - {code})"
+            display_texts[name] = display_text
+        new_names = [name for name, _, _, _ in subjects]
+
+        old_names = [subject_list.item(row).data(Qt.ItemDataRole.UserRole) for row in range(subject_list.count())]
+        ops = diff_keyed_rows(old_names, new_names, config.SUBJECT_LIST_DIFF_MAX_ROW_CHANGES)
+        if ops is None:
+            subject_list.clear()
+            ops = [("insert", row, name) for row, name in enumerate(new_names)]
+        for op in ops:
+            if op[0] == "remove":
+                subject_list.takeItem(op[1])
+            elif op[0] == "move":
+                subject_list.insertItem(op[2], subject_list.takeItem(op[1]))
+            else:
+                item = QListWidgetItem(display_texts[op[2]])
+                item.setData(Qt.ItemDataRole.UserRole, op[2])
+                subject_list.insertItem(op[1], item)
 
-            item = QListWidgetItem(display_text)
-            self.win.subject_list.addItem(item)
-            if display_text == current_item_text:
+        item_to_reselect = None
+        for row, name in enumerate(new_names):
+            item = subject_list.item(row)
+            if item.text() != display_texts[name]:
+                item.setText(display_texts[name])
+            if name == current_name:
                 item_to_reselect = item
 
-        if item_to_reselect:
-            self.win.subject_list.setCurrentItem(item_to_reselect)
+        # takeItem bisa memindahkan pilihan; pulihkan berdasarkan nama subject
+        if item_to_reselect and subject_list.currentItem() is not item_to_reselect:
+            subject_list.setCurrentItem(item_to_reselect)
 
-        self.win.subject_list.blockSignals(False)
\ No newline at end of file
+        subject_list.blockSignals(False)
\ No newline at end of file
@@ -1,5 +1,6 @@
 # file: core/refresh_manager/task_category_refresher.py
 from PyQt6.QtWidgets import QListWidgetItem
+from .panes import TASKS, BUTTONS
 
 class TaskCategoryRefresher:
     def __init__(self, main_window):
@@ -39,5 +40,8 @@ class TaskCategoryRefresher:
             self.win.task_category_list.setCurrentRow(0)
 
         self.win.task_category_list.blockSignals(False)
+        # Sinyal pilihan diblokir di atas; samakan kategori aktif lalu minta daftar task
+        # di-refresh sekali saja (pemanggil yang lalu memilih kategori lain tidak memicu refresh ganda)
         if self.win.task_category_list.currentItem():
-             self.win.handlers.task_category_selected(self.win.task_category_list.currentItem(), None)
\ No newline at end of file
+            self.win.current_task_category = self.win.handlers.task_category_name(self.win.task_category_list.currentItem())
+            self.win.refresh_manager.request_refresh(TASKS, BUTTONS)
\ No newline at end of file
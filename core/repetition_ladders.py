@@ -0,0 +1,165 @@
+# file: core/repetition_ladders.py
+
+import os
+import json
+
+import config
+
+FINISH_CODE = "Finish"
+
+# Item tanpa tanggal valid diurutkan setelah semua tanggal (pengganti float('inf'))
+NO_DATE_ORDINAL = 10 ** 7
+
+def _normalize_steps(steps):
+    """
+    Memeriksa dan merapikan anak tangga [(kode, hari)]. Mengembalikan list baru;
+    ValueError dengan pesan yang bisa ditampilkan jika ada yang tidak valid.
+    """
+    normalized = []
+    seen = set()
+    for code, days in steps:
+        code = str(code or "").strip()
+        if not code:
+            raise ValueError("Kode repetisi tidak boleh kosong.")
+        if code in seen:
+            raise ValueError(f"Kode '{code}' muncul lebih dari sekali.")
+        seen.add(code)
+        if code == FINISH_CODE:
+            continue
+        try:
+            days = int(days)
+        except (TypeError, ValueError):
+            raise ValueError(f"Jumlah hari untuk kode '{code}' harus berupa bilangan bulat.")
+        if days < 0:
+            raise ValueError(f"Jumlah hari untuk kode '{code}' tidak boleh negatif.")
+        normalized.append((code, days))
+    if not normalized:
+        raise ValueError("Tangga repetisi minimal berisi satu kode selain 'Finish'.")
+    return normalized
+
+class RepetitionLadder:
+    """
+    Satu tangga repetisi yang sudah dikompilasi menjadi tabel peringkat dan interval.
+
+    Urutan kode di tangga adalah urutan pengurutan di content pane, jadi kunci
+    urutnya cukup perbandingan bilangan bulat. "Finish" selalu anak tangga
+    terakhir; kode yang tidak dikenal (mis. dari tangga topic lain) diletakkan
+    sebelum "Finish", dan item tanpa kode bersama "Finish".
+    """
+    __slots__ = ("steps", "codes", "ranks", "intervals", "unknown_rank")
+
+    def __init__(self, steps):
+        self.steps = _normalize_steps(steps)
+        self.codes = [code for code, _ in self.steps] + [FINISH_CODE]
+        self.intervals = dict(self.steps)
+        self.unknown_rank = len(self.steps)
+        self.ranks = {code: rank for rank, code in enumerate(self.codes[:-1])}
+        self.ranks[FINISH_CODE] = self.ranks[None] = self.ranks[""] = self.unknown_rank + 1
+
+    @classmethod
+    def from_config(cls):
+        """Tangga bawaan dari config.REPETITION_CODES dan config.REPETITION_CODES_DAYS."""
+        return cls([(code, config.REPETITION_CODES_DAYS.get(code, 0))
+                    for code in config.REPETITION_CODES if code != FINISH_CODE])
+
+    def rank(self, code):
+        return self.ranks.get(code, self.unknown_rank)
+
+    def interval(self, code):
+        """Jumlah hari sampai review berikutnya; kode yang tidak dikenal dijadwalkan hari ini."""
+        return self.intervals.get(code, 0)
+
+    def sort_key(self, record):
+        """Kunci urut (peringkat kode, ordinal tanggal) untuk diskusi atau point."""
+        ordinal = record.date
+        return (self.ranks.get(record.repetition_code, self.unknown_rank),
+                ordinal if isinstance(ordinal, int) else NO_DATE_ORDINAL)
+
+    def to_json(self):
+        return [{"code": code, "days": days} for code, days in self.steps]
+
+    @classmethod
+    def from_json(cls, steps):
+        return cls([(step.get("code"), step.get("days")) for step in steps])
+
+DEFAULT_LADDER = RepetitionLadder.from_config()
+
+class RepetitionLadders:
+    """
+    Tangga repetisi global dan per topic, disimpan di config.REPETITION_LADDERS_PATH.
+
+    Tangga dikompilasi sekali saat dimuat atau diubah; sorting, penjadwalan, dan
+    editor kode hanya mengambil tangga yang sudah jadi lewat ladder_for_subject().
+    Topic tanpa tangga sendiri memakai tangga global, yang bawaannya berasal dari
+    config.REPETITION_CODES.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.default = DEFAULT_LADDER
+        self.topics = {}  # nama topic -> RepetitionLadder
+        self.load()
+
+    def load(self):
+        self.default = DEFAULT_LADDER
+        self.topics = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("default"):
+                self.default = RepetitionLadder.from_json(data["default"])
+            for topic_name, steps in (data.get("topics") or {}).items():
+                self.topics[topic_name] = RepetitionLadder.from_json(steps)
+        except (json.JSONDecodeError, IOError, AttributeError, ValueError) as e:
+            print(f"Peringatan: Tangga repetisi di '{self.path}' tidak bisa dibaca, memakai bawaan: {e}")
+
+    def save(self):
+        data = {"topics": {name: ladder.to_json() for name, ladder in sorted(self.topics.items())}}
+        if self.default is not DEFAULT_LADDER:
+            data["default"] = self.default.to_json()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+    # --- Pencarian Tangga ---
+
+    def ladder_for_topic(self, topic_name):
+        return self.topics.get(topic_name, self.default)
+
+    def ladder_for_subject(self, subject_path):
+        """Tangga untuk subject (topic-nya adalah folder induk path subject)."""
+        if not subject_path:
+            return self.default
+        return self.ladder_for_topic(os.path.basename(os.path.dirname(subject_path)))
+
+    def all_codes(self):
+        """Semua kode dari tangga global lalu tangga topic, tanpa duplikat, "Finish" di akhir."""
+        codes = list(self.default.codes[:-1])
+        for ladder in self.topics.values():
+            codes.extend(code for code in ladder.codes[:-1] if code not in codes)
+        return codes + [FINISH_CODE]
+
+    # --- Perubahan ---
+
+    def set_default(self, steps):
+        """steps None mengembalikan tangga global ke bawaan config."""
+        self.default = DEFAULT_LADDER if steps is None else RepetitionLadder(steps)
+        self.save()
+
+    def set_topic(self, topic_name, steps):
+        """steps None membuat topic kembali memakai tangga global."""
+        if steps is None:
+            self.topics.pop(topic_name, None)
+        else:
+            self.topics[topic_name] = RepetitionLadder(steps)
+        self.save()
+
+    def rename_topic(self, old_name, new_name):
+        if old_name in self.topics:
+            self.topics[new_name] = self.topics.pop(old_name)
+            self.save()
+
+    def remove_topic(self, topic_name):
+        if self.topics.pop(topic_name, None) is not None:
+            self.save()
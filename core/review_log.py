@@ -0,0 +1,239 @@
+# file: core/review_log.py
+
+import os
+import json
+import time
+from datetime import date
+
+import config
+
+# Versi format file agregat; agregat dengan versi lain dibangun ulang dari log
+_AGGREGATES_VERSION = 1
+
+def _empty_aggregates():
+    return {"version": _AGGREGATES_VERSION, "offset": 0, "total": 0,
+            "days": {}, "new_codes": {}, "topics": {}}
+
+def _entry_day(entry):
+    return date.fromtimestamp(entry["ts"]).toordinal()
+
+def make_entry(subject_path, item_id, old_code, new_code, interval, grade=None, timestamp=None):
+    """
+    Satu baris log: waktu (detik epoch), path subject, ID item, kode lama dan baru,
+    interval ke tanggal berikutnya (None jika selesai), dan jawaban review 1-4
+    (None untuk "Finish" dan perubahan yang bukan hasil review).
+    """
+    return {
+        "ts": int(timestamp if timestamp is not None else time.time()),
+        "path": subject_path,
+        "id": item_id,
+        "old": old_code,
+        "new": new_code,
+        "interval": interval,
+        "grade": grade,
+    }
+
+def make_rename_entry(old_path, new_path, is_topic, timestamp=None):
+    """
+    Baris log untuk topic atau subject yang diganti namanya. Entri sebelumnya tetap
+    memakai path lama; pembaca log menerapkan rename ini sesuai urutan sehingga
+    riwayat item dan statistik per topic berpindah ke nama baru.
+    """
+    return {
+        "ts": int(timestamp if timestamp is not None else time.time()),
+        "rename": [old_path, new_path],
+        "topic": bool(is_topic),
+    }
+
+def _renamed_path(path, old_prefix, new_prefix):
+    """path setelah old_prefix diganti new_prefix, atau None jika path tidak berada di bawahnya."""
+    if path == old_prefix:
+        return new_prefix
+    if path and path.startswith(old_prefix + os.sep):
+        return new_prefix + path[len(old_prefix):]
+    return None
+
+class ReviewLog:
+    """
+    Log review append-only dalam format JSON per baris (config.REVIEW_LOG_PATH).
+
+    Baris lama tidak pernah diubah. Agregat harian (jumlah review per hari, per
+    kode baru, dan review/lupa per topic) disimpan terpisah bersama offset byte
+    terakhir yang sudah dihitung, sehingga membuka statistik hanya membaca file
+    agregat ditambah baris yang ditulis sejak itu, berapa pun panjang log-nya.
+    Pembacaan log dilakukan per potongan (config.REVIEW_LOG_CHUNK_BYTES).
+    Rename topic/subject dicatat sebagai baris tersendiri (make_rename_entry).
+    """
+    def __init__(self, path, aggregates_path):
+        self.path = path
+        self.aggregates_path = aggregates_path
+        self._aggregates = None  # dimuat saat pertama kali dibutuhkan
+        self._dirty = False
+
+    # --- Penulisan ---
+
+    def append(self, entries):
+        """Menambahkan entri ke akhir log; agregat yang sudah dimuat ikut diperbarui."""
+        if not entries:
+            return
+        lines = "".join(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n" for entry in entries)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._repair_tail()
+        start = self._size()
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+        aggregates = self._aggregates
+        if aggregates is not None and aggregates["offset"] == start:
+            for entry in entries:
+                self._add(aggregates, entry)
+            aggregates["offset"] = self._size()
+            self._dirty = True
+
+    def record_rename(self, old_path, new_path, is_topic):
+        """Mencatat rename topic atau subject agar riwayatnya ikut pindah ke path baru."""
+        self.append([make_rename_entry(old_path, new_path, is_topic)])
+
+    def _repair_tail(self):
+        """
+        Memotong baris terakhir yang tidak lengkap (crash saat append) agar entri
+        berikutnya tidak menempel padanya. Hanya ekor file yang dibaca.
+        """
+        size = self._size()
+        if not size:
+            return
+        with open(self.path, "r+b") as f:
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            end = size
+            while end > 0:
+                start = max(0, end - config.REVIEW_LOG_CHUNK_BYTES)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            f.truncate(end)
+        print("Peringatan: Baris terakhir log review tidak lengkap dan dibuang.")
+
+    # --- Pembacaan ---
+
+    def _size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def iter_entries(self, start=0, chunk_size=None):
+        """
+        Menghasilkan (offset akhir baris, entri) mulai dari offset byte start,
+        dibaca per potongan. Baris terakhir yang belum lengkap dilewati.
+        """
+        if not os.path.exists(self.path):
+            return
+        chunk_size = chunk_size or config.REVIEW_LOG_CHUNK_BYTES
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            offset = start
+            pending = b""
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                pending += chunk
+                lines = pending.split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    offset += len(line) + 1
+                    if not line.strip():
+                        continue
+                    try:
+                        yield offset, json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        print(f"Peringatan: Baris log review rusak di offset {offset} dilewati.")
+
+    def histories(self):
+        """
+        {(path subject, ID): [(ordinal, jawaban), ...]} dari seluruh log, untuk penyesuaian bobot.
+        Path mengikuti rename yang tercatat, jadi riwayat item di subject yang diganti namanya tetap utuh.
+        """
+        histories = {}
+        for _, entry in self.iter_entries():
+            if "rename" in entry:
+                old_prefix, new_prefix = entry["rename"]
+                for key in list(histories):
+                    new_path = _renamed_path(key[0], old_prefix, new_prefix)
+                    if new_path is not None:
+                        histories.setdefault((new_path, key[1]), []).extend(histories.pop(key))
+            elif entry.get("grade"):
+                histories.setdefault((entry.get("path"), entry.get("id")), []).append((_entry_day(entry), entry["grade"]))
+        return histories
+
+    # --- Agregat ---
+
+    @staticmethod
+    def _add(aggregates, entry):
+        if "rename" in entry:
+            # Statistik per topic disimpan per nama topic; rename subject tidak mengubahnya
+            if entry.get("topic"):
+                old_topic, new_topic = (os.path.basename(path) for path in entry["rename"])
+                moved = aggregates["topics"].pop(old_topic, None)
+                if moved:
+                    topic_stats = aggregates["topics"].setdefault(new_topic, {"reviews": 0, "lapses": 0})
+                    topic_stats["reviews"] += moved["reviews"]
+                    topic_stats["lapses"] += moved["lapses"]
+            return
+        aggregates["total"] += 1
+        new_code = entry.get("new") or ""
+        aggregates["new_codes"][new_code] = aggregates["new_codes"].get(new_code, 0) + 1
+        topic = os.path.basename(os.path.dirname(entry.get("path") or ""))
+        topic_stats = aggregates["topics"].setdefault(topic, {"reviews": 0, "lapses": 0})
+        if entry.get("grade"):
+            # Hanya review sungguhan (punya jawaban) yang dihitung per hari
+            day = str(_entry_day(entry))
+            aggregates["days"][day] = aggregates["days"].get(day, 0) + 1
+            topic_stats["reviews"] += 1
+            if entry["grade"] == 1:
+                topic_stats["lapses"] += 1
+
+    def _load_aggregates(self):
+        aggregates = None
+        if os.path.exists(self.aggregates_path):
+            try:
+                with open(self.aggregates_path, "r", encoding="utf-8") as f:
+                    aggregates = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Peringatan: Agregat log review tidak bisa dibaca, dihitung ulang: {e}")
+        # Log yang lebih pendek dari offset berarti file-nya diganti; hitung ulang dari awal
+        if (not isinstance(aggregates, dict) or aggregates.get("version") != _AGGREGATES_VERSION
+                or aggregates.get("offset", 0) > self._size()):
+            aggregates = _empty_aggregates()
+        return aggregates
+
+    def aggregates(self):
+        """
+        Agregat yang sudah mencakup seluruh log: {"total", "days": {ordinal (string): jumlah review},
+        "new_codes": {kode: jumlah}, "topics": {topic: {"reviews", "lapses"}}}.
+        Hanya baris setelah offset yang tersimpan yang dibaca.
+        """
+        if self._aggregates is None:
+            self._aggregates = self._load_aggregates()
+        aggregates = self._aggregates
+        if aggregates["offset"] < self._size():
+            for offset, entry in self.iter_entries(aggregates["offset"]):
+                self._add(aggregates, entry)
+                aggregates["offset"] = offset
+            self._dirty = True
+            self.save_aggregates()
+        return aggregates
+
+    def save_aggregates(self):
+        if self._aggregates is None or not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.aggregates_path) or ".", exist_ok=True)
+        temp_path = self.aggregates_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self._aggregates, f, separators=(",", ":"))
+        os.replace(temp_path, self.aggregates_path)
+        self._dirty = False
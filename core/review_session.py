@@ -0,0 +1,174 @@
+# file: core/review_session.py
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+import config
+from core import content_ids
+from core.content_records import today_ordinal
+from core.due_summary import is_due_item
+from core.scheduling import apply_repetition_code
+
+class _PrefetchSignals(QObject):
+    """Meneruskan subject yang sudah diurai dari thread pekerja ke thread UI."""
+    loaded = pyqtSignal(str, object, object, int)
+
+class _PrefetchTask(QRunnable):
+    """Membaca dan mengurai satu subject di thread pekerja (tanpa menyentuh cache)."""
+    def __init__(self, session, path):
+        super().__init__()
+        self.session = session
+        self.path = path
+
+    def run(self):
+        if self.session.stopped:
+            return
+        try:
+            version, size, data = self.session.data_manager.read_content(self.path)
+        except Exception as e:
+            print(f"Peringatan: Gagal memuat lebih awal '{self.path}': {e}")
+            return
+        self.session.signals.loaded.emit(self.path, version, data, size)
+
+class ReviewSession:
+    """
+    Sesi review untuk semua item yang jatuh tempo di semua topic.
+
+    Urutan diambil dari indeks jatuh tempo: subject dengan item paling lama di
+    depan, lalu item di dalamnya menurut tanggal. Beberapa subject berikutnya
+    (config.REVIEW_PREFETCH_SUBJECTS) dibaca dan diurai di thread pekerja lalu
+    dimasukkan ke cache konten, sehingga berpindah item tidak menunggu disk.
+    Perubahan kode repetisi dikumpulkan per subject dan disimpan sekali saat
+    sesi pindah ke subject lain atau berakhir.
+    """
+    def __init__(self, data_manager, until=None):
+        self.data_manager = data_manager
+        self.stopped = False
+        self.today = today_ordinal()
+        self.balancer = data_manager.load_balancer()
+
+        by_subject = {}
+        for _, path, item_id, _, _, _ in data_manager.get_due_items(until):
+            by_subject.setdefault(path, []).append(item_id)
+        self.subject_paths = list(by_subject)
+        self.queue = [(path, item_id) for path in self.subject_paths for item_id in by_subject[path]]
+        self.position = 0
+        self.reviewed = 0
+
+        self._locations = {}  # path -> {ID: lokasi} untuk konten yang sedang dipakai
+        self._contents = {}  # path -> konten yang dipakai _locations
+        self._pending = {}  # path -> [record yang diubah], belum disimpan
+        self._prefetched = set()
+
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        self.signals = _PrefetchSignals()
+        self.signals.loaded.connect(self._store_prefetched)
+
+        self._skip_missing()
+        self._prefetch_ahead()
+
+    def __len__(self):
+        return len(self.queue)
+
+    @property
+    def finished(self):
+        return self.position >= len(self.queue)
+
+    # --- Item Aktif ---
+
+    def _record(self, path, item_id):
+        """Record item dari konten subject (dari cache jika sudah dimuat lebih awal)."""
+        if path in self._pending:
+            # Subject dengan perubahan yang belum disimpan tetap memakai objek yang sama
+            content = self._contents[path]
+        else:
+            content = self.data_manager.load_content(path)
+        if self._contents.get(path) is not content:
+            self._contents[path] = content
+            self._locations[path] = content_ids.build_location_map(content)
+        location = self._locations[path].get(item_id)
+        return content_ids.item_at(content, location) if location else None
+
+    def current(self):
+        """(path subject, record) item aktif, atau None jika sesi sudah selesai."""
+        if self.finished:
+            return None
+        path, item_id = self.queue[self.position]
+        return path, self._record(path, item_id)
+
+    def _skip_missing(self):
+        """Melewati item yang sudah dihapus atau tidak lagi jatuh tempo sejak indeks dibuat."""
+        while not self.finished:
+            path, record = self.current()
+            if record is not None and is_due_item(record):
+                return
+            self.position += 1
+
+    # --- Jawaban ---
+
+    def answer(self, code):
+        """Menerapkan kode repetisi ke item aktif lalu pindah ke item berikutnya."""
+        current = self.current()
+        if current is None:
+            return
+        path, record = current
+        old_code = record.get("repetition_code")
+        apply_repetition_code(record, code, self.today, self.data_manager.ladder_for(path),
+                              self.data_manager.adaptive_scheduler, self.balancer)
+        self._pending.setdefault(path, []).append(record)
+        self.data_manager.log_reviews(path, [(record, old_code)], self.today)
+        self.reviewed += 1
+        self._advance(path)
+
+    def skip(self):
+        """Pindah ke item berikutnya tanpa mengubah item aktif."""
+        current = self.current()
+        if current is not None:
+            self._advance(current[0])
+
+    def _advance(self, previous_path):
+        self.position += 1
+        self._skip_missing()
+        current = self.current()
+        if current is None or current[0] != previous_path:
+            self.flush(previous_path)
+            self._prefetch_ahead()
+
+    # --- Penyimpanan ---
+
+    def flush(self, path=None):
+        """Menyimpan perubahan yang tertunda: satu kali simpan per subject."""
+        paths = [path] if path is not None else list(self._pending)
+        for subject_path in paths:
+            records = self._pending.pop(subject_path, None)
+            if not records:
+                continue
+            # Objek yang sama dengan yang diubah, walau entrinya sudah keluar dari cache
+            content = self._contents[subject_path]
+            summary = self.data_manager.due_summary(subject_path, content)
+            for record in records:
+                summary.update(record)
+            self.data_manager.update_due_metadata(subject_path, content)
+            self.data_manager.save_content(subject_path, content)
+
+    # --- Prefetch ---
+
+    def _prefetch_ahead(self):
+        current = self.current()
+        if current is None:
+            return
+        start = self.subject_paths.index(current[0])
+        for path in self.subject_paths[start + 1:start + 1 + config.REVIEW_PREFETCH_SUBJECTS]:
+            if path not in self._prefetched:
+                self._prefetched.add(path)
+                self.pool.start(_PrefetchTask(self, path))
+
+    def _store_prefetched(self, path, version, data, size):
+        if not self.stopped:
+            self.data_manager.prime_content(path, version, data, size)
+
+    def stop(self):
+        """Menyimpan semua perubahan dan menunggu pekerja prefetch selesai."""
+        self.stopped = True
+        self.pool.waitForDone()
+        self.flush()
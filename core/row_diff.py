@@ -0,0 +1,118 @@
+# file: core/row_diff.py
+
+import bisect
+
+def longest_increasing_subsequence(values):
+    """Indeks elemen yang membentuk subbarisan naik terpanjang (O(n log n))."""
+    tails, tail_indices = [], []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        pos = bisect.bisect_left(tails, value)
+        if pos > 0:
+            previous[i] = tail_indices[pos - 1]
+        if pos == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[pos] = value
+            tail_indices[pos] = i
+    result = []
+    i = tail_indices[-1] if tail_indices else -1
+    while i != -1:
+        result.append(i)
+        i = previous[i]
+    return set(result)
+
+class _PresenceCounter:
+    """Fenwick tree: menandai slot yang terisi dan menghitung slot terisi sampai posisi tertentu."""
+
+    def __init__(self, size):
+        self._tree = [0] * (size + 1)
+
+    def add(self, slot, delta):
+        slot += 1
+        while slot < len(self._tree):
+            self._tree[slot] += delta
+            slot += slot & -slot
+
+    def count_through(self, slot):
+        """Jumlah slot terisi di posisi 0..slot."""
+        total = 0
+        slot += 1
+        while slot > 0:
+            total += self._tree[slot]
+            slot -= slot & -slot
+        return total
+
+def diff_keyed_rows(old_keys, new_keys, budget=None):
+    """
+    Menghitung operasi minimal untuk mengubah urutan old_keys menjadi new_keys.
+
+    Kunci harus unik di setiap list. Operasi dikembalikan berurutan dan harus
+    diterapkan satu per satu:
+    - ("remove", i): hapus baris i
+    - ("move", i, j): pindahkan baris i sehingga berada di posisi j (posisi setelah baris i diambil)
+    - ("insert", i, key): sisipkan key di posisi i
+    Baris yang urutannya sudah benar (subbarisan naik terpanjang) tidak dipindahkan.
+    Jika budget diberikan dan jumlah operasi melebihinya, mengembalikan None
+    segera setelah batas itu terlewati.
+    """
+    new_positions = {key: i for i, key in enumerate(new_keys)}
+    current = [key for key in old_keys if key in new_positions]
+    present = set(current)
+    removed = len(old_keys) - len(current)
+    inserted = len(new_keys) - len(current)
+    if budget is not None and removed + inserted > budget:
+        return None
+
+    ops = []
+    for i in range(len(old_keys) - 1, -1, -1):
+        if old_keys[i] not in new_positions:
+            ops.append(("remove", i))
+
+    stable = {current[i] for i in longest_increasing_subsequence([new_positions[key] for key in current])}
+
+    # Baris yang dipindah diletakkan tepat setelah pendahulunya di urutan baru, jadi
+    # posisi akhirnya bisa ditentukan di muka: (baris stabil terakhir sebelumnya, urutan
+    # di belakangnya). Posisi baris saat ini dihitung dengan Fenwick tree atas slot-slot
+    # tersebut, bukan dengan list.index, sehingga totalnya O(n log n).
+    original_slot = {key: (i, 0) for i, key in enumerate(current)}
+    moved_slot = {}
+    anchor, run = -1, 0
+    for key in new_keys:
+        if key not in present:
+            continue
+        if key in stable:
+            anchor, run = original_slot[key][0], 0
+        else:
+            run += 1
+            moved_slot[key] = (anchor, run)
+    ordered_slots = sorted(set(original_slot.values()) | set(moved_slot.values()))
+    slot_rank = {slot: rank for rank, slot in enumerate(ordered_slots)}
+    counter = _PresenceCounter(len(ordered_slots))
+    current_rank = {}
+    for key, slot in original_slot.items():
+        current_rank[key] = slot_rank[slot]
+        counter.add(current_rank[key], 1)
+
+    change_budget = None if budget is None else budget - inserted
+    previous_key = None
+    for key in new_keys:
+        if key not in present:
+            continue
+        if key not in stable:
+            source = counter.count_through(current_rank[key]) - 1
+            counter.add(current_rank[key], -1)
+            target = counter.count_through(current_rank[previous_key]) if previous_key is not None else 0
+            current_rank[key] = slot_rank[moved_slot[key]]
+            counter.add(current_rank[key], 1)
+            if target != source:
+                ops.append(("move", source, target))
+                if change_budget is not None and len(ops) > change_budget:
+                    return None
+        previous_key = key
+
+    for i, key in enumerate(new_keys):
+        if key not in present:
+            ops.append(("insert", i, key))
+    return ops
@@ -0,0 +1,75 @@
+# file: core/scheduling.py
+
+from core.content_records import ordinal_to_date, today_ordinal
+from core.repetition_ladders import DEFAULT_LADDER, FINISH_CODE
+from core.adaptive_scheduler import SRS_KEY, grade_for_code
+
+def next_review_date(code, today=None, ladder=None):
+    """Ordinal tanggal review berikutnya untuk sebuah kode (hari ini + interval di tangga repetisi)."""
+    if today is None:
+        today = today_ordinal()
+    return today + (ladder or DEFAULT_LADDER).interval(code)
+
+def _adaptive_review(record, code, today, ladder, scheduler):
+    """(status memori baru, ordinal jatuh tempo) jika kode ini dipilih untuk record."""
+    grade = grade_for_code(ladder or DEFAULT_LADDER, record.get("repetition_code"), code)
+    state = scheduler.review(record.get(SRS_KEY), grade, today)
+    return state, today + scheduler.next_interval(state["stability"])
+
+def preview_review_date(record, code, today=None, ladder=None, scheduler=None, balancer=None):
+    """Ordinal tanggal yang akan dipakai apply_repetition_code, tanpa mengubah record."""
+    if today is None:
+        today = today_ordinal()
+    if scheduler is not None:
+        due = _adaptive_review(record, code, today, ladder, scheduler)[1]
+    else:
+        due = next_review_date(code, today, ladder)
+    return balancer.preview(due) if balancer is not None else due
+
+def apply_repetition_code(record, code, today=None, ladder=None, scheduler=None, balancer=None):
+    """
+    Menerapkan kode repetisi pada diskusi/point. Kode biasa menjadwalkan ulang
+    seperti editor kode di content pane; "Finish" menandai item selesai seperti
+    tombol Selesai. Dengan scheduler (AdaptiveScheduler), perubahan kode dicatat
+    sebagai review dan tanggalnya dihitung dari status memori item. Dengan
+    balancer (LoadBalancer), tanggalnya digeser ke hari yang lebih sepi.
+    """
+    if today is None:
+        today = today_ordinal()
+    if code == FINISH_CODE:
+        finish_item(record, today)
+        return
+    if scheduler is not None:
+        state, due = _adaptive_review(record, code, today, ladder, scheduler)
+        record[SRS_KEY] = state
+    else:
+        due = next_review_date(code, today, ladder)
+    if balancer is not None:
+        due = balancer.choose(due)
+    record["repetition_code"] = code
+    record["date"] = ordinal_to_date(due)
+
+def finish_item(record, today=None):
+    """Menandai item selesai. Status memori adaptif dibiarkan apa adanya."""
+    if today is None:
+        today = today_ordinal()
+    record["finished"] = True
+    record["repetition_code"] = FINISH_CODE
+    record["finished_date"] = ordinal_to_date(today)
+    record["date"] = None
+
+def restart_item(record, today=None, ladder=None):
+    """
+    Membatalkan status selesai: item kembali ke anak tangga pertama dan jatuh tempo
+    hari ini. Stabilitas dan kesulitan adaptif diulang dari awal; jumlah review tetap.
+    """
+    if today is None:
+        today = today_ordinal()
+    record["finished"] = False
+    record["repetition_code"] = (ladder or DEFAULT_LADDER).codes[0]
+    record["date"] = ordinal_to_date(today)
+    if "finished_date" in record:
+        del record["finished_date"]
+    state = record.get(SRS_KEY)
+    if state:
+        record[SRS_KEY] = {key: state[key] for key in ("reps", "lapses") if key in state}
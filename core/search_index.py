@@ -0,0 +1,512 @@
+# file: core/search_index.py
+
+import json
+import os
+import re
+import threading
+
+import config
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Lokasi di dalam subject: (indeks diskusi, indeks point); teks diskusi memakai indeks point -1
+DISCUSSION_LOCATION = -1
+
+# Versi format file indeks yang disimpan; file dengan format lain diabaikan dan indeks dibangun ulang
+_PERSIST_FORMAT = 2
+
+def tokenize(text):
+    """Memecah teks menjadi himpunan token huruf kecil."""
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+def trigrams(text):
+    """
+    Himpunan trigram dari setiap kata (diberi padding seperti pg_trgm), dipakai
+    untuk pencarian fuzzy yang toleran salah ketik dan urutan kata.
+    """
+    grams = set()
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        padded = f"  {token} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+def _vocabulary_grams(token):
+    """Potongan 3 huruf dari sebuah token (tanpa padding), untuk mencari token yang memuat query."""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+def _extract_texts(content):
+    """Mengambil semua teks diskusi dan point dari data subject sebagai {lokasi: teks}."""
+    texts = {}
+    for disc_index, discussion in enumerate((content or {}).get("content", [])):
+        texts[(disc_index, DISCUSSION_LOCATION)] = discussion.get("discussion", "")
+        for point_index, point in enumerate(discussion.get("points", [])):
+            texts[(disc_index, point_index)] = point.get("point_text", "")
+    return texts
+
+class SearchIndex:
+    """
+    Indeks terbalik untuk semua diskusi dan point. Setiap subject menyimpan
+    peta token -> lokasi miliknya sendiri; indeks global (token -> subject ->
+    lokasi) memakai set lokasi yang sama. Pencarian di satu subject hanya
+    menyentuh peta subject itu, bukan posting seluruh koleksi.
+
+    Setiap subject diindeks bersama versinya dari backend penyimpanan, sehingga
+    subject yang tidak berubah tidak perlu dibaca ulang. Pencarian tetap bersifat
+    substring seperti filter lama: token query dicocokkan ke kosakata indeks
+    (lewat indeks potongan 3 huruf dari kosakata) untuk menyaring kandidat, lalu
+    kandidat diverifikasi terhadap teks lengkapnya.
+    Untuk mode fuzzy disimpan juga indeks trigram dengan pola yang sama
+    (per subject, dan trigram -> subject -> lokasi untuk seluruh koleksi)
+    beserta jumlah lokasi per trigram untuk memilih trigram yang paling jarang.
+    Semua akses dilindungi lock karena indeks juga diisi oleh thread latar belakang.
+
+    companions adalah indeks lain (mis. DueIndex) dengan is_current, update_subject,
+    dan prune yang ikut diisi dari pembacaan subject yang sama saat refresh().
+    Lewat export_subject, import_subject, dan PERSIST_FORMAT isinya ikut disimpan
+    ke persist_path bersama teks yang diindeks.
+
+    Jika persist_path diisi, save() menyimpan teks setiap subject beserta versinya
+    dari storage.stable_version(), dan pembaruan latar belakang pertama memuatnya
+    kembali sebelum refresh(), sehingga hanya subject yang berubah sejak aplikasi
+    terakhir ditutup yang dibaca ulang.
+    """
+    def __init__(self, companions=(), persist_path=None):
+        self._companions = list(companions)
+        self.persist_path = persist_path
+        self._lock = threading.RLock()
+        self._postings = {}  # token -> {path: set(lokasi)}, set-nya sama dengan self._subjects[path]["tokens"]
+        self._vocabulary = {}  # potongan 3 huruf -> set(token) yang memuatnya
+        self._trigram_postings = {}  # trigram -> {path: set(lokasi)}, set-nya sama dengan self._subjects[path]["grams"]
+        self._trigram_frequency = {}  # trigram -> jumlah lokasi di seluruh koleksi
+        # path -> {"version", "texts": {lokasi: teks asli}, "lowered": {lokasi: teks kecil},
+        #         "tokens": {token: set(lokasi)}, "grams": {trigram: set(lokasi)},
+        #         "trigram_counts": {lokasi: jumlah trigram}}
+        self._subjects = {}
+        self._refresh_thread = None
+        self._cancelled = False
+        self._persisted_loaded = False
+        # True jika indeks berubah sejak dimuat atau disimpan ke persist_path
+        self._dirty = False
+        self.refreshes = 0
+        self.subjects_reindexed = 0
+        self.subjects_loaded = 0
+
+    @property
+    def building(self):
+        """True selama pembaruan di latar belakang masih berjalan."""
+        thread = self._refresh_thread
+        return thread is not None and thread.is_alive()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._subjects)
+
+    # --- Pembaruan ---
+
+    def is_current(self, path, version):
+        with self._lock:
+            entry = self._subjects.get(path)
+            return entry is not None and version is not None and entry["version"] == version
+
+    def version(self, path):
+        """Versi subject yang sedang diindeks, atau None jika belum diindeks."""
+        with self._lock:
+            entry = self._subjects.get(path)
+            return entry["version"] if entry is not None else None
+
+    def update_subject(self, path, content, version):
+        """Mengindeks ulang satu subject (dipanggil setiap kali subject disimpan)."""
+        self._index_texts(path, _extract_texts(content), version)
+        with self._lock:
+            self._dirty = True
+            self.subjects_reindexed += 1
+
+    def _index_texts(self, path, texts, version, replace=True):
+        """
+        Membangun peta token dan trigram dari {lokasi: teks}. Dengan replace=False
+        subject yang sudah diindeks dibiarkan (dipakai saat memuat indeks tersimpan).
+        Mengembalikan True jika subject diindeks.
+        """
+        lowered = {location: text.lower() for location, text in texts.items()}
+        tokens = {}
+        grams = {}
+        trigram_counts = {}
+        for location, text in lowered.items():
+            for token in _TOKEN_PATTERN.findall(text):
+                tokens.setdefault(token, set()).add(location)
+            location_grams = trigrams(text)
+            trigram_counts[location] = len(location_grams)
+            for gram in location_grams:
+                grams.setdefault(gram, set()).add(location)
+        with self._lock:
+            if not replace and path in self._subjects:
+                return False
+            self._remove_locked(path)
+            self._subjects[path] = {"version": version, "texts": texts, "lowered": lowered, "tokens": tokens,
+                                    "grams": grams, "trigram_counts": trigram_counts}
+            self._add_tokens_locked(path, tokens)
+            self._add_trigrams_locked(path, grams)
+            return True
+
+    def _add_tokens_locked(self, path, tokens):
+        for token, locations in tokens.items():
+            by_path = self._postings.get(token)
+            if by_path is None:
+                # Token baru di kosakata
+                by_path = self._postings[token] = {}
+                for gram in _vocabulary_grams(token):
+                    self._vocabulary.setdefault(gram, set()).add(token)
+            by_path[path] = locations
+
+    def _remove_tokens_locked(self, path, tokens):
+        for token in tokens:
+            by_path = self._postings.get(token)
+            if by_path is None:
+                continue
+            by_path.pop(path, None)
+            if not by_path:
+                del self._postings[token]
+                for gram in _vocabulary_grams(token):
+                    vocabulary_tokens = self._vocabulary.get(gram)
+                    if vocabulary_tokens is not None:
+                        vocabulary_tokens.discard(token)
+                        if not vocabulary_tokens:
+                            del self._vocabulary[gram]
+
+    def _add_trigrams_locked(self, path, grams):
+        for gram, locations in grams.items():
+            self._trigram_postings.setdefault(gram, {})[path] = locations
+            self._trigram_frequency[gram] = self._trigram_frequency.get(gram, 0) + len(locations)
+
+    def _remove_trigrams_locked(self, path, grams):
+        for gram, locations in grams.items():
+            by_path = self._trigram_postings.get(gram)
+            if by_path is None:
+                continue
+            by_path.pop(path, None)
+            if not by_path:
+                del self._trigram_postings[gram]
+                self._trigram_frequency.pop(gram, None)
+            else:
+                self._trigram_frequency[gram] -= len(locations)
+
+    def remove_subject(self, path):
+        with self._lock:
+            self._remove_locked(path)
+
+    def remove_prefix(self, path_prefix):
+        """Menghapus semua subject di bawah sebuah topic (atau satu subject)."""
+        with self._lock:
+            for path in self._paths_under(path_prefix):
+                self._remove_locked(path)
+
+    def rename_prefix(self, old_prefix, new_prefix):
+        """Memindahkan entri indeks setelah topic atau subject diganti namanya."""
+        with self._lock:
+            for old_path in self._paths_under(old_prefix):
+                entry = self._subjects[old_path]
+                new_path = new_prefix + old_path[len(old_prefix):]
+                self._remove_locked(old_path)
+                self._subjects[new_path] = entry
+                self._add_tokens_locked(new_path, entry["tokens"])
+                self._add_trigrams_locked(new_path, entry["grams"])
+
+    def _paths_under(self, path_prefix):
+        prefix = os.path.normpath(path_prefix)
+        return [path for path in self._subjects
+                if os.path.normpath(path) == prefix or os.path.normpath(path).startswith(prefix + os.sep)]
+
+    def _remove_locked(self, path):
+        entry = self._subjects.pop(path, None)
+        if entry is None:
+            return
+        self._dirty = True
+        self._remove_tokens_locked(path, entry["tokens"])
+        self._remove_trigrams_locked(path, entry["grams"])
+
+    # --- Pembaruan Latar Belakang ---
+
+    def refresh(self, storage):
+        """
+        Menyamakan indeks (dan companions) dengan isi penyimpanan: subject baru atau
+        yang versinya berubah dibaca ulang, subject yang sudah hilang dibuang.
+        """
+        seen_paths = set()
+        for path in storage.iter_subject_paths():
+            if self._cancelled:
+                return
+            seen_paths.add(path)
+            signature = storage.signature(path)
+            version = signature[0] if signature else None
+            stale = [index for index in [self] + self._companions if not index.is_current(path, version)]
+            if not stale:
+                continue
+            try:
+                content = storage.load_content(path)
+            except Exception as e:
+                print(f"Peringatan: Gagal mengindeks '{path}': {e}")
+                continue
+            with self._lock:
+                # Jika subject berubah selama dibaca, biarkan save_content yang mengindeksnya
+                signature_after = storage.signature(path)
+                if signature_after is None or signature_after[0] != version:
+                    continue
+                for index in stale:
+                    index.update_subject(path, content, version)
+        with self._lock:
+            for path in [path for path in self._subjects if path not in seen_paths]:
+                self._remove_locked(path)
+            for companion in self._companions:
+                companion.prune(seen_paths)
+            self.refreshes += 1
+
+    def start_background_refresh(self, storage):
+        """Menjalankan refresh() di thread latar belakang (dilewati jika masih berjalan)."""
+        if self.building:
+            return
+        self._cancelled = False
+        self._refresh_thread = threading.Thread(target=self._run_refresh, args=(storage,), daemon=True)
+        self._refresh_thread.start()
+
+    def _run_refresh(self, storage):
+        try:
+            if not self._persisted_loaded:
+                self._persisted_loaded = True
+                self.load(storage)
+            self.refresh(storage)
+        except Exception as e:
+            print(f"Peringatan: Pembaruan indeks pencarian gagal: {e}")
+
+    def stop(self):
+        """Menghentikan pembaruan latar belakang (dipanggil saat aplikasi ditutup)."""
+        self._cancelled = True
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+
+    # --- Penyimpanan Indeks ---
+
+    def _companion_formats(self):
+        return [f"{type(companion).__name__}:{companion.PERSIST_FORMAT}" for companion in self._companions]
+
+    def load(self, storage):
+        """
+        Memuat indeks yang disimpan save(). Subject yang sudah diindeks (mis. disimpan
+        selama pemuatan berjalan) tidak ditimpa; subject yang versinya sudah berubah
+        diperbarui oleh refresh() berikutnya.
+        """
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Peringatan: Indeks pencarian tersimpan tidak bisa dibaca, dibangun ulang: {e}")
+            return
+        if not isinstance(data, dict) or data.get("format") != _PERSIST_FORMAT or data.get("backend") != storage.name:
+            return
+        subjects = data.get("subjects", [])
+        # Companion dimuat lebih dulu karena murah, jadi daftar jatuh tempo sudah lengkap sebelum
+        # indeks teks selesai dibangun. Datanya hanya dipakai jika formatnya masih sama; jika tidak,
+        # companion diisi ulang oleh refresh().
+        if data.get("companions") == self._companion_formats():
+            for path, version, _, companion_data in subjects:
+                for companion, exported in zip(self._companions, companion_data):
+                    companion.import_subject(path, exported, tuple(version))
+        for path, version, texts, _ in subjects:
+            if self._cancelled:
+                return
+            texts = {(disc_index, point_index): text for disc_index, point_index, text in texts}
+            if self._index_texts(path, texts, tuple(version), replace=False):
+                self.subjects_loaded += 1
+
+    def save(self, storage):
+        """
+        Menyimpan indeks ke persist_path (dipanggil saat aplikasi ditutup, setelah
+        storage.flush()). Hanya subject yang indeksnya sesuai isi penyimpanan dan punya
+        stable_version() yang disimpan; sisanya dibaca ulang saat dibuka berikutnya.
+        """
+        if not self.persist_path:
+            return
+        with self._lock:
+            if not self._dirty and os.path.exists(self.persist_path):
+                return
+            subjects = []
+            for path, entry in self._subjects.items():
+                signature = storage.signature(path)
+                if signature is None or signature[0] != entry["version"]:
+                    continue
+                version = storage.stable_version(path)
+                if version is None:
+                    continue
+                texts = [[disc_index, point_index, text] for (disc_index, point_index), text in entry["texts"].items()]
+                companion_data = []
+                for companion in self._companions:
+                    companion_data.append(companion.export_subject(path) if companion.is_current(path, entry["version"]) else None)
+                subjects.append([path, list(version), texts, companion_data])
+            data = {"format": _PERSIST_FORMAT, "backend": storage.name,
+                    "companions": self._companion_formats(), "subjects": subjects}
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.persist_path) or ".", exist_ok=True)
+            temp_path = self.persist_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temp_path, self.persist_path)
+        except OSError as e:
+            print(f"Peringatan: Gagal menyimpan indeks pencarian: {e}")
+
+    # --- Pencarian ---
+
+    def _matching_tokens_locked(self, query_token):
+        """
+        Token kosakata yang memuat query_token. Untuk query 3 huruf atau lebih, hanya
+        token yang punya semua potongan 3 huruf query yang diperiksa; query yang lebih
+        pendek memeriksa seluruh kosakata.
+        """
+        grams = _vocabulary_grams(query_token)
+        if not grams:
+            return [token for token in self._postings if query_token in token]
+        token_sets = sorted((self._vocabulary.get(gram, set()) for gram in grams), key=len)
+        if not token_sets[0]:
+            return []
+        tokens = token_sets[0].intersection(*token_sets[1:])
+        return [token for token in tokens if query_token in token]
+
+    def _candidates_locked(self, query_tokens, paths):
+        """Irisan lokasi untuk semua token query, per path."""
+        candidates = None
+        for query_token in query_tokens:
+            matches = {}
+            if paths is None:
+                for token in self._matching_tokens_locked(query_token):
+                    for path, locations in self._postings[token].items():
+                        matches.setdefault(path, set()).update(locations)
+            else:
+                # Hanya peta token subject yang diminta yang disentuh. Query pendek tidak punya
+                # potongan 3 huruf, jadi kosakata subject itu sendiri yang diperiksa.
+                tokens = self._matching_tokens_locked(query_token) if len(query_token) >= 3 else None
+                for path in paths:
+                    subject_tokens = self._subjects.get(path, {}).get("tokens", {})
+                    if tokens is None or len(tokens) > len(subject_tokens):
+                        subject_matches = (token for token in subject_tokens if query_token in token)
+                    else:
+                        subject_matches = (token for token in tokens if token in subject_tokens)
+                    locations = set()
+                    for token in subject_matches:
+                        locations.update(subject_tokens[token])
+                    if locations:
+                        matches[path] = locations
+            if candidates is None:
+                candidates = matches
+            else:
+                candidates = {path: candidates[path] & locations
+                              for path, locations in matches.items() if path in candidates}
+                candidates = {path: locations for path, locations in candidates.items() if locations}
+            if not candidates:
+                break
+        return candidates or {}
+
+    def search(self, query, paths=None):
+        """
+        Mencari query (substring, tanpa membedakan huruf besar) di semua subject
+        atau hanya di paths. Mengembalikan {path: {lokasi: teks}}.
+        """
+        query = query.lower()
+        if not query:
+            return {}
+        query_tokens = _TOKEN_PATTERN.findall(query)
+        results = {}
+        with self._lock:
+            if query_tokens:
+                candidates = self._candidates_locked(query_tokens, paths)
+            else:
+                # Query tanpa huruf/angka (mis. tanda baca) tidak punya token; periksa semua teks
+                scope = self._subjects if paths is None else [path for path in paths if path in self._subjects]
+                candidates = {path: set(self._subjects[path]["lowered"]) for path in scope}
+            for path, locations in candidates.items():
+                entry = self._subjects[path]
+                found = {location: entry["texts"][location] for location in locations
+                         if query in entry["lowered"][location]}
+                if found:
+                    results[path] = found
+        return results
+
+    def locations(self, path, query):
+        """Himpunan lokasi di satu subject yang memuat query."""
+        return set(self.search(query, paths={path}).get(path, {}))
+
+    # --- Pencarian Fuzzy ---
+
+    def fuzzy_search(self, query, paths=None, min_similarity=None, limit=None):
+        """
+        Mencari lokasi yang mirip dengan query berdasarkan trigram.
+
+        Skor utama adalah porsi trigram query yang ditemukan di teks, sehingga
+        salah ketik dan urutan kata yang berbeda tetap cocok; skor Jaccard dipakai
+        sebagai pemecah seri. Mengembalikan list (skor, path, lokasi, teks)
+        terurut dari yang paling mirip.
+
+        Kandidat diambil dengan prefix filter: lokasi yang lolos min_similarity
+        pasti memuat minimal satu dari (n - minimal + 1) trigram query yang paling
+        jarang, jadi hanya posting trigram itu yang dijalani. Trigram umum
+        (mis. " di", "an ") cukup diperiksa keanggotaannya untuk kandidat tersebut.
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        if min_similarity is None:
+            min_similarity = config.FUZZY_SEARCH_MIN_SIMILARITY
+        gram_count = len(query_grams)
+        required = next((count for count in range(1, gram_count + 1) if count / gram_count >= min_similarity), None)
+        if required is None:
+            return []
+        with self._lock:
+            results = []
+            for path, (counts, rest) in self._fuzzy_candidates_locked(query_grams, gram_count - required + 1, paths).items():
+                entry = self._subjects[path]
+                grams = entry["grams"]
+                for location, count in counts.items():
+                    count += sum(1 for gram in rest if location in grams.get(gram, ()))
+                    containment = count / gram_count
+                    if containment < min_similarity:
+                        continue
+                    jaccard = count / (gram_count + entry["trigram_counts"][location] - count)
+                    results.append((containment, jaccard, path, location, entry["texts"][location]))
+        results.sort(key=lambda result: (-result[0], -result[1], result[2], result[3]))
+        if limit is not None:
+            results = results[:limit]
+        return [(containment, path, location, text) for containment, _, path, location, text in results]
+
+    def _fuzzy_candidates_locked(self, query_grams, probe_size, paths):
+        """
+        {path: ({lokasi: jumlah trigram probe yang sama}, trigram sisa)} dari probe_size
+        trigram query yang paling jarang. Tanpa paths, kelangkaan dihitung di seluruh
+        koleksi; dengan paths, per subject dari peta trigram subject itu saja.
+        """
+        candidates = {}
+        if paths is None:
+            ordered = sorted(query_grams, key=lambda gram: self._trigram_frequency.get(gram, 0))
+            probe, rest = ordered[:probe_size], ordered[probe_size:]
+            for gram in probe:
+                for path, locations in self._trigram_postings.get(gram, {}).items():
+                    counts = candidates.setdefault(path, ({}, rest))[0]
+                    for location in locations:
+                        counts[location] = counts.get(location, 0) + 1
+            return candidates
+        for path in paths:
+            entry = self._subjects.get(path)
+            if entry is None:
+                continue
+            grams = entry["grams"]
+            ordered = sorted(query_grams, key=lambda gram: len(grams.get(gram, ())))
+            counts = {}
+            for gram in ordered[:probe_size]:
+                for location in grams.get(gram, ()):
+                    counts[location] = counts.get(location, 0) + 1
+            if counts:
+                candidates[path] = (counts, ordered[probe_size:])
+        return candidates
+
+    def fuzzy_locations(self, path, query):
+        """{lokasi: skor kemiripan} di satu subject untuk mode fuzzy."""
+        return {location: score for score, _, location, _ in self.fuzzy_search(query, paths={path})}
@@ -1,7 +1,5 @@
 # file: test/core/state_manager.py
 
-from PyQt6.QtWidgets import QTreeWidgetItemIterator
-
 class StateManager:
     """Kelas untuk mengelola penyimpanan dan pemuatan status aplikasi."""
     def __init__(self, main_window):
@@ -21,10 +19,9 @@ class StateManager:
             self.settings.setValue("last_selected_subject", subject_item.text())
 
         # Konten (Diskusi/Point)
-        content_item = self.win.content_tree.currentItem()
-        if content_item:
-            data = content_item.data(0, self.win.Qt.ItemDataRole.UserRole)
-            self.settings.setValue("last_selected_content", data)
+        content_data = self.win.content_tree.current_item_data()
+        if content_data:
+            self.settings.setValue("last_selected_content", content_data)
         
         # Kategori Task
         task_category_item = self.win.task_category_list.currentItem()
@@ -38,7 +35,11 @@ class StateManager:
             self.settings.setValue("last_selected_task", data)
 
     def load_state(self):
-        """Memuat dan memilih item terakhir yang disimpan."""
+        """
+        Memuat dan memilih item terakhir yang disimpan. Memilih kategori, topic,
+        dan subject sudah merefresh panel turunannya lewat handler pilihan, jadi
+        panel-panel itu tidak di-refresh lagi di sini.
+        """
         # Pilih Kategori Task
         last_category = self.settings.value("last_selected_task_category")
         if last_category:
@@ -50,7 +51,8 @@ class StateManager:
         # Pilih Task
         last_task_data = self.settings.value("last_selected_task")
         if last_task_data:
-            self.win.refresh_manager.refresh_task_list() 
+            # Daftar task mungkin masih menunggu refresh tertunda jika kategorinya tidak berganti
+            self.win.refresh_manager.flush()
             for i in range(self.win.task_tree.topLevelItemCount()):
                 item = self.win.task_tree.topLevelItem(i)
                 if item.data(0, self.win.Qt.ItemDataRole.UserRole) == last_task_data:
@@ -68,7 +70,6 @@ class StateManager:
         # Pilih Subjek
         last_subject = self.settings.value("last_selected_subject")
         if self.win.current_topic_path and last_subject:
-            self.win.refresh_manager.refresh_subject_list()
             for i in range(self.win.subject_list.count()):
                 if self.win.subject_list.item(i).text() == last_subject:
                     self.win.subject_list.setCurrentRow(i)
@@ -77,11 +78,4 @@ class StateManager:
         # Pilih Konten
         last_content_data = self.settings.value("last_selected_content")
         if self.win.current_subject_path and last_content_data:
-            self.win.refresh_manager.refresh_content_tree() 
-            iterator = QTreeWidgetItemIterator(self.win.content_tree)
-            while iterator.value():
-                item = iterator.value()
-                if item.data(0, self.win.Qt.ItemDataRole.UserRole) == last_content_data:
-                    self.win.content_tree.setCurrentItem(item)
-                    break
-                iterator += 1
\ No newline at end of file
+            self.win.content_tree.select_item_data(last_content_data)
\ No newline at end of file
@@ -0,0 +1,27 @@
+# file: core/storage/__init__.py
+
+import config
+from .base import StorageBackend
+from .json_storage import JsonStorage
+from .sqlite_storage import SqliteStorage
+from .migration import needs_migration, migrate_json_tree
+
+BACKENDS = {
+    JsonStorage.name: JsonStorage,
+    SqliteStorage.name: SqliteStorage,
+}
+
+def create_storage(base_path, task_data_file, backend_name=None):
+    """Membuat backend penyimpanan sesuai konfigurasi (default: config.STORAGE_BACKEND)."""
+    backend_name = backend_name or config.STORAGE_BACKEND
+    backend_class = BACKENDS.get(backend_name)
+    if backend_class is None:
+        print(f"Peringatan: Backend penyimpanan '{backend_name}' tidak dikenal, memakai 'json'.")
+        backend_class = JsonStorage
+
+    storage = backend_class(base_path, task_data_file)
+    # Migrasi satu kali dari struktur folder JSON lama saat database masih kosong
+    if isinstance(storage, SqliteStorage) and needs_migration(storage):
+        summary = migrate_json_tree(storage, base_path, task_data_file)
+        print(f"Migrasi ke SQLite selesai: {summary['subjects']} subject dipindahkan.")
+    return storage
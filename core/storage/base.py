@@ -0,0 +1,136 @@
+# file: core/storage/base.py
+
+from .task_operations import apply_task_operation
+
+class StorageBackend:
+    """
+    Antarmuka dasar untuk mesin penyimpanan data topic, subject, dan task.
+
+    Semua backend dialamatkan dengan path "virtual" yang sama seperti struktur
+    folder lama (BASE_PATH/<topic>/<subject>.json), sehingga handler dan
+    refresher tidak perlu tahu backend mana yang sedang dipakai.
+    """
+    name = "base"
+
+    def __init__(self, base_path, task_data_file):
+        self.base_path = base_path
+        self.task_data_file = task_data_file
+
+    # --- Topics ---
+
+    def get_topics(self):
+        """Mengembalikan list dict {'name', 'icon'} untuk semua topic, urut nama."""
+        raise NotImplementedError
+
+    def save_topic_config(self, topic_name, data):
+        """Menyimpan konfigurasi (seperti ikon) untuk sebuah topic."""
+        raise NotImplementedError
+
+    def create_directory(self, path):
+        """Membuat topic baru pada path yang diberikan."""
+        raise NotImplementedError
+
+    def delete_directory(self, path):
+        """Menghapus topic beserta semua subject di dalamnya."""
+        raise NotImplementedError
+
+    # --- Subjects ---
+
+    def get_subjects(self, topic_path):
+        """Mengembalikan list dict {'name', 'date', 'code', 'icon'} (belum diurutkan)."""
+        raise NotImplementedError
+
+    def iter_subject_paths(self):
+        """Menghasilkan path virtual semua subject di semua topic."""
+        raise NotImplementedError
+
+    def content_exists(self, file_path):
+        """True jika subject pada path tersebut sudah ada."""
+        raise NotImplementedError
+
+    def load_content(self, file_path):
+        """Memuat data subject. Mengembalikan None jika tidak ada atau rusak."""
+        raise NotImplementedError
+
+    def save_content(self, file_path, data):
+        """Menyimpan data subject."""
+        raise NotImplementedError
+
+    def signature(self, file_path):
+        """
+        Mengembalikan (versi, perkiraan ukuran byte) subject untuk validasi cache,
+        atau None jika subject tidak ada. Cache hanya membandingkan bagian versi.
+        """
+        return None
+
+    def stable_version(self, file_path):
+        """
+        Versi subject yang tetap sama setelah aplikasi dibuka ulang (selama isinya
+        tidak berubah), untuk indeks yang disimpan ke disk. None jika subject tidak
+        ada atau versinya belum stabil (mis. masih ada penulisan yang tertunda).
+        """
+        return None
+
+    def rename_path(self, old_path, new_path):
+        """Mengganti nama topic atau subject."""
+        raise NotImplementedError
+
+    def delete_file(self, path):
+        """Menghapus sebuah subject."""
+        raise NotImplementedError
+
+    # --- Tasks ---
+
+    def load_tasks(self):
+        """Memuat seluruh data task. Mengembalikan None jika belum ada."""
+        raise NotImplementedError
+
+    def save_tasks(self, data):
+        """Menyimpan seluruh data task."""
+        raise NotImplementedError
+
+    def apply_task_operation(self, op, current_data=None):
+        """
+        Menerapkan satu operasi task bertipe (lihat task_operations).
+        current_data adalah data task pemanggil yang sudah memuat hasil operasi;
+        jika diberikan, implementasi bawaan cukup menyimpannya. Tanpa itu,
+        seluruh data dimuat, diubah, lalu disimpan. Mengembalikan True jika data berubah.
+        """
+        if current_data is not None:
+            self.save_tasks(current_data)
+            return True
+        tasks_data = self.load_tasks() or {"categories": []}
+        if not apply_task_operation(tasks_data, op):
+            return False
+        self.save_tasks(tasks_data)
+        return True
+
+    def resident_task_model(self):
+        """TaskModel yang dipegang backend (jika ada), agar tidak dimuat dua kali."""
+        return None
+
+    def tasks_exist(self):
+        """True jika data task sudah pernah dibuat."""
+        raise NotImplementedError
+
+    # --- Backup ---
+
+    def write_backup(self, zipf, arc_root):
+        """Menulis semua topic dan task ke dalam zip, relatif terhadap arc_root."""
+        raise NotImplementedError
+
+    def import_topic_directory(self, source_topic_path, dest_topic_name):
+        """Memasukkan satu folder topic (format JSON) hasil ekstrak backup."""
+        raise NotImplementedError
+
+    def set_error_handler(self, handler):
+        """Mendaftarkan handler(path, error) untuk kegagalan simpan di belakang layar."""
+        pass
+
+    def flush(self):
+        """Menunggu semua penyimpanan yang tertunda selesai ditulis."""
+        pass
+
+    def close(self):
+        """Melepaskan resource yang dipegang backend."""
+        pass
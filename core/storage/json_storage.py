@@ -0,0 +1,360 @@
+# file: core/storage/json_storage.py
+
+import os
+import copy
+import json
+import shutil
+import threading
+
+import config
+from .base import StorageBackend
+from .subject_catalog import SubjectCatalog, is_subject_file
+from .save_queue import SaveQueue, write_json_atomic
+from .task_journal import TaskJournal
+from core.task_model import TaskModel
+
+class JsonStorage(StorageBackend):
+    """
+    Backend bawaan: setiap topic adalah folder dan setiap subject adalah satu file JSON.
+
+    Penyimpanan file yang sudah ada dilakukan lewat SaveQueue (write-behind),
+    sehingga pembacaan harus selalu melihat data tertunda lebih dulu.
+    """
+    name = "json"
+
+    def __init__(self, base_path, task_data_file):
+        super().__init__(base_path, task_data_file)
+        # Katalog subject yang sudah dibaca, per folder topic
+        self._catalogs = {}
+        # Melindungi katalog dan catatan versi yang juga disentuh thread penulis
+        self._lock = threading.RLock()
+        # path -> nomor versi terakhir yang diserahkan aplikasi
+        self._versions = {}
+        # path -> ((mtime_ns, size) hasil tulisan aplikasi, versi)
+        self._written = {}
+        self._error_handler = None
+        # Model task resident: snapshot my_tasks.json + replay jurnal operasi
+        self._task_model = None
+        self._compaction_seq = None
+        self.task_journal = TaskJournal(os.path.splitext(task_data_file)[0] + ".journal")
+        self.writer = SaveQueue(
+            config.SAVE_DEBOUNCE_SECONDS, config.SAVE_MAX_DELAY_SECONDS,
+            on_written=self._on_written, on_error=self._on_write_error
+        )
+
+    def set_error_handler(self, handler):
+        self._error_handler = handler
+
+    # --- Topics ---
+
+    def get_topics(self):
+        if not os.path.exists(self.base_path):
+            return []
+        topics_data = []
+        for d in sorted([d for d in os.listdir(self.base_path) if os.path.isdir(os.path.join(self.base_path, d))]):
+            config_path = os.path.join(self.base_path, d, 'topic_config.json')
+            icon = config.DEFAULT_TOPIC_ICON
+            if os.path.exists(config_path):
+                try:
+                    with open(config_path, 'r') as f:
+                        topic_config = json.load(f)
+                        icon = topic_config.get('icon', config.DEFAULT_TOPIC_ICON)
+                except (json.JSONDecodeError, IOError):
+                    pass
+            topics_data.append({'name': d, 'icon': icon})
+        return topics_data
+
+    def save_topic_config(self, topic_name, data):
+        config_path = os.path.join(self.base_path, topic_name, 'topic_config.json')
+        # Jarang terjadi dan langsung dibaca ulang oleh daftar topic, jadi ditulis segera
+        self._write_json(config_path, data, background=False)
+
+    def create_directory(self, path):
+        os.makedirs(path, exist_ok=True)
+
+    def delete_directory(self, path):
+        self.writer.flush()
+        shutil.rmtree(path)
+        with self._lock:
+            self._catalogs.pop(os.path.normpath(path), None)
+
+    # --- Subjects ---
+
+    def get_subjects(self, topic_path):
+        """
+        Mengisi daftar subject dari katalog topic. Hanya subject yang stat-nya
+        berubah sejak terakhir dicatat yang di-parse ulang.
+        """
+        if not topic_path or not os.path.exists(topic_path):
+            return []
+        subjects = []
+        seen_names = set()
+        with self._lock, os.scandir(topic_path) as entries:
+            catalog = self._get_catalog(topic_path)
+            for entry in entries:
+                if not entry.is_file() or not is_subject_file(entry.name):
+                    continue
+                name = entry.name[:-len('.json')]
+                seen_names.add(name)
+                pending = self.writer.pending_data(entry.path)
+                if pending is not None:
+                    # Isi file di disk belum final; pakai metadata dari data yang sedang antre
+                    metadata = pending.get('metadata', {})
+                    cached = {'date': metadata.get('earliest_date'), 'code': metadata.get('earliest_code'),
+                              'icon': metadata.get('icon', config.DEFAULT_SUBJECT_ICON)}
+                else:
+                    stat_result = entry.stat()
+                    cached = catalog.lookup(name, stat_result)
+                    if cached is None:
+                        content = self.load_content(entry.path) or {}
+                        catalog.update(name, stat_result, content.get('metadata', {}))
+                        cached = catalog.entries[name]
+                subjects.append({'name': name, 'date': cached['date'], 'code': cached['code'], 'icon': cached['icon']})
+
+            catalog.prune(seen_names)
+            catalog.save()
+        return subjects
+
+    def iter_subject_paths(self):
+        if not os.path.isdir(self.base_path):
+            return
+        for topic_name in sorted(os.listdir(self.base_path)):
+            topic_path = os.path.join(self.base_path, topic_name)
+            if not os.path.isdir(topic_path):
+                continue
+            with os.scandir(topic_path) as entries:
+                paths = [entry.path for entry in entries if entry.is_file() and is_subject_file(entry.name)]
+            yield from sorted(paths)
+
+    def content_exists(self, file_path):
+        return os.path.exists(file_path)
+
+    def load_content(self, file_path):
+        pending = self.writer.pending_data(file_path)
+        if pending is not None:
+            # Salinan, agar pemanggil bisa mengubahnya tanpa mengganggu thread penulis
+            return copy.deepcopy(pending)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def save_content(self, file_path, data):
+        self._write_json(file_path, data)
+
+    def signature(self, file_path):
+        """
+        Versi subject untuk cache. Selama file terakhir ditulis oleh aplikasi
+        (atau masih antre), versinya adalah nomor versi aplikasi; perubahan
+        dari luar aplikasi terlihat sebagai (mtime_ns, size) yang baru.
+        """
+        with self._lock:
+            version = self._versions.get(file_path)
+            written = self._written.get(file_path)
+        try:
+            stat_result = os.stat(file_path)
+            disk_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            disk_signature = None
+
+        if self.writer.has_pending(file_path):
+            return (("app", version), disk_signature[1] if disk_signature else 0)
+        if disk_signature is None:
+            return None
+        if written and written[0] == disk_signature:
+            return (("app", written[1]), disk_signature[1])
+        return (disk_signature, disk_signature[1])
+
+    def stable_version(self, file_path):
+        """
+        (mtime_ns, size) file di disk, yaitu versi yang dilaporkan signature() untuk
+        file ini setelah aplikasi dibuka ulang.
+        """
+        if self.writer.has_pending(file_path):
+            return None
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return (stat_result.st_mtime_ns, stat_result.st_size)
+
+    def rename_path(self, old_path, new_path):
+        self.writer.flush()
+        os.rename(old_path, new_path)
+        with self._lock:
+            self._written.pop(old_path, None)
+            if self._is_subject_path(old_path):
+                catalog = self._get_catalog(os.path.dirname(old_path))
+                catalog.rename(self._subject_name(old_path), self._subject_name(new_path))
+                catalog.save()
+            else:
+                self._catalogs.pop(os.path.normpath(old_path), None)
+
+    def delete_file(self, path):
+        self.writer.discard(path)
+        self.writer.flush()
+        os.remove(path)
+        with self._lock:
+            self._written.pop(path, None)
+            catalog = self._get_catalog(os.path.dirname(path))
+            catalog.remove(self._subject_name(path))
+            catalog.save()
+
+    # --- Tasks ---
+
+    def load_tasks(self):
+        model = self.resident_task_model()
+        return model.data if model else None
+
+    def resident_task_model(self):
+        """Snapshot terakhir ditambah operasi jurnal yang belum dilipat ke dalamnya."""
+        with self._lock:
+            if self._task_model is None:
+                pending = self.writer.pending_data(self.task_data_file)
+                snapshot = copy.deepcopy(pending) if pending is not None else self.load_content(self.task_data_file)
+                if snapshot is None and not os.path.exists(self.task_journal.journal_path):
+                    return None
+                snapshot = snapshot or {"categories": []}
+                snapshot_seq = snapshot.pop("journal_seq", 0)
+                model = TaskModel(snapshot)
+                for op in self.task_journal.read_operations(after_seq=snapshot_seq):
+                    model.apply(op)
+                self._task_model = model
+            return self._task_model
+
+    def save_tasks(self, data):
+        with self._lock:
+            data.pop("journal_seq", None)
+            self._task_model = TaskModel(data)
+            self._write_task_snapshot()
+
+    def apply_task_operation(self, op, current_data=None):
+        """Menerapkan operasi ke model resident lalu menambahkannya ke jurnal (satu append, bukan tulis ulang file)."""
+        with self._lock:
+            model = self.resident_task_model()
+            if model is None:
+                model = self._task_model = TaskModel()
+            if not model.apply(op):
+                return False
+            try:
+                self.task_journal.append(op)
+            except OSError as e:
+                self._on_write_error(self.task_journal.journal_path, e)
+                return True
+            if self.task_journal.size_bytes > config.TASK_JOURNAL_COMPACT_BYTES and self._compaction_seq is None:
+                self._write_task_snapshot()
+            return True
+
+    def tasks_exist(self):
+        return (self._task_model is not None or self.writer.has_pending(self.task_data_file)
+                or os.path.exists(self.task_data_file) or os.path.exists(self.task_journal.journal_path))
+
+    def _write_task_snapshot(self, background=True):
+        """
+        Kompaksi: menulis salinan konsisten data task beserta seq jurnal terakhir.
+        Setelah snapshot tertulis, operasi jurnal sampai seq tersebut dibuang.
+        """
+        snapshot = self._task_model.snapshot()
+        snapshot["journal_seq"] = self.task_journal.last_seq
+        self._compaction_seq = snapshot["journal_seq"]
+        self._write_json(self.task_data_file, snapshot, background=background)
+
+    # --- Backup ---
+
+    def write_backup(self, zipf, arc_root):
+        with self._lock:
+            if self.task_journal.size_bytes:
+                self._write_task_snapshot()
+        self.writer.flush()
+        if os.path.exists(self.base_path):
+            for root, _, files in os.walk(self.base_path):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    zipf.write(file_path, os.path.relpath(file_path, arc_root))
+
+        if os.path.exists(self.task_data_file):
+            zipf.write(self.task_data_file, os.path.relpath(self.task_data_file, arc_root))
+
+    def import_topic_directory(self, source_topic_path, dest_topic_name):
+        shutil.move(source_topic_path, os.path.join(self.base_path, dest_topic_name))
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        with self._lock:
+            if self.task_journal.size_bytes and self._task_model is not None:
+                self._write_task_snapshot()
+        self.writer.close()
+
+    # --- Helper ---
+
+    def _get_catalog(self, topic_path):
+        key = os.path.normpath(topic_path)
+        if key not in self._catalogs:
+            self._catalogs[key] = SubjectCatalog(topic_path)
+        return self._catalogs[key]
+
+    def _is_subject_path(self, file_path):
+        """True jika path menunjuk file subject di dalam salah satu folder topic."""
+        topic_parent = os.path.dirname(os.path.dirname(os.path.normpath(file_path)))
+        return topic_parent == os.path.normpath(self.base_path) and is_subject_file(os.path.basename(file_path))
+
+    def _subject_name(self, file_path):
+        return os.path.splitext(os.path.basename(file_path))[0]
+
+    def _record_in_catalog(self, file_path, data):
+        """Memperbarui entri katalog setelah subject selesai ditulis oleh aplikasi."""
+        if not self._is_subject_path(file_path):
+            return
+        catalog = self._get_catalog(os.path.dirname(file_path))
+        catalog.update(self._subject_name(file_path), os.stat(file_path), data.get('metadata', {}))
+        catalog.save()
+
+    def _write_json(self, file_path, data, background=True):
+        """
+        Menyimpan file JSON. File yang sudah ada ditulis di belakang layar;
+        file baru ditulis segera karena langsung dicari oleh daftar topic/subject.
+        """
+        with self._lock:
+            version = self._versions.get(file_path, 0) + 1
+            self._versions[file_path] = version
+        if background and os.path.exists(file_path):
+            self.writer.submit(file_path, data, token=version)
+            return
+        self.writer.discard(file_path)
+        write_json_atomic(file_path, data)
+        self._on_written(file_path, data, version)
+
+    def _on_written(self, file_path, data, version):
+        """Dipanggil setelah file selesai ditulis (bisa dari thread penulis)."""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return
+        with self._lock:
+            self._written[file_path] = ((stat_result.st_mtime_ns, stat_result.st_size), version)
+            if file_path == self.task_data_file:
+                self._fold_journal(data)
+            else:
+                self._record_in_catalog(file_path, data)
+
+    def _fold_journal(self, snapshot):
+        """Snapshot task sudah aman di disk; operasi jurnal yang tercakup di dalamnya dibuang."""
+        snapshot_seq = snapshot.get("journal_seq")
+        if snapshot_seq:
+            try:
+                self.task_journal.truncate_through(snapshot_seq)
+            except OSError as e:
+                print(f"Peringatan: Gagal memadatkan jurnal task: {e}")
+        if self._compaction_seq == snapshot_seq:
+            self._compaction_seq = None
+
+    def _on_write_error(self, file_path, error):
+        if file_path == self.task_data_file:
+            with self._lock:
+                self._compaction_seq = None
+        print(f"Peringatan: Gagal menyimpan '{file_path}': {error}")
+        if self._error_handler:
+            self._error_handler(file_path, error)
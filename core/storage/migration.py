@@ -0,0 +1,68 @@
+# file: core/storage/migration.py
+
+import os
+import sys
+from datetime import datetime
+
+from .json_storage import JsonStorage
+
+MIGRATION_META_KEY = "json_migrated_at"
+
+def needs_migration(storage):
+    """True jika database masih kosong dan belum pernah dimigrasi dari folder JSON."""
+    return storage.get_meta(MIGRATION_META_KEY) is None and storage.is_empty()
+
+def migrate_json_tree(storage, base_path, task_data_file):
+    """
+    Memindahkan seluruh isi folder data/contents/topics dan my_tasks.json
+    ke backend tujuan (satu kali). File JSON asli tidak dihapus.
+    Mengembalikan dict berisi jumlah topic, subject, dan kategori task yang dipindahkan.
+    """
+    source = JsonStorage(base_path, task_data_file)
+    summary = {"topics": 0, "subjects": 0, "task_categories": 0}
+    try:
+        for topic in source.get_topics():
+            topic_path = os.path.join(base_path, topic['name'])
+            storage.create_directory(topic_path)
+            storage.save_topic_config(topic['name'], {'icon': topic['icon']})
+            summary["topics"] += 1
+
+        # iter_subject_paths tidak menulis subject_catalog.json ke folder sumber seperti get_subjects
+        for file_path in source.iter_subject_paths():
+            data = source.load_content(file_path)
+            if data is None:
+                print(f"Peringatan: Subject '{file_path}' tidak bisa dibaca, dilewati.")
+                continue
+            storage.save_content(file_path, data)
+            summary["subjects"] += 1
+
+        tasks_data = source.load_tasks()
+        if tasks_data is not None:
+            storage.save_tasks(tasks_data)
+            summary["task_categories"] = len(tasks_data.get("categories", []))
+    finally:
+        # Menghentikan thread penulis milik storage sumber
+        source.close()
+
+    storage.set_meta(MIGRATION_META_KEY, datetime.now().isoformat(timespec="seconds"))
+    return summary
+
+def main():
+    """Menjalankan migrasi dari baris perintah: python -m core.storage.migration [db_path]"""
+    import config
+    from .sqlite_storage import SqliteStorage
+
+    db_path = sys.argv[1] if len(sys.argv) > 1 else config.SQLITE_DB_PATH
+    storage = SqliteStorage(config.BASE_PATH, config.TASK_BASE_PATH, db_path)
+    try:
+        if not needs_migration(storage):
+            print(f"Database '{db_path}' sudah berisi data, migrasi dilewati.")
+            return
+        summary = migrate_json_tree(storage, config.BASE_PATH, config.TASK_BASE_PATH)
+        print(f"Migrasi selesai: {summary['topics']} topic, {summary['subjects']} subject, "
+              f"{summary['task_categories']} kategori task.")
+    finally:
+        storage.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# file: core/storage/save_queue.py
+
+import os
+import copy
+import json
+import time
+import threading
+
+MAX_ATTEMPTS = 3
+
+def write_json_atomic(file_path, data):
+    """Menulis JSON ke file sementara lalu me-rename-nya, sehingga file tidak pernah setengah jadi."""
+    text = json.dumps(data, indent=4)
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, file_path)
+
+class SaveQueue:
+    """
+    Penulis latar belakang (write-behind) untuk file JSON.
+
+    Penyimpanan beruntun ke file yang sama dalam jendela debounce digabung
+    menjadi satu penulisan. Penulisan dilakukan di thread terpisah sehingga
+    thread UI tidak pernah menunggu disk.
+    """
+    def __init__(self, debounce_seconds, max_delay_seconds, on_written=None, on_error=None):
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.on_written = on_written
+        self.on_error = on_error
+        self.writes = 0
+        self.coalesced = 0
+
+        self._cond = threading.Condition()
+        # path -> {"data", "token", "first", "due", "attempts"}
+        self._pending = {}
+        self._in_progress = None
+        self._flush_requests = 0
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="SaveQueue", daemon=True)
+        self._thread.start()
+
+    def submit(self, file_path, data, token=None):
+        """
+        Menjadwalkan penulisan data ke file_path. Penulisan sebelumnya yang belum jalan akan digantikan.
+        Yang antre adalah salinan data saat ini, karena pemanggil (thread UI) bisa terus mengubah aslinya.
+        """
+        data = copy.deepcopy(data)
+        with self._cond:
+            now = time.monotonic()
+            entry = self._pending.get(file_path)
+            if entry:
+                self.coalesced += 1
+                first = entry["first"]
+            else:
+                first = now
+            self._pending[file_path] = {
+                "data": data, "token": token, "first": first, "attempts": 0,
+                "due": min(now + self.debounce_seconds, first + self.max_delay_seconds),
+            }
+            self._cond.notify_all()
+
+    def pending_data(self, file_path):
+        """
+        Data terbaru yang belum selesai ditulis untuk file_path, atau None.
+        Data ini juga sedang/akan dibaca thread penulis, jadi jangan diubah.
+        """
+        with self._cond:
+            entry = self._pending.get(file_path)
+            if entry:
+                return entry["data"]
+            if self._in_progress and self._in_progress[0] == file_path:
+                return self._in_progress[1]
+            return None
+
+    def has_pending(self, file_path):
+        return self.pending_data(file_path) is not None
+
+    def discard(self, file_path):
+        """Membatalkan penulisan yang tertunda (misal karena file akan dihapus)."""
+        with self._cond:
+            self._pending.pop(file_path, None)
+
+    def flush(self):
+        """Menulis semua yang tertunda sekarang juga dan menunggu sampai selesai."""
+        with self._cond:
+            self._flush_requests += 1
+            self._cond.notify_all()
+            while self._pending or self._in_progress:
+                self._cond.wait()
+            self._flush_requests -= 1
+
+    def close(self):
+        """Flush lalu menghentikan thread penulis. Dipanggil saat aplikasi ditutup."""
+        self.flush()
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout=5)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                file_path, entry = min(self._pending.items(), key=lambda kv: kv[1]["due"])
+                delay = entry["due"] - time.monotonic()
+                if delay > 0 and not self._flush_requests and not self._stopping:
+                    self._cond.wait(delay)
+                    continue
+                del self._pending[file_path]
+                self._in_progress = (file_path, entry["data"])
+
+            error = None
+            try:
+                write_json_atomic(file_path, entry["data"])
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                # Jika data yang lebih baru sudah antre, hasil tulisan ini tidak lagi relevan
+                superseded = file_path in self._pending
+                retry = (error is not None and not superseded
+                         and entry["attempts"] + 1 < MAX_ATTEMPTS and not self._stopping)
+
+            # Callback dipanggil sebelum flush() dilepas agar pemanggil melihat keadaan akhir
+            if error is None and not superseded:
+                self._notify(self.on_written, file_path, entry["data"], entry["token"])
+            elif error is not None and not superseded and not retry:
+                self._notify(self.on_error, file_path, error)
+
+            with self._cond:
+                self._in_progress = None
+                if error is None:
+                    self.writes += 1
+                elif retry:
+                    # Coba lagi sebentar kemudian dengan jeda yang makin panjang
+                    entry["attempts"] += 1
+                    entry["due"] = time.monotonic() + self.debounce_seconds * (entry["attempts"] + 1)
+                    self._pending[file_path] = entry
+                self._cond.notify_all()
+
+    def _notify(self, callback, *args):
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"Peringatan: Callback penyimpanan gagal: {e}")
@@ -0,0 +1,667 @@
+# file: core/storage/sqlite_storage.py
+
+import os
+import json
+import sqlite3
+import threading
+
+import config
+from core import content_ids
+from core.row_diff import longest_increasing_subsequence
+from .base import StorageBackend
+from .subject_catalog import CATALOG_FILE_NAME
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS topics (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    icon TEXT
+);
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    topic_id INTEGER NOT NULL REFERENCES topics(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    earliest_date TEXT,
+    earliest_code TEXT,
+    icon TEXT,
+    extra TEXT,
+    revision INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (topic_id, name)
+);
+CREATE TABLE IF NOT EXISTS discussions (
+    subject_id INTEGER NOT NULL REFERENCES subjects(id) ON DELETE CASCADE,
+    item_id INTEGER NOT NULL,
+    sort_key INTEGER NOT NULL,
+    discussion TEXT,
+    date TEXT,
+    repetition_code TEXT,
+    finished INTEGER,
+    finished_date TEXT,
+    has_points INTEGER NOT NULL DEFAULT 1,
+    extra TEXT,
+    PRIMARY KEY (subject_id, item_id)
+);
+CREATE TABLE IF NOT EXISTS points (
+    subject_id INTEGER NOT NULL REFERENCES subjects(id) ON DELETE CASCADE,
+    item_id INTEGER NOT NULL,
+    discussion_id INTEGER NOT NULL,
+    sort_key INTEGER NOT NULL,
+    point_text TEXT,
+    date TEXT,
+    repetition_code TEXT,
+    finished INTEGER,
+    finished_date TEXT,
+    extra TEXT,
+    PRIMARY KEY (subject_id, item_id)
+);
+CREATE TABLE IF NOT EXISTS task_categories (
+    position INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    icon TEXT,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    category_position INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT,
+    count INTEGER,
+    date TEXT,
+    checked INTEGER,
+    extra TEXT,
+    PRIMARY KEY (category_position, position)
+);
+CREATE INDEX IF NOT EXISTS idx_discussions_date ON discussions(date);
+CREATE INDEX IF NOT EXISTS idx_discussions_code ON discussions(repetition_code);
+CREATE INDEX IF NOT EXISTS idx_points_date ON points(date);
+CREATE INDEX IF NOT EXISTS idx_points_code ON points(repetition_code);
+CREATE INDEX IF NOT EXISTS idx_tasks_date ON tasks(date);
+"""
+
+DISCUSSION_FIELDS = ("discussion", "date", "repetition_code", "finished", "finished_date", "points", content_ids.ID_KEY)
+POINT_FIELDS = ("point_text", "date", "repetition_code", "finished", "finished_date", content_ids.ID_KEY)
+TASK_FIELDS = ("name", "count", "date", "checked")
+
+# Jarak antar sort_key; item yang disisipkan mendapat kunci di celah antara tetangganya
+SORT_KEY_GAP = 1 << 20
+
+def _encode_extra(data, known_fields):
+    """Menyimpan key yang tidak punya kolom sendiri sebagai JSON agar tidak hilang."""
+    extra = {k: v for k, v in data.items() if k not in known_fields}
+    return json.dumps(extra, sort_keys=True, ensure_ascii=False) if extra else None
+
+def _encode_flag(data, key):
+    """None jika key tidak ada, agar bentuk dict asli bisa dibangun ulang."""
+    return int(bool(data[key])) if key in data else None
+
+def _discussion_row(discussion):
+    return (
+        discussion.get("discussion"), discussion.get("date"), discussion.get("repetition_code"),
+        _encode_flag(discussion, "finished"), discussion.get("finished_date"),
+        1 if "points" in discussion else 0, _encode_extra(discussion, DISCUSSION_FIELDS)
+    )
+
+def _point_row(point):
+    return (
+        point.get("point_text"), point.get("date"), point.get("repetition_code"),
+        _encode_flag(point, "finished"), point.get("finished_date"),
+        _encode_extra(point, POINT_FIELDS)
+    )
+
+def _apply_common_fields(target, finished, finished_date, extra):
+    if finished is not None:
+        target["finished"] = bool(finished)
+    if finished_date is not None:
+        target["finished_date"] = finished_date
+    if extra:
+        target.update(json.loads(extra))
+    return target
+
+def _discussion_from_row(text, date, code, finished, finished_date, has_points, extra, points):
+    discussion = {"discussion": text, "date": date, "repetition_code": code}
+    if has_points:
+        discussion["points"] = points
+    return _apply_common_fields(discussion, finished, finished_date, extra)
+
+def _point_from_row(text, date, code, finished, finished_date, extra):
+    point = {"point_text": text, "repetition_code": code, "date": date}
+    return _apply_common_fields(point, finished, finished_date, extra)
+
+def _sort_keys(item_ids, old_keys):
+    """
+    sort_key untuk item_ids (sesuai urutan baru). Item yang urutan relatifnya tidak
+    berubah (subbarisan naik terpanjang) mempertahankan kuncinya; item baru atau yang
+    dipindah mendapat kunci di celah antara tetangganya, sehingga menyisipkan satu
+    item di awal hanya menulis satu baris. Jika celahnya habis, semua kunci dibagi ulang.
+    """
+    keys = [None] * len(item_ids)
+    known = [index for index, item_id in enumerate(item_ids) if item_id in old_keys]
+    for position in longest_increasing_subsequence([old_keys[item_ids[index]] for index in known]):
+        index = known[position]
+        keys[index] = old_keys[item_ids[index]]
+    start = 0
+    while start < len(keys):
+        if keys[start] is not None:
+            start += 1
+            continue
+        end = start
+        while end < len(keys) and keys[end] is None:
+            end += 1
+        low = keys[start - 1] if start > 0 else None
+        high = keys[end] if end < len(keys) else None
+        count = end - start
+        if low is None and high is None:
+            first, step = SORT_KEY_GAP, SORT_KEY_GAP
+        elif high is None:
+            first, step = low + SORT_KEY_GAP, SORT_KEY_GAP
+        elif low is None:
+            first, step = high - SORT_KEY_GAP * count, SORT_KEY_GAP
+        else:
+            step = (high - low) // (count + 1)
+            if step == 0:
+                return {item_id: (index + 1) * SORT_KEY_GAP for index, item_id in enumerate(item_ids)}
+            first = low + step
+        for offset in range(count):
+            keys[start + offset] = first + offset * step
+        start = end
+    return dict(zip(item_ids, keys))
+
+def _content_rows(discussions, old_disc, old_points):
+    """
+    Baris diskusi {ID: (sort_key, ...)} dan point {ID: (ID diskusi, sort_key, ...)}
+    untuk isi subject; sort_key lama dipakai ulang selama urutan relatifnya sama.
+    """
+    disc_keys = _sort_keys([discussion[content_ids.ID_KEY] for discussion in discussions],
+                           {item_id: row[0] for item_id, row in old_disc.items()})
+    disc_rows, point_rows = {}, {}
+    for discussion in discussions:
+        disc_id = discussion[content_ids.ID_KEY]
+        disc_rows[disc_id] = (disc_keys[disc_id],) + _discussion_row(discussion)
+        points = discussion.get("points") or []
+        point_ids = [point[content_ids.ID_KEY] for point in points]
+        # Kunci lama hanya berlaku jika point masih di diskusi yang sama
+        old_keys = {item_id: old_points[item_id][1] for item_id in point_ids
+                    if item_id in old_points and old_points[item_id][0] == disc_id}
+        point_keys = _sort_keys(point_ids, old_keys)
+        for point in points:
+            point_id = point[content_ids.ID_KEY]
+            point_rows[point_id] = (disc_id, point_keys[point_id]) + _point_row(point)
+    return disc_rows, point_rows
+
+class SqliteStorage(StorageBackend):
+    """
+    Backend SQLite: discussion, point, dan task disimpan sebagai baris.
+
+    Saat menyimpan, baris baru dibandingkan dengan snapshot baris terakhir
+    yang diketahui sehingga hanya baris yang benar-benar berubah yang ditulis.
+    Baris diskusi dan point dikunci dengan ID item; urutannya disimpan di kolom
+    sort_key yang bercelah, jadi menyisipkan atau menghapus item tidak menggeser
+    kunci baris lain.
+    """
+    name = "sqlite"
+
+    def __init__(self, base_path, task_data_file, db_path=None):
+        super().__init__(base_path, task_data_file)
+        self.db_path = db_path or config.SQLITE_DB_PATH
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        # Koneksi dipakai bersama oleh beberapa thread, jadi diamankan dengan lock.
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        legacy_contents = self._read_positional_contents()
+        self._conn.executescript(SCHEMA)
+        # Database lama belum punya kolom revision pada subjects
+        subject_columns = {row[1] for row in self._conn.execute("PRAGMA table_info(subjects)")}
+        if "revision" not in subject_columns:
+            self._conn.execute("ALTER TABLE subjects ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+        self._conn.commit()
+        if legacy_contents:
+            self._store_upgraded_contents(legacy_contents)
+        # subject_id -> (baris diskusi, baris point, metadata JSON, extra JSON)
+        self._snapshots = {}
+        # subject_id -> nomor revisi (juga disimpan di subjects.revision) dan perkiraan
+        # ukuran, untuk validasi cache konten
+        self._revisions = {}
+        self._approx_sizes = {}
+
+    # --- Meta ---
+
+    def get_meta(self, key, default=None):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def is_empty(self):
+        """True jika database belum berisi topic maupun task."""
+        with self._lock:
+            topic_count = self._conn.execute("SELECT COUNT(*) FROM topics").fetchone()[0]
+        return topic_count == 0 and not self.tasks_exist()
+
+    # --- Path Virtual ---
+
+    def _topic_name(self, topic_path):
+        return os.path.basename(os.path.normpath(topic_path))
+
+    def _subject_key(self, file_path):
+        topic_name = os.path.basename(os.path.dirname(os.path.normpath(file_path)))
+        subject_name = os.path.splitext(os.path.basename(file_path))[0]
+        return topic_name, subject_name
+
+    def _topic_id(self, topic_name, create=False):
+        row = self._conn.execute("SELECT id FROM topics WHERE name = ?", (topic_name,)).fetchone()
+        if row:
+            return row[0]
+        if not create:
+            return None
+        cursor = self._conn.execute("INSERT INTO topics (name, icon) VALUES (?, NULL)", (topic_name,))
+        return cursor.lastrowid
+
+    def _subject_id(self, file_path, create=False):
+        topic_name, subject_name = self._subject_key(file_path)
+        topic_id = self._topic_id(topic_name, create=create)
+        if topic_id is None:
+            return None
+        row = self._conn.execute(
+            "SELECT id FROM subjects WHERE topic_id = ? AND name = ?", (topic_id, subject_name)
+        ).fetchone()
+        if row:
+            return row[0]
+        if not create:
+            return None
+        cursor = self._conn.execute(
+            "INSERT INTO subjects (topic_id, name) VALUES (?, ?)", (topic_id, subject_name)
+        )
+        return cursor.lastrowid
+
+    # --- Topics ---
+
+    def get_topics(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT name, icon FROM topics ORDER BY name").fetchall()
+        return [{'name': name, 'icon': icon or config.DEFAULT_TOPIC_ICON} for name, icon in rows]
+
+    def save_topic_config(self, topic_name, data):
+        with self._lock, self._conn:
+            topic_id = self._topic_id(topic_name, create=True)
+            self._conn.execute("UPDATE topics SET icon = ? WHERE id = ?", (data.get('icon'), topic_id))
+
+    def create_directory(self, path):
+        with self._lock, self._conn:
+            self._topic_id(self._topic_name(path), create=True)
+
+    def delete_directory(self, path):
+        with self._lock, self._conn:
+            topic_id = self._topic_id(self._topic_name(path))
+            if topic_id is None:
+                raise FileNotFoundError(path)
+            for (subject_id,) in self._conn.execute("SELECT id FROM subjects WHERE topic_id = ?", (topic_id,)).fetchall():
+                self._snapshots.pop(subject_id, None)
+                self._bump_revision(subject_id)
+            self._conn.execute("DELETE FROM topics WHERE id = ?", (topic_id,))
+
+    # --- Subjects ---
+
+    def get_subjects(self, topic_path):
+        if not topic_path:
+            return []
+        with self._lock:
+            topic_id = self._topic_id(self._topic_name(topic_path))
+            if topic_id is None:
+                return []
+            rows = self._conn.execute(
+                "SELECT name, earliest_date, earliest_code, icon FROM subjects WHERE topic_id = ?", (topic_id,)
+            ).fetchall()
+        return [
+            {'name': name, 'date': date, 'code': code, 'icon': icon or config.DEFAULT_SUBJECT_ICON}
+            for name, date, code, icon in rows
+        ]
+
+    def iter_subject_paths(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT topics.name, subjects.name FROM subjects JOIN topics ON topics.id = subjects.topic_id "
+                "ORDER BY topics.name, subjects.name"
+            ).fetchall()
+        for topic_name, subject_name in rows:
+            yield os.path.join(self.base_path, topic_name, f"{subject_name}.json")
+
+    def content_exists(self, file_path):
+        with self._lock:
+            return self._subject_id(file_path) is not None
+
+    def load_content(self, file_path):
+        with self._lock:
+            subject_id = self._subject_id(file_path)
+            if subject_id is None:
+                return None
+            metadata_json, extra_json = self._conn.execute(
+                "SELECT metadata, extra FROM subjects WHERE id = ?", (subject_id,)
+            ).fetchone()
+            disc_rows, point_rows = self._read_rows(subject_id)
+            self._snapshots[subject_id] = (disc_rows, point_rows, metadata_json, extra_json)
+
+        points_by_discussion = {}
+        for point_id, row in sorted(point_rows.items(), key=lambda item: item[1][1]):
+            point = _point_from_row(*row[2:])
+            point[content_ids.ID_KEY] = point_id
+            points_by_discussion.setdefault(row[0], []).append(point)
+
+        content = []
+        for disc_id, row in sorted(disc_rows.items(), key=lambda item: item[1][0]):
+            discussion = _discussion_from_row(*row[1:], points_by_discussion.get(disc_id, []))
+            discussion[content_ids.ID_KEY] = disc_id
+            content.append(discussion)
+
+        data = {"content": content, "metadata": json.loads(metadata_json or "{}")}
+        if extra_json:
+            data.update(json.loads(extra_json))
+        return data
+
+    def save_content(self, file_path, data):
+        # Baris dikunci dengan ID item; data tanpa ID (mis. saat migrasi) mendapatkannya di sini
+        content_ids.assign_ids(data)
+        metadata = data.get("metadata") or {}
+        metadata_json = json.dumps(metadata, sort_keys=True, ensure_ascii=False)
+        extra_json = _encode_extra(data, ("content", "metadata"))
+
+        with self._lock, self._conn:
+            subject_id = self._subject_id(file_path, create=True)
+            if subject_id not in self._snapshots:
+                old_disc, old_points = self._read_rows(subject_id)
+                old_meta, old_extra = self._conn.execute(
+                    "SELECT metadata, extra FROM subjects WHERE id = ?", (subject_id,)
+                ).fetchone()
+            else:
+                old_disc, old_points, old_meta, old_extra = self._snapshots[subject_id]
+
+            disc_rows, point_rows = _content_rows(data.get("content", []), old_disc, old_points)
+            self._write_rows(subject_id, disc_rows, point_rows, old_disc, old_points)
+            if metadata_json != old_meta or extra_json != old_extra:
+                self._conn.execute(
+                    "UPDATE subjects SET metadata = ?, earliest_date = ?, earliest_code = ?, icon = ?, extra = ? WHERE id = ?",
+                    (metadata_json, metadata.get("earliest_date"), metadata.get("earliest_code"),
+                     metadata.get("icon"), extra_json, subject_id)
+                )
+            self._snapshots[subject_id] = (disc_rows, point_rows, metadata_json, extra_json)
+            self._bump_revision(subject_id, point_rows)
+
+    def signature(self, file_path):
+        with self._lock:
+            subject_id = self._subject_id(file_path)
+            if subject_id is None:
+                return None
+            if subject_id not in self._approx_sizes:
+                self._approx_sizes[subject_id] = self._conn.execute(
+                    "SELECT COALESCE(SUM(LENGTH(point_text)), 0) + 128 * COUNT(*) FROM points WHERE subject_id = ?",
+                    (subject_id,)
+                ).fetchone()[0]
+            return ((subject_id, self._revision(subject_id)), self._approx_sizes[subject_id])
+
+    def stable_version(self, file_path):
+        # Revisi disimpan di database, jadi versi dari signature() tetap berlaku setelah dibuka ulang
+        signature = self.signature(file_path)
+        return signature[0] if signature else None
+
+    def _revision(self, subject_id):
+        if subject_id not in self._revisions:
+            row = self._conn.execute("SELECT revision FROM subjects WHERE id = ?", (subject_id,)).fetchone()
+            self._revisions[subject_id] = row[0] if row else 0
+        return self._revisions[subject_id]
+
+    def _bump_revision(self, subject_id, point_rows=None):
+        self._revisions[subject_id] = self._revision(subject_id) + 1
+        self._conn.execute("UPDATE subjects SET revision = ? WHERE id = ?", (self._revisions[subject_id], subject_id))
+        if point_rows is None:
+            self._approx_sizes.pop(subject_id, None)
+        else:
+            self._approx_sizes[subject_id] = sum(len(row[2] or '') + 128 for row in point_rows.values())
+
+    def _is_topic_path(self, path):
+        """Topic berada langsung di bawah base_path; subject satu tingkat di bawah topic-nya."""
+        return os.path.dirname(os.path.normpath(path)) == os.path.normpath(self.base_path)
+
+    def rename_path(self, old_path, new_path):
+        with self._lock, self._conn:
+            # Jenis path ditentukan dari letaknya dan baris yang ada di database, bukan dari ekstensinya
+            if self._is_topic_path(old_path):
+                topic_id = self._topic_id(self._topic_name(old_path))
+                if topic_id is None:
+                    raise FileNotFoundError(old_path)
+                new_name = self._topic_name(new_path)
+                if self._topic_id(new_name) is not None:
+                    raise FileExistsError(new_path)
+                self._conn.execute("UPDATE topics SET name = ? WHERE id = ?", (new_name, topic_id))
+            else:
+                subject_id = self._subject_id(old_path)
+                if subject_id is None:
+                    raise FileNotFoundError(old_path)
+                if self._subject_id(new_path) is not None:
+                    raise FileExistsError(new_path)
+                _, new_name = self._subject_key(new_path)
+                self._conn.execute("UPDATE subjects SET name = ? WHERE id = ?", (new_name, subject_id))
+
+    def delete_file(self, path):
+        with self._lock, self._conn:
+            subject_id = self._subject_id(path)
+            if subject_id is None:
+                raise FileNotFoundError(path)
+            self._snapshots.pop(subject_id, None)
+            self._bump_revision(subject_id)
+            self._conn.execute("DELETE FROM subjects WHERE id = ?", (subject_id,))
+
+    def _read_rows(self, subject_id):
+        disc_rows = {
+            row[0]: tuple(row[1:]) for row in self._conn.execute(
+                "SELECT item_id, sort_key, discussion, date, repetition_code, finished, finished_date, has_points, extra "
+                "FROM discussions WHERE subject_id = ?", (subject_id,)
+            )
+        }
+        point_rows = {
+            row[0]: tuple(row[1:]) for row in self._conn.execute(
+                "SELECT item_id, discussion_id, sort_key, point_text, date, repetition_code, finished, finished_date, extra "
+                "FROM points WHERE subject_id = ?", (subject_id,)
+            )
+        }
+        return disc_rows, point_rows
+
+    def _write_rows(self, subject_id, disc_rows, point_rows, old_disc, old_points):
+        # Hanya baris yang berubah, bertambah, atau hilang yang menyentuh database
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO discussions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(subject_id, item_id) + row for item_id, row in disc_rows.items() if old_disc.get(item_id) != row]
+        )
+        self._conn.executemany(
+            "DELETE FROM discussions WHERE subject_id = ? AND item_id = ?",
+            [(subject_id, item_id) for item_id in old_disc if item_id not in disc_rows]
+        )
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO points VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(subject_id, item_id) + row for item_id, row in point_rows.items() if old_points.get(item_id) != row]
+        )
+        self._conn.executemany(
+            "DELETE FROM points WHERE subject_id = ? AND item_id = ?",
+            [(subject_id, item_id) for item_id in old_points if item_id not in point_rows]
+        )
+
+    # --- Peningkatan Skema ---
+
+    def _read_positional_contents(self):
+        """
+        Database dari versi sebelumnya mengunci baris diskusi/point dengan posisinya.
+        Isinya dibaca dengan susunan lama lalu tabelnya dibuang agar dibuat ulang
+        dengan kunci ID item. Mengembalikan {subject_id: data}, kosong jika tidak perlu.
+        """
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(discussions)")}
+        if not columns or "item_id" in columns:
+            return {}
+        contents = {}
+        for subject_id, metadata_json in self._conn.execute("SELECT id, metadata FROM subjects").fetchall():
+            points_by_discussion = {}
+            for row in self._conn.execute(
+                "SELECT discussion_position, point_text, date, repetition_code, finished, finished_date, extra "
+                "FROM points WHERE subject_id = ? ORDER BY discussion_position, position", (subject_id,)
+            ):
+                points_by_discussion.setdefault(row[0], []).append(_point_from_row(*row[1:]))
+            content = [
+                _discussion_from_row(*row[1:], points_by_discussion.get(row[0], []))
+                for row in self._conn.execute(
+                    "SELECT position, discussion, date, repetition_code, finished, finished_date, has_points, extra "
+                    "FROM discussions WHERE subject_id = ? ORDER BY position", (subject_id,)
+                )
+            ]
+            contents[subject_id] = {"content": content, "metadata": json.loads(metadata_json or "{}")}
+        with self._conn:
+            self._conn.execute("DROP TABLE points")
+            self._conn.execute("DROP TABLE discussions")
+        return contents
+
+    def _store_upgraded_contents(self, contents):
+        with self._lock, self._conn:
+            for subject_id, data in contents.items():
+                # ID diberikan sesuai urutan dokumen, sama seperti saat subject lama dimuat
+                content_ids.assign_ids(data)
+                disc_rows, point_rows = _content_rows(data["content"], {}, {})
+                self._write_rows(subject_id, disc_rows, point_rows, {}, {})
+                self._conn.execute(
+                    "UPDATE subjects SET metadata = ? WHERE id = ?",
+                    (json.dumps(data["metadata"], sort_keys=True, ensure_ascii=False), subject_id)
+                )
+
+    # --- Tasks ---
+
+    def load_tasks(self):
+        if not self.tasks_exist():
+            return None
+        with self._lock:
+            category_rows = self._conn.execute(
+                "SELECT position, name, icon, extra FROM task_categories ORDER BY position"
+            ).fetchall()
+            task_rows = self._conn.execute(
+                "SELECT category_position, name, count, date, checked, extra FROM tasks ORDER BY category_position, position"
+            ).fetchall()
+
+        tasks_by_category = {}
+        for cat_pos, name, count, date, checked, extra in task_rows:
+            task = {"name": name, "count": count or 0, "date": date, "checked": bool(checked)}
+            if extra:
+                task.update(json.loads(extra))
+            tasks_by_category.setdefault(cat_pos, []).append(task)
+
+        categories = []
+        for pos, name, icon, extra in category_rows:
+            category = {"name": name, "icon": icon, "tasks": tasks_by_category.get(pos, [])}
+            if extra:
+                category.update(json.loads(extra))
+            categories.append(category)
+        return {"categories": categories}
+
+    def save_tasks(self, data):
+        category_rows, task_rows = {}, {}
+        for cat_pos, category in enumerate(data.get("categories", [])):
+            category_rows[cat_pos] = (category.get("name"), category.get("icon"),
+                                      _encode_extra(category, ("name", "icon", "tasks")))
+            for pos, task in enumerate(category.get("tasks", [])):
+                task_rows[(cat_pos, pos)] = (task.get("name"), task.get("count", 0), task.get("date"),
+                                             int(bool(task.get("checked", False))), _encode_extra(task, TASK_FIELDS))
+
+        with self._lock, self._conn:
+            # Seperti save_content: hanya baris yang berubah, bertambah, atau hilang yang ditulis
+            old_categories = {row[0]: tuple(row[1:]) for row in self._conn.execute(
+                "SELECT position, name, icon, extra FROM task_categories")}
+            old_tasks = {(row[0], row[1]): tuple(row[2:]) for row in self._conn.execute(
+                "SELECT category_position, position, name, count, date, checked, extra FROM tasks")}
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO task_categories VALUES (?, ?, ?, ?)",
+                [(pos,) + row for pos, row in category_rows.items() if old_categories.get(pos) != row]
+            )
+            self._conn.executemany(
+                "DELETE FROM task_categories WHERE position = ?",
+                [(pos,) for pos in old_categories if pos not in category_rows]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [key + row for key, row in task_rows.items() if old_tasks.get(key) != row]
+            )
+            self._conn.executemany(
+                "DELETE FROM tasks WHERE category_position = ? AND position = ?",
+                [key for key in old_tasks if key not in task_rows]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('tasks_initialized', '1')")
+
+    def apply_task_operation(self, op, current_data=None):
+        """Operasi yang sering dipakai langsung diterjemahkan menjadi UPDATE satu baris."""
+        op_type = op.get("op")
+        if op_type in ("set_task_checked", "set_category_icon", "rename_category"):
+            with self._lock, self._conn:
+                if op_type == "set_task_checked":
+                    # Sama seperti task_operations: hanya task pertama dengan nama itu yang diubah
+                    cursor = self._conn.execute(
+                        "UPDATE tasks SET checked = ? WHERE rowid = ("
+                        "SELECT tasks.rowid FROM tasks JOIN task_categories "
+                        "ON task_categories.position = tasks.category_position "
+                        "WHERE task_categories.name = ? AND tasks.name = ? "
+                        "ORDER BY task_categories.position, tasks.position LIMIT 1)",
+                        (int(bool(op["checked"])), op["category"], op["task_name"])
+                    )
+                elif op_type == "set_category_icon":
+                    cursor = self._conn.execute(
+                        "UPDATE task_categories SET icon = ? WHERE name = ?", (op["icon"], op["name"])
+                    )
+                else:
+                    if self._conn.execute("SELECT 1 FROM task_categories WHERE name = ?", (op["new_name"],)).fetchone():
+                        return False
+                    cursor = self._conn.execute(
+                        "UPDATE task_categories SET name = ? WHERE name = ?", (op["new_name"], op["old_name"])
+                    )
+                return cursor.rowcount > 0
+        return super().apply_task_operation(op, current_data)
+
+    def tasks_exist(self):
+        return self.get_meta('tasks_initialized') == '1'
+
+    # --- Backup ---
+
+    def write_backup(self, zipf, arc_root):
+        """Backup tetap ditulis dalam format folder JSON agar bisa diimpor oleh backend mana pun."""
+        for topic in self.get_topics():
+            topic_path = os.path.join(self.base_path, topic['name'])
+            topic_config = {'icon': topic['icon']}
+            zipf.writestr(os.path.relpath(os.path.join(topic_path, 'topic_config.json'), arc_root),
+                          json.dumps(topic_config, indent=4))
+            for subject in self.get_subjects(topic_path):
+                file_path = os.path.join(topic_path, f"{subject['name']}.json")
+                zipf.writestr(os.path.relpath(file_path, arc_root),
+                              json.dumps(self.load_content(file_path), indent=4))
+
+        tasks_data = self.load_tasks()
+        if tasks_data is not None:
+            zipf.writestr(os.path.relpath(self.task_data_file, arc_root), json.dumps(tasks_data, indent=4))
+
+    def import_topic_directory(self, source_topic_path, dest_topic_name):
+        dest_topic_path = os.path.join(self.base_path, dest_topic_name)
+        self.create_directory(dest_topic_path)
+        for file_name in os.listdir(source_topic_path):
+            if not file_name.endswith('.json') or file_name == CATALOG_FILE_NAME:
+                continue
+            try:
+                with open(os.path.join(source_topic_path, file_name), 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                continue
+            if file_name == 'topic_config.json':
+                self.save_topic_config(dest_topic_name, data)
+            else:
+                self.save_content(os.path.join(dest_topic_path, file_name), data)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,83 @@
+# file: core/storage/subject_catalog.py
+
+import os
+import json
+
+import config
+
+CATALOG_FILE_NAME = "subject_catalog.json"
+CATALOG_VERSION = 1
+# File di dalam folder topic yang bukan subject
+RESERVED_FILE_NAMES = {"topic_config.json", CATALOG_FILE_NAME}
+
+def is_subject_file(file_name):
+    """True jika nama file di folder topic adalah file subject."""
+    return file_name.endswith('.json') and file_name not in RESERVED_FILE_NAMES
+
+class SubjectCatalog:
+    """
+    Katalog per topic berisi metadata setiap subject beserta mtime dan ukuran filenya.
+
+    Daftar subject dapat diisi dari satu file kecil ini; file subject hanya
+    dibaca ulang jika stat-nya (mtime_ns, size) tidak lagi cocok, misalnya
+    karena diubah di luar aplikasi.
+    """
+    def __init__(self, topic_path):
+        self.topic_path = topic_path
+        self.catalog_path = os.path.join(topic_path, CATALOG_FILE_NAME)
+        self.entries = self._read()
+        self.dirty = False
+
+    def _read(self):
+        try:
+            with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CATALOG_VERSION:
+                return data.get("subjects", {})
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            pass
+        return {}
+
+    def save(self):
+        """Menulis katalog ke disk (atomik) jika ada perubahan."""
+        if not self.dirty or not os.path.isdir(self.topic_path):
+            return
+        temp_path = self.catalog_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": CATALOG_VERSION, "subjects": self.entries}, f, ensure_ascii=False)
+        os.replace(temp_path, self.catalog_path)
+        self.dirty = False
+
+    def update(self, name, stat_result, metadata):
+        """Mencatat metadata subject bersama stat file-nya."""
+        metadata = metadata or {}
+        self.entries[name] = {
+            "mtime_ns": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "date": metadata.get("earliest_date"),
+            "code": metadata.get("earliest_code"),
+            "icon": metadata.get("icon", config.DEFAULT_SUBJECT_ICON),
+        }
+        self.dirty = True
+
+    def remove(self, name):
+        if self.entries.pop(name, None) is not None:
+            self.dirty = True
+
+    def rename(self, old_name, new_name):
+        entry = self.entries.pop(old_name, None)
+        if entry is not None:
+            self.entries[new_name] = entry
+            self.dirty = True
+
+    def lookup(self, name, stat_result):
+        """Mengembalikan entri katalog jika masih valid untuk stat file saat ini."""
+        entry = self.entries.get(name)
+        if entry and entry.get("mtime_ns") == stat_result.st_mtime_ns and entry.get("size") == stat_result.st_size:
+            return entry
+        return None
+
+    def prune(self, existing_names):
+        """Membuang entri untuk subject yang filenya sudah tidak ada."""
+        for name in [n for n in self.entries if n not in existing_names]:
+            self.remove(name)
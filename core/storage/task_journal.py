@@ -0,0 +1,90 @@
+# file: core/storage/task_journal.py
+
+import os
+import json
+import threading
+
+class TaskJournal:
+    """
+    Jurnal append-only berisi operasi task bertipe (satu JSON per baris).
+
+    Setiap operasi diberi nomor urut (seq). Snapshot my_tasks.json menyimpan
+    seq terakhir yang sudah dilipat ke dalamnya ("journal_seq"), sehingga saat
+    replay hanya operasi yang lebih baru yang diterapkan ulang.
+    """
+    def __init__(self, journal_path):
+        self.journal_path = journal_path
+        self.last_seq = 0
+        self._lock = threading.Lock()
+        try:
+            self.size_bytes = os.path.getsize(journal_path)
+        except OSError:
+            self.size_bytes = 0
+
+    def read_operations(self, after_seq=0):
+        """Membaca operasi dengan seq > after_seq. Baris rusak (misal akibat crash) dilewati."""
+        operations = []
+        with self._lock:
+            try:
+                with open(self.journal_path, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except FileNotFoundError:
+                text = ""
+            if text and not text.endswith("\n"):
+                # Rekaman terakhir terpotong (crash saat append); buang agar append berikutnya tidak menempel
+                text = text[:text.rfind("\n") + 1]
+                self._rewrite(text)
+            for line in text.splitlines():
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    print("Peringatan: Baris jurnal task rusak dilewati.")
+                    continue
+                seq = op.get("seq", 0)
+                self.last_seq = max(self.last_seq, seq)
+                if seq > after_seq:
+                    operations.append(op)
+        self.last_seq = max(self.last_seq, after_seq)
+        return operations
+
+    def append(self, op):
+        """Menambahkan satu operasi ke akhir jurnal (O(1)) dan mengembalikan seq-nya."""
+        with self._lock:
+            self.last_seq += 1
+            line = json.dumps(dict(op, seq=self.last_seq), ensure_ascii=False) + "\n"
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+            self.size_bytes += len(line.encode('utf-8'))
+            return self.last_seq
+
+    def truncate_through(self, seq):
+        """Membuang operasi yang sudah tersimpan di snapshot (seq <= seq)."""
+        with self._lock:
+            try:
+                with open(self.journal_path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            except FileNotFoundError:
+                return
+            kept = []
+            for line in lines:
+                try:
+                    if json.loads(line).get("seq", 0) > seq:
+                        kept.append(line)
+                except json.JSONDecodeError:
+                    continue
+            self._rewrite("".join(kept))
+
+    def _rewrite(self, text):
+        """Mengganti isi jurnal secara atomik (file dihapus jika kosong)."""
+        if text:
+            temp_path = f"{self.journal_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(temp_path, self.journal_path)
+        elif os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self.size_bytes = len(text.encode('utf-8'))
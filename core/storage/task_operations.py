@@ -0,0 +1,104 @@
+# file: core/storage/task_operations.py
+
+import config
+
+# Jenis operasi task yang dikenal, beserta field wajibnya
+OPERATION_FIELDS = {
+    "create_category": ("name",),
+    "rename_category": ("old_name", "new_name"),
+    "set_category_icon": ("name", "icon"),
+    "delete_category": ("name",),
+    "move_category": ("index", "new_index"),
+    "save_task": ("category", "task_name", "data"),
+    "delete_task": ("category", "task_name"),
+    "set_task_checked": ("category", "task_name", "checked"),
+    "move_task": ("category", "index", "new_index"),
+}
+
+def make_operation(op_type, **fields):
+    """Membuat dict operasi task bertipe dan memvalidasi field-nya."""
+    missing = [f for f in OPERATION_FIELDS[op_type] if f not in fields]
+    if missing:
+        raise ValueError(f"Operasi '{op_type}' membutuhkan field: {', '.join(missing)}")
+    return {"op": op_type, **fields}
+
+def _find_category(categories, name):
+    for category in categories:
+        if category.get('name') == name:
+            return category
+    return None
+
+def _swap(items, index, new_index):
+    if 0 <= index < len(items) and 0 <= new_index < len(items):
+        items[index], items[new_index] = items[new_index], items[index]
+        return True
+    return False
+
+def apply_task_operation(tasks_data, op):
+    """
+    Menerapkan satu operasi ke struktur {"categories": [...]} secara in-place.
+    Mengembalikan True jika data berubah.
+    """
+    categories = tasks_data.setdefault("categories", [])
+    op_type = op.get("op")
+
+    if op_type == "create_category":
+        if _find_category(categories, op["name"]):
+            return False
+        categories.append({"name": op["name"], "icon": op.get("icon", config.DEFAULT_CATEGORY_ICON), "tasks": []})
+        return True
+
+    if op_type == "rename_category":
+        category = _find_category(categories, op["old_name"])
+        if not category or _find_category(categories, op["new_name"]):
+            return False
+        category['name'] = op["new_name"]
+        return True
+
+    if op_type == "set_category_icon":
+        category = _find_category(categories, op["name"])
+        if not category:
+            return False
+        category['icon'] = op["icon"]
+        return True
+
+    if op_type == "delete_category":
+        remaining = [cat for cat in categories if cat.get('name') != op["name"]]
+        changed = len(remaining) != len(categories)
+        categories[:] = remaining
+        return changed
+
+    if op_type == "move_category":
+        return _swap(categories, op["index"], op["new_index"])
+
+    category = _find_category(categories, op.get("category"))
+    if not category:
+        return False
+    tasks = category.setdefault("tasks", [])
+
+    if op_type == "save_task":
+        for i, task in enumerate(tasks):
+            if task.get('name') == op["task_name"]:
+                tasks[i] = op["data"]
+                return True
+        tasks.append(op["data"])
+        return True
+
+    if op_type == "delete_task":
+        remaining = [task for task in tasks if task.get('name') != op["task_name"]]
+        changed = len(remaining) != len(tasks)
+        tasks[:] = remaining
+        return changed
+
+    if op_type == "set_task_checked":
+        for task in tasks:
+            if task.get('name') == op["task_name"]:
+                task['checked'] = op["checked"]
+                return True
+        return False
+
+    if op_type == "move_task":
+        return _swap(tasks, op["index"], op["new_index"])
+
+    print(f"Peringatan: Operasi task '{op_type}' tidak dikenal, dilewati.")
+    return False
@@ -0,0 +1,191 @@
+# file: core/task_model.py
+
+import copy
+
+import config
+from core.all_tasks_view import AllTasksView
+
+class TaskModel:
+    """
+    Model task resident di memori dengan indeks dict.
+
+    - nama kategori -> dict kategori dan posisinya
+    - (kategori, nama task) -> dict task dan posisinya
+
+    Operasi bertipe (lihat core.storage.task_operations) diterapkan lewat
+    apply() yang memperbarui data dan indeks sekaligus, sehingga pencarian
+    tidak lagi memindai semua kategori dan task.
+    """
+    def __init__(self, tasks_data=None):
+        self.data = tasks_data if tasks_data is not None else {"categories": []}
+        self.categories = self.data.setdefault("categories", [])
+        # Tampilan "Semua Task" dibuat saat pertama diminta lalu ikut diperbarui oleh apply()
+        self._all_tasks_view = None
+        self._reindex()
+
+    # --- Indeks ---
+
+    def _reindex(self):
+        self._category_positions = {}
+        self._task_positions = {}
+        for index, category in enumerate(self.categories):
+            self._category_positions.setdefault(category.get('name'), index)
+        for name in self._category_positions:
+            self._reindex_category(name)
+
+    def _reindex_category(self, category_name):
+        positions = {}
+        for index, task in enumerate(self.get_category(category_name).setdefault("tasks", [])):
+            # Nama kembar: yang pertama menang, sama seperti pencarian linear sebelumnya
+            positions.setdefault(task.get('name'), index)
+        self._task_positions[category_name] = positions
+
+    def _reindex_categories(self):
+        """Posisi kategori bergeser (hapus), indeks task per kategori tetap valid."""
+        self._category_positions = {}
+        for index, category in enumerate(self.categories):
+            self._category_positions.setdefault(category.get('name'), index)
+
+    # --- Pembacaan O(1) ---
+
+    def get_category(self, name):
+        index = self._category_positions.get(name)
+        return self.categories[index] if index is not None else None
+
+    def category_index(self, name):
+        return self._category_positions.get(name)
+
+    def get_tasks(self, category_name):
+        category = self.get_category(category_name)
+        return category.get("tasks", []) if category else []
+
+    def get_task(self, category_name, task_name):
+        index = self._task_positions.get(category_name, {}).get(task_name)
+        return self.get_tasks(category_name)[index] if index is not None else None
+
+    def task_index(self, category_name, task_name):
+        return self._task_positions.get(category_name, {}).get(task_name)
+
+    def all_tasks_view(self):
+        """AllTasksView yang dipelihara secara inkremental oleh setiap operasi."""
+        if self._all_tasks_view is None:
+            self._all_tasks_view = AllTasksView(self.categories)
+        return self._all_tasks_view
+
+    def snapshot(self):
+        """Salinan lengkap data untuk ditulis ke disk."""
+        return copy.deepcopy(self.data)
+
+    # --- Penerapan Operasi ---
+
+    def apply(self, op):
+        """Menerapkan satu operasi task. Mengembalikan True jika data berubah."""
+        handler = getattr(self, f"_op_{op.get('op')}", None)
+        if handler is None:
+            print(f"Peringatan: Operasi task '{op.get('op')}' tidak dikenal, dilewati.")
+            return False
+        return handler(op)
+
+    def _op_create_category(self, op):
+        if op["name"] in self._category_positions:
+            return False
+        self.categories.append({"name": op["name"], "icon": op.get("icon", config.DEFAULT_CATEGORY_ICON), "tasks": []})
+        self._category_positions[op["name"]] = len(self.categories) - 1
+        self._task_positions[op["name"]] = {}
+        return True
+
+    def _op_rename_category(self, op):
+        old_name, new_name = op["old_name"], op["new_name"]
+        if old_name not in self._category_positions or new_name in self._category_positions:
+            return False
+        index = self._category_positions.pop(old_name)
+        self.categories[index]['name'] = new_name
+        self._category_positions[new_name] = index
+        self._task_positions[new_name] = self._task_positions.pop(old_name, {})
+        if self._all_tasks_view is not None:
+            self._all_tasks_view.category_renamed(old_name, new_name, self.categories[index].get("tasks", []))
+        return True
+
+    def _op_set_category_icon(self, op):
+        category = self.get_category(op["name"])
+        if not category:
+            return False
+        category['icon'] = op["icon"]
+        return True
+
+    def _op_delete_category(self, op):
+        if op["name"] not in self._category_positions:
+            return False
+        self.categories[:] = [cat for cat in self.categories if cat.get('name') != op["name"]]
+        self._task_positions.pop(op["name"], None)
+        self._reindex_categories()
+        if self._all_tasks_view is not None:
+            self._all_tasks_view.category_deleted(op["name"])
+        return True
+
+    def _op_move_category(self, op):
+        index, new_index = op["index"], op["new_index"]
+        if not (0 <= index < len(self.categories) and 0 <= new_index < len(self.categories)):
+            return False
+        first, second = self.categories[index], self.categories[new_index]
+        self.categories[index], self.categories[new_index] = second, first
+        if len(self._category_positions) != len(self.categories):
+            self._reindex_categories()
+        else:
+            self._category_positions[second.get('name')] = index
+            self._category_positions[first.get('name')] = new_index
+        return True
+
+    def _op_save_task(self, op):
+        category = self.get_category(op["category"])
+        if not category:
+            return False
+        tasks = category.setdefault("tasks", [])
+        positions = self._task_positions[op["category"]]
+        index = positions.get(op["task_name"])
+        if index is None:
+            tasks.append(op["data"])
+            positions.setdefault(op["data"].get('name'), len(tasks) - 1)
+        else:
+            tasks[index] = op["data"]
+            if op["data"].get('name') != op["task_name"]:
+                self._reindex_category(op["category"])
+        if self._all_tasks_view is not None:
+            self._all_tasks_view.task_saved(op["category"], op["task_name"], op["data"], replaced=index is not None)
+        return True
+
+    def _op_delete_task(self, op):
+        if self.task_index(op["category"], op["task_name"]) is None:
+            return False
+        category = self.get_category(op["category"])
+        category["tasks"] = [task for task in category.get("tasks", []) if task.get('name') != op["task_name"]]
+        self._reindex_category(op["category"])
+        if self._all_tasks_view is not None:
+            self._all_tasks_view.task_deleted(op["category"], op["task_name"])
+        return True
+
+    def _op_set_task_checked(self, op):
+        task = self.get_task(op["category"], op["task_name"])
+        if task is None:
+            return False
+        task['checked'] = op["checked"]
+        if self._all_tasks_view is not None:
+            self._all_tasks_view.task_checked(op["category"], op["task_name"], op["checked"])
+        return True
+
+    def _op_move_task(self, op):
+        tasks = self.get_tasks(op["category"])
+        index, new_index = op["index"], op["new_index"]
+        if not (0 <= index < len(tasks) and 0 <= new_index < len(tasks)):
+            return False
+        first, second = tasks[index], tasks[new_index]
+        tasks[index], tasks[new_index] = second, first
+        positions = self._task_positions[op["category"]]
+        if len(positions) != len(tasks):
+            # Ada nama kembar; hitung ulang agar "yang pertama menang" tetap benar
+            self._reindex_category(op["category"])
+        else:
+            # Hanya dua entri posisi yang berubah
+            positions[first.get('name')] = new_index
+            positions[second.get('name')] = index
+        return True
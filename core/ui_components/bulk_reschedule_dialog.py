@@ -0,0 +1,88 @@
+# file: core/ui_components/bulk_reschedule_dialog.py
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QFormLayout, QComboBox, QLabel, QDialogButtonBox
+)
+from core.bulk_reschedule import select_items
+
+class BulkRescheduleDialog(QDialog):
+    """
+    Dialog untuk memilih item yang dijadwalkan ulang sekaligus (cakupan, status
+    jatuh tempo, jenis item) dan kode repetisi barunya. Jumlah item yang cocok
+    diperbarui langsung dari indeks jatuh tempo.
+    """
+    def __init__(self, data_manager, parent=None, topic_path=None, subject_path=None, selected_ids=None):
+        super().__init__(parent)
+        self.setWindowTitle("Jadwalkan Ulang Massal")
+        self.setMinimumWidth(420)
+        self.data_manager = data_manager
+        self.topic_path = topic_path
+        self.subject_path = subject_path
+        self.selected_ids = selected_ids
+
+        self.layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.scope_combo = QComboBox()
+        if selected_ids:
+            self.scope_combo.addItem("Item terpilih", "selection")
+        if subject_path:
+            self.scope_combo.addItem("Subject ini", "subject")
+        if topic_path:
+            self.scope_combo.addItem("Topic ini", "topic")
+        self.scope_combo.addItem("Semua topic", "all")
+        form.addRow("Cakupan:", self.scope_combo)
+
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItem("Terlambat", "overdue")
+        self.filter_combo.addItem("Jatuh tempo hari ini", "today")
+        self.filter_combo.addItem("Terlambat dan hari ini", "due")
+        self.filter_combo.addItem("Semua yang terjadwal", "scheduled")
+        form.addRow("Item:", self.filter_combo)
+
+        self.type_combo = QComboBox()
+        self.type_combo.addItem("Diskusi dan point", None)
+        self.type_combo.addItem("Hanya point", "point")
+        self.type_combo.addItem("Hanya diskusi tanpa point", "discussion")
+        form.addRow("Jenis:", self.type_combo)
+
+        self.code_combo = QComboBox()
+        self.code_combo.addItem("(Pertahankan kode masing-masing)", None)
+        # Kode dari semua tangga; interval tetap diambil dari tangga topic setiap item
+        for code in data_manager.repetition_ladders.all_codes():
+            self.code_combo.addItem(code, code)
+        form.addRow("Kode baru:", self.code_combo)
+        self.layout.addLayout(form)
+
+        self.count_label = QLabel("")
+        self.layout.addWidget(self.count_label)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+        for combo in (self.scope_combo, self.filter_combo, self.type_combo):
+            combo.currentIndexChanged.connect(self.update_count)
+        self.update_count()
+
+    def selected_items(self):
+        """List (path, ID, kode sekarang) yang cocok dengan pilihan di dialog."""
+        scope = self.scope_combo.currentData()
+        path_prefix = {"subject": self.subject_path, "topic": self.topic_path}.get(scope)
+        return select_items(
+            self.data_manager, self.filter_combo.currentData(), path_prefix,
+            self.type_combo.currentData(), self.selected_ids if scope == "selection" else None
+        )
+
+    def new_code(self):
+        return self.code_combo.currentData()
+
+    def update_count(self):
+        items = self.selected_items()
+        subject_count = len({path for path, _, _ in items})
+        text = f"{len(items)} item di {subject_count} subject akan dijadwalkan ulang."
+        if self.data_manager.search_index.building:
+            text += " Indeks sedang diperbarui..."
+        self.count_label.setText(text)
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(bool(items))
@@ -0,0 +1,350 @@
+# file: core/ui_components/content_tree.py
+
+from PyQt6.QtWidgets import (
+    QTreeView, QStyledItemDelegate, QComboBox, QStyle, QStyleOptionComboBox, QApplication,
+    QAbstractItemView
+)
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, QItemSelectionModel, QTimer, pyqtSignal
+import config
+from core.row_diff import diff_keyed_rows
+
+CODE_COLUMN = 2
+# Skor kemiripan pencarian fuzzy; baris dengan skor ditampilkan tebal
+MATCH_SCORE_ROLE = Qt.ItemDataRole.UserRole + 1
+
+class ContentNode:
+    """Satu baris di content pane: diskusi (level atas) atau point (anak)."""
+    __slots__ = ("parent", "row", "children", "item_data", "texts", "code", "match_score")
+
+    def __init__(self, item_data, texts, code=None, match_score=None):
+        self.parent = None
+        self.row = 0
+        self.children = []
+        # Data CRUD yang sama seperti UserRole di QTreeWidget lama
+        self.item_data = item_data
+        self.texts = texts
+        # None = baris ini tidak punya editor kode repetisi (diskusi dengan point);
+        # kode kosong/tidak dikenal tetap bisa diedit
+        self.code = code
+        self.match_score = match_score
+
+    def add_child(self, child):
+        child.parent = self
+        child.row = len(self.children)
+        self.children.append(child)
+        return child
+
+def display_code(code, codes=config.REPETITION_CODES):
+    """Sama seperti QComboBox lama: kode yang tidak dikenal tampil sebagai pilihan pertama."""
+    return code if code in codes else codes[0]
+
+def _item_key(item_data):
+    return (item_data.get("type"), item_data.get("id"))
+
+class ContentTreeModel(QAbstractItemModel):
+    """
+    Model ringan di atas diskusi dan point subject yang sedang dibuka.
+    Tidak ada widget per baris; kode repetisi diedit lewat RepetitionCodeDelegate.
+    """
+    # (kode baru, item_data) saat pengguna memilih kode lain di editor
+    repetition_code_edited = pyqtSignal(str, dict)
+
+    HEADERS = ["Content", "Date", "Code"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._roots = []
+        self._index_by_key = {}
+        # Pilihan di editor kode: tangga repetisi subject yang sedang dibuka
+        self.repetition_codes = list(config.REPETITION_CODES)
+
+    # --- Pengisian ---
+
+    def set_nodes(self, roots):
+        self.beginResetModel()
+        self._roots = roots
+        for row, node in enumerate(roots):
+            node.row = row
+        self._rebuild_key_index()
+        self.endResetModel()
+
+    def clear(self):
+        self.set_nodes([])
+
+    def _rebuild_key_index(self):
+        self._index_by_key = {}
+        for node in self._roots:
+            self._index_by_key[_item_key(node.item_data)] = node
+            for child in node.children:
+                self._index_by_key[_item_key(child.item_data)] = child
+
+    # --- Patch Inkremental ---
+
+    def plan_update(self, roots):
+        """
+        Menghitung operasi baris (hapus, pindah, sisip) per level antara tampilan
+        sekarang dan roots. Mengembalikan None jika perubahannya melebihi
+        config.CONTENT_DIFF_MAX_ROW_CHANGES; reset model lebih murah untuk kasus itu.
+        """
+        plan = []
+        budget = [config.CONTENT_DIFF_MAX_ROW_CHANGES]
+        if not self._plan_level(None, self._roots, roots, plan, budget):
+            return None
+        return plan
+
+    def _plan_level(self, parent_node, old_nodes, new_nodes, plan, budget):
+        ops = diff_keyed_rows([_item_key(node.item_data) for node in old_nodes],
+                              [_item_key(node.item_data) for node in new_nodes], budget[0])
+        if ops is None:
+            return False
+        budget[0] -= len(ops)
+        new_by_key = {_item_key(node.item_data): node for node in new_nodes}
+        plan.append((parent_node, new_by_key, ops))
+        for old_node in old_nodes:
+            new_node = new_by_key.get(_item_key(old_node.item_data))
+            if new_node is not None and (old_node.children or new_node.children):
+                if not self._plan_level(old_node, old_node.children, new_node.children, plan, budget):
+                    return False
+        return True
+
+    def apply_update(self, plan):
+        """
+        Menerapkan rencana dari plan_update. Node yang tetap ada dipertahankan
+        (hanya isinya diperbarui), sehingga pilihan, ekspansi, dan posisi scroll
+        di view ikut terjaga tanpa perlu disimpan lalu dipulihkan.
+        """
+        for parent_node, new_by_key, ops in plan:
+            siblings = parent_node.children if parent_node else self._roots
+            parent_index = self.createIndex(parent_node.row, 0, parent_node) if parent_node else QModelIndex()
+            for op in ops:
+                if op[0] == "remove":
+                    row = op[1]
+                    self.beginRemoveRows(parent_index, row, row)
+                    siblings.pop(row)
+                    self._renumber(siblings)
+                    self.endRemoveRows()
+                elif op[0] == "move":
+                    source, target = op[1], op[2]
+                    # Qt memakai posisi tujuan sebelum baris diambil
+                    self.beginMoveRows(parent_index, source, source, parent_index, target + 1 if target > source else target)
+                    siblings.insert(target, siblings.pop(source))
+                    self._renumber(siblings)
+                    self.endMoveRows()
+                else:
+                    row, key = op[1], op[2]
+                    node = new_by_key[key]
+                    node.parent = parent_node
+                    self.beginInsertRows(parent_index, row, row)
+                    siblings.insert(row, node)
+                    self._renumber(siblings)
+                    self.endInsertRows()
+
+            for row, node in enumerate(siblings):
+                new_node = new_by_key[_item_key(node.item_data)]
+                if new_node is node:
+                    continue
+                if (node.texts, node.code, node.match_score) != (new_node.texts, new_node.code, new_node.match_score):
+                    node.texts, node.code, node.match_score = new_node.texts, new_node.code, new_node.match_score
+                    self.dataChanged.emit(self.createIndex(row, 0, node), self.createIndex(row, len(self.HEADERS) - 1, node))
+        self._rebuild_key_index()
+
+    @staticmethod
+    def _renumber(siblings):
+        for row, node in enumerate(siblings):
+            node.row = row
+
+    def index_for_item_data(self, item_data):
+        """QModelIndex (kolom 0) untuk item_data, atau index tidak valid jika tidak tampil."""
+        node = self._index_by_key.get(_item_key(item_data)) if item_data else None
+        if node is None:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else None
+
+    # --- Antarmuka QAbstractItemModel ---
+
+    def index(self, row, column, parent=QModelIndex()):
+        siblings = self.node(parent).children if parent.isValid() else self._roots
+        if 0 <= row < len(siblings) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, siblings[row])
+        return QModelIndex()
+
+    def parent(self, index):
+        node = self.node(index)
+        if node is None or node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children) if parent.isValid() else len(self._roots)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        node = self.node(index)
+        if node is None:
+            return None
+        column = index.column()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == CODE_COLUMN:
+                return display_code(node.code, self.repetition_codes) if node.code is not None else None
+            return node.texts[column]
+        if role == Qt.ItemDataRole.UserRole and column == 0:
+            return node.item_data
+        if role == MATCH_SCORE_ROLE and column == 0:
+            return node.match_score
+        if role == Qt.ItemDataRole.ToolTipRole and column == 0 and node.match_score is not None:
+            return f"Kemiripan: {node.match_score:.0%}"
+        return None
+
+    def flags(self, index):
+        node = self.node(index)
+        if node is None:
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == CODE_COLUMN and node.code is not None:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        node = self.node(index)
+        if node is None or index.column() != CODE_COLUMN or role != Qt.ItemDataRole.EditRole:
+            return False
+        if value != display_code(node.code, self.repetition_codes):
+            # Data asli diubah oleh handler (setelah konfirmasi), lalu model dibangun ulang
+            self.repetition_code_edited.emit(value, node.item_data)
+        return False
+
+class RepetitionCodeDelegate(QStyledItemDelegate):
+    """
+    Menggambar kolom kode sebagai combobox dan baru membuat QComboBox sungguhan
+    saat sel tersebut diedit. Juga menebalkan baris hasil pencarian fuzzy.
+    """
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.column() == 0 and index.data(MATCH_SCORE_ROLE) is not None:
+            option.font.setBold(True)
+
+    def paint(self, painter, option, index):
+        if index.column() != CODE_COLUMN or not (index.flags() & Qt.ItemFlag.ItemIsEditable):
+            super().paint(painter, option, index)
+            return
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        combo_option = QStyleOptionComboBox()
+        combo_option.rect = option.rect
+        combo_option.state = option.state | QStyle.StateFlag.State_Enabled
+        combo_option.palette = option.palette
+        combo_option.fontMetrics = option.fontMetrics
+        combo_option.currentText = index.data()
+        style.drawComplexControl(QStyle.ComplexControl.CC_ComboBox, combo_option, painter, widget)
+        style.drawControl(QStyle.ControlElement.CE_ComboBoxLabel, combo_option, painter, widget)
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(index.model().repetition_codes)
+        # Pilihan langsung diterapkan, seperti combobox per baris sebelumnya
+        combo.activated.connect(lambda _, editor=combo: self._commit_and_close(editor))
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data())
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor, QStyledItemDelegate.EndEditHint.NoHint)
+
+class ContentTreeView(QTreeView):
+    """
+    QTreeView untuk diskusi dan point. Hanya baris yang terlihat yang digambar,
+    dan editor kode repetisi dibuat saat diklik, bukan satu widget per baris.
+    """
+    # Dipancarkan saat baris aktif berubah (pengganti currentItemChanged)
+    current_item_changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.content_model = ContentTreeModel(self)
+        self.setModel(self.content_model)
+        self.setItemDelegate(RepetitionCodeDelegate(self))
+        self.setUniformRowHeights(True)
+        self.setEditTriggers(
+            QAbstractItemView.EditTrigger.CurrentChanged | QAbstractItemView.EditTrigger.SelectedClicked
+        )
+        self.selectionModel().currentRowChanged.connect(lambda *_: self.current_item_changed.emit())
+
+    def clear(self):
+        self.content_model.clear()
+
+    def set_repetition_codes(self, codes):
+        """Mengganti pilihan kode repetisi; baris yang tampil dibangun ulang jika tangganya berbeda."""
+        if codes != self.content_model.repetition_codes:
+            self.content_model.repetition_codes = list(codes)
+            self.clear()
+
+    def current_item_data(self):
+        """item_data ({"type", "id"}) dari baris aktif, atau None."""
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+        return index.siblingAtColumn(0).data(Qt.ItemDataRole.UserRole)
+
+    def show_nodes(self, roots, expand_all=False):
+        """
+        Menampilkan roots dengan mem-patch hanya baris yang berubah. Jika
+        perubahannya terlalu besar, model di-reset lalu ekspansi, pilihan,
+        dan posisi scroll dipulihkan berdasarkan item_data.
+        """
+        model = self.content_model
+        plan = model.plan_update(roots)
+        if plan is not None:
+            model.apply_update(plan)
+        else:
+            expanded_keys = {
+                _item_key(index.data(Qt.ItemDataRole.UserRole))
+                for index in (model.index(row, 0) for row in range(model.rowCount()))
+                if self.isExpanded(index)
+            }
+            current_data = self.current_item_data()
+            scroll_value = self.verticalScrollBar().value()
+            model.set_nodes(roots)
+            if not expand_all:
+                for node in roots:
+                    if _item_key(node.item_data) in expanded_keys:
+                        self.setExpanded(model.createIndex(node.row, 0, node), True)
+            if current_data:
+                self.select_item_data(current_data)
+            self.verticalScrollBar().setValue(scroll_value)
+        if expand_all:
+            self.expandAll()
+
+    def select_item_data(self, item_data, scroll=False):
+        """Memilih baris dengan item_data tersebut. Mengembalikan False jika tidak tampil."""
+        index = self.content_model.index_for_item_data(item_data)
+        if not index.isValid():
+            return False
+        if index.parent().isValid():
+            self.setExpanded(index.parent(), True)
+        self.selectionModel().setCurrentIndex(
+            index, QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows
+        )
+        if scroll:
+            self.scrollTo(index)
+        return True
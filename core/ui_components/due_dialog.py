@@ -0,0 +1,107 @@
+# file: core/ui_components/due_dialog.py
+
+import os
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QLabel, QTreeWidget, QTreeWidgetItem, QDialogButtonBox
+)
+from PyQt6.QtCore import Qt, QTimer
+import utils
+from core.content_records import ordinal_to_date, today_ordinal
+
+class DueTodayDialog(QDialog):
+    """
+    Dialog "Jatuh Tempo Hari Ini / Terlambat" untuk semua topic.
+    Isinya diambil dari indeks jatuh tempo DataManager, jadi tidak ada file
+    subject yang dibuka berapa pun jumlah subject-nya.
+    """
+    def __init__(self, data_manager, parent=None, date_format="long"):
+        super().__init__(parent)
+        self.setWindowTitle("Jatuh Tempo Hari Ini / Terlambat")
+        self.setMinimumSize(640, 420)
+        self.data_manager = data_manager
+        self.date_format = date_format
+        # (path subject, item_data) dari item yang dipilih pengguna
+        self.selected_result = None
+
+        self.layout = QVBoxLayout(self)
+
+        self.status_label = QLabel("")
+        self.layout.addWidget(self.status_label)
+
+        self.result_tree = QTreeWidget()
+        self.result_tree.setHeaderLabels(["Item", "Tanggal", "Kode"])
+        self.result_tree.setColumnWidth(0, 380)
+        self.result_tree.itemDoubleClicked.connect(self.open_result)
+        self.layout.addWidget(self.result_tree)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Open | QDialogButtonBox.StandardButton.Close)
+        self.button_box.accepted.connect(lambda: self.open_result(self.result_tree.currentItem()))
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+        # Selama indeks masih diisi di latar belakang, daftar dimuat ulang setelah selesai
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(300)
+        self.index_timer.timeout.connect(self._check_index_finished)
+        if self.data_manager.search_index.building:
+            self.index_timer.start()
+
+        self.populate()
+
+    def _check_index_finished(self):
+        if not self.data_manager.search_index.building:
+            self.index_timer.stop()
+            self.populate()
+
+    @staticmethod
+    def _count_text(counts):
+        return f"{counts['overdue']} terlambat, {counts['today']} hari ini"
+
+    def populate(self):
+        """Mengisi pohon Topic -> Subject -> item beserta jumlah per topic dan subject."""
+        self.result_tree.clear()
+        today = today_ordinal()
+        rows = self.data_manager.get_due_items(today)
+
+        topics = {}  # nama topic -> (item topic, counts, {path: (item subject, counts)})
+        total = {"overdue": 0, "today": 0}
+        for ordinal, path, item_id, code, text, item_type in rows:
+            topic_name = os.path.basename(os.path.dirname(path))
+            if topic_name not in topics:
+                topic_item = QTreeWidgetItem(self.result_tree)
+                topics[topic_name] = (topic_item, {"overdue": 0, "today": 0}, {})
+            topic_item, topic_counts, subjects = topics[topic_name]
+            if path not in subjects:
+                subject_item = QTreeWidgetItem(topic_item)
+                subjects[path] = (subject_item, {"overdue": 0, "today": 0})
+            subject_item, subject_counts = subjects[path]
+
+            bucket = "today" if ordinal == today else "overdue"
+            for counts in (total, topic_counts, subject_counts):
+                counts[bucket] += 1
+
+            item = QTreeWidgetItem(subject_item)
+            prefix = "" if item_type == "discussion" else "  • "
+            item.setText(0, f"{prefix}{text}")
+            item.setText(1, utils.format_date(ordinal_to_date(ordinal), self.date_format))
+            item.setText(2, code or "")
+            item.setData(0, Qt.ItemDataRole.UserRole, (path, {"type": item_type, "id": item_id}))
+
+        for topic_name, (topic_item, topic_counts, subjects) in topics.items():
+            topic_item.setText(0, f"{topic_name} ({self._count_text(topic_counts)})")
+            topic_item.setExpanded(True)
+            for path, (subject_item, subject_counts) in subjects.items():
+                subject_name = os.path.splitext(os.path.basename(path))[0]
+                subject_item.setText(0, f"{subject_name} ({self._count_text(subject_counts)})")
+
+        text = f"Total: {self._count_text(total)}."
+        if self.data_manager.search_index.building:
+            text += " Indeks sedang diperbarui..."
+        self.status_label.setText(text)
+
+    def open_result(self, item, column=0):
+        if not item: return
+        result = item.data(0, Qt.ItemDataRole.UserRole)
+        if not result: return
+        self.selected_result = result
+        self.accept()
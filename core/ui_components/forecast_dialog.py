@@ -0,0 +1,85 @@
+# file: core/ui_components/forecast_dialog.py
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QTreeWidget, QTreeWidgetItem, QDialogButtonBox
+)
+from PyQt6.QtCore import QTimer
+import config
+import utils
+from core.content_records import ordinal_to_date, today_ordinal
+from core.workload import forecast
+
+# Lebar batang terpanjang di kolom histogram (dalam karakter)
+BAR_WIDTH = 40
+
+class WorkloadForecastDialog(QDialog):
+    """
+    Histogram jumlah review per hari ke depan untuk semua topic. Angkanya dibaca
+    dari indeks jatuh tempo DataManager, jadi tidak ada file subject yang dibuka.
+    """
+    def __init__(self, data_manager, parent=None, date_format="long"):
+        super().__init__(parent)
+        self.setWindowTitle("Perkiraan Beban Review")
+        self.setMinimumSize(620, 480)
+        self.data_manager = data_manager
+        self.date_format = date_format
+
+        self.layout = QVBoxLayout(self)
+
+        range_layout = QHBoxLayout()
+        range_layout.addWidget(QLabel("Jumlah hari:"))
+        self.days_spin = QSpinBox()
+        self.days_spin.setRange(7, 365)
+        self.days_spin.setValue(config.FORECAST_DAYS)
+        self.days_spin.valueChanged.connect(self.populate)
+        range_layout.addWidget(self.days_spin)
+        range_layout.addStretch()
+        self.layout.addLayout(range_layout)
+
+        self.summary_label = QLabel("")
+        self.layout.addWidget(self.summary_label)
+
+        self.result_tree = QTreeWidget()
+        self.result_tree.setRootIsDecorated(False)
+        self.result_tree.setHeaderLabels(["Tanggal", "Jumlah", ""])
+        self.result_tree.setColumnWidth(0, 220)
+        self.result_tree.setColumnWidth(1, 70)
+        self.layout.addWidget(self.result_tree)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+        # Selama indeks masih diisi di latar belakang, histogram dimuat ulang setelah selesai
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(300)
+        self.index_timer.timeout.connect(self._check_index_finished)
+        if self.data_manager.search_index.building:
+            self.index_timer.start()
+
+        self.populate()
+
+    def _check_index_finished(self):
+        if not self.data_manager.search_index.building:
+            self.index_timer.stop()
+            self.populate()
+
+    def populate(self):
+        self.result_tree.clear()
+        today = today_ordinal()
+        overdue, counts = forecast(self.data_manager.due_index, self.days_spin.value(), today)
+        peak = max(counts, default=0)
+
+        for offset, count in enumerate(counts):
+            item = QTreeWidgetItem(self.result_tree)
+            item.setText(0, utils.format_date(ordinal_to_date(today + offset), self.date_format))
+            item.setText(1, str(count))
+            item.setText(2, "█" * round(count / peak * BAR_WIDTH) if peak else "")
+
+        total = sum(counts)
+        average = total / len(counts) if counts else 0
+        text = (f"Terlambat: {overdue} · {total} review dalam {len(counts)} hari "
+                f"(rata-rata {average:.1f}/hari, tertinggi {peak})")
+        if self.data_manager.search_index.building:
+            text += " · Indeks sedang diperbarui..."
+        self.summary_label.setText(text)
@@ -0,0 +1,173 @@
+# file: core/ui_components/ladder_dialog.py
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QComboBox, QCheckBox, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QDialogButtonBox, QMessageBox
+)
+from core.repetition_ladders import FINISH_CODE, DEFAULT_LADDER, RepetitionLadder
+
+# Kunci tangga global di combo pilihan tangga
+GLOBAL_LADDER = None
+
+class RepetitionLadderDialog(QDialog):
+    """
+    Dialog untuk mengatur tangga repetisi global dan per topic: urutan kode dan
+    jumlah harinya. "Finish" selalu menjadi anak tangga terakhir sehingga tidak
+    ditampilkan di tabel. Perubahan baru disimpan saat OK ditekan.
+    """
+    def __init__(self, ladders, topic_names, parent=None, current_topic=None):
+        super().__init__(parent)
+        self.setWindowTitle("Atur Tangga Repetisi")
+        self.setMinimumSize(420, 420)
+        self.ladders = ladders
+        # Kunci tangga (nama topic / GLOBAL_LADDER) -> list (kode, hari) atau None (pakai global / bawaan)
+        self.pending = {}
+        self._shown_key = GLOBAL_LADDER
+        self._loading = False
+
+        self.layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.ladder_combo = QComboBox()
+        self.ladder_combo.addItem("Global (semua topic)", GLOBAL_LADDER)
+        for name in topic_names:
+            self.ladder_combo.addItem(f"Topic: {name}", name)
+        form.addRow("Tangga:", self.ladder_combo)
+        self.layout.addLayout(form)
+
+        self.inherit_check = QCheckBox("Gunakan tangga global")
+        self.inherit_check.toggled.connect(self._update_enabled)
+        self.layout.addWidget(self.inherit_check)
+
+        self.table = QTableWidget(0, 2)
+        self.table.setHorizontalHeaderLabels(["Kode", "Hari"])
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.layout.addWidget(self.table, 1)
+
+        row_buttons = QHBoxLayout()
+        self.add_button = QPushButton("Tambah")
+        self.add_button.clicked.connect(self.add_row)
+        self.remove_button = QPushButton("Hapus")
+        self.remove_button.clicked.connect(self.remove_row)
+        self.up_button = QPushButton("Naik")
+        self.up_button.clicked.connect(lambda: self.move_row(-1))
+        self.down_button = QPushButton("Turun")
+        self.down_button.clicked.connect(lambda: self.move_row(1))
+        self.reset_button = QPushButton("Kembalikan Bawaan")
+        self.reset_button.clicked.connect(lambda: self._fill_table(DEFAULT_LADDER.steps))
+        for button in (self.add_button, self.remove_button, self.up_button, self.down_button, self.reset_button):
+            row_buttons.addWidget(button)
+        self.layout.addLayout(row_buttons)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+        index = self.ladder_combo.findData(current_topic) if current_topic else 0
+        self.ladder_combo.setCurrentIndex(max(index, 0))
+        self._show_ladder(self.ladder_combo.currentData())
+        self.ladder_combo.currentIndexChanged.connect(self._ladder_changed)
+
+    # --- Tabel ---
+
+    def _fill_table(self, steps):
+        self.table.setRowCount(0)
+        for code, days in steps:
+            self.add_row(code, days)
+
+    def add_row(self, code="", days=0):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.table.setItem(row, 0, QTableWidgetItem(str(code)))
+        self.table.setItem(row, 1, QTableWidgetItem(str(days)))
+
+    def remove_row(self):
+        row = self.table.currentRow()
+        if row >= 0:
+            self.table.removeRow(row)
+
+    def move_row(self, offset):
+        row = self.table.currentRow()
+        target = row + offset
+        if row < 0 or not 0 <= target < self.table.rowCount():
+            return
+        steps = self._table_steps()
+        steps.insert(target, steps.pop(row))
+        self._fill_table(steps)
+        self.table.setCurrentCell(target, 0)
+
+    def _table_steps(self):
+        steps = []
+        for row in range(self.table.rowCount()):
+            code_item, days_item = self.table.item(row, 0), self.table.item(row, 1)
+            steps.append((code_item.text() if code_item else "", days_item.text() if days_item else ""))
+        return steps
+
+    # --- Pergantian Tangga ---
+
+    def _stored_steps(self, key):
+        """Isi tangga untuk kunci ini: yang sedang diedit, atau yang tersimpan."""
+        if key in self.pending:
+            return self.pending[key]
+        if key is GLOBAL_LADDER:
+            return None if self.ladders.default is DEFAULT_LADDER else self.ladders.default.steps
+        ladder = self.ladders.topics.get(key)
+        return ladder.steps if ladder else None
+
+    def _current_steps(self):
+        if self._shown_key is not GLOBAL_LADDER and self.inherit_check.isChecked():
+            return None
+        steps = self._table_steps()
+        if self._shown_key is GLOBAL_LADDER and steps == [(code, str(days)) for code, days in DEFAULT_LADDER.steps]:
+            return None
+        return steps
+
+    def _show_ladder(self, key):
+        self._loading = True
+        self._shown_key = key
+        steps = self._stored_steps(key)
+        is_global = key is GLOBAL_LADDER
+        self.inherit_check.setVisible(not is_global)
+        self.inherit_check.setChecked(not is_global and steps is None)
+        self.reset_button.setVisible(is_global)
+        if steps is None:
+            steps = (self.ladders.default.steps if not is_global and GLOBAL_LADDER not in self.pending
+                     else self.pending.get(GLOBAL_LADDER) or DEFAULT_LADDER.steps)
+        self._fill_table(steps)
+        self._loading = False
+        self._update_enabled()
+
+    def _ladder_changed(self):
+        if self._loading:
+            return
+        self.pending[self._shown_key] = self._current_steps()
+        self._show_ladder(self.ladder_combo.currentData())
+
+    def _update_enabled(self):
+        editable = self._shown_key is GLOBAL_LADDER or not self.inherit_check.isChecked()
+        self.table.setEnabled(editable)
+        for button in (self.add_button, self.remove_button, self.up_button, self.down_button):
+            button.setEnabled(editable)
+
+    # --- Simpan ---
+
+    def accept(self):
+        """Memeriksa semua tangga yang diubah lalu menyimpannya sekaligus."""
+        self.pending[self._shown_key] = self._current_steps()
+        for key, steps in self.pending.items():
+            if steps is None:
+                continue
+            try:
+                RepetitionLadder([(code, days) for code, days in steps if code != FINISH_CODE])
+            except ValueError as e:
+                name = "global" if key is GLOBAL_LADDER else f"topic '{key}'"
+                QMessageBox.warning(self, "Tangga Tidak Valid", f"Tangga {name}: {e}")
+                return
+        for key, steps in self.pending.items():
+            if steps is not None:
+                steps = [(code, days) for code, days in steps if code != FINISH_CODE]
+            if key is GLOBAL_LADDER:
+                self.ladders.set_default(steps)
+            else:
+                self.ladders.set_topic(key, steps)
+        super().accept()
@@ -0,0 +1,120 @@
+# file: core/ui_components/review_dialog.py
+
+import os
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+import config
+import utils
+from core.review_session import ReviewSession
+
+class ReviewSessionDialog(QDialog):
+    """
+    Dialog sesi review: menampilkan satu item jatuh tempo sekaligus. Tombol kode
+    (atau angka 1-9) menjadwalkan ulang item lalu langsung pindah ke item berikutnya.
+    """
+    def __init__(self, data_manager, parent=None, date_format="long"):
+        super().__init__(parent)
+        self.setWindowTitle("Sesi Review")
+        self.setMinimumSize(560, 320)
+        self.date_format = date_format
+        self.session = ReviewSession(data_manager)
+
+        self.layout = QVBoxLayout(self)
+
+        self.progress_label = QLabel("")
+        self.layout.addWidget(self.progress_label)
+
+        self.location_label = QLabel("")
+        self.layout.addWidget(self.location_label)
+
+        frame = QFrame()
+        frame.setFrameShape(QFrame.Shape.StyledPanel)
+        frame_layout = QVBoxLayout(frame)
+        self.text_label = QLabel("")
+        self.text_label.setWordWrap(True)
+        self.text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        font = QFont()
+        font.setPointSize(font.pointSize() + 4)
+        self.text_label.setFont(font)
+        frame_layout.addWidget(self.text_label)
+        self.layout.addWidget(frame, 1)
+
+        self.schedule_label = QLabel("")
+        self.layout.addWidget(self.schedule_label)
+
+        self.code_layout = QHBoxLayout()
+        self.code_buttons = []
+        self.button_codes = None
+        self.set_codes(config.REPETITION_CODES)
+        self.layout.addLayout(self.code_layout)
+
+        action_layout = QHBoxLayout()
+        self.skip_button = QPushButton("Lewati")
+        self.skip_button.setShortcut("S")
+        self.skip_button.clicked.connect(self.skip)
+        action_layout.addWidget(self.skip_button)
+        action_layout.addStretch()
+        self.close_button = QPushButton("Akhiri Sesi")
+        self.close_button.clicked.connect(self.accept)
+        action_layout.addWidget(self.close_button)
+        self.layout.addLayout(action_layout)
+
+        self.show_current()
+
+    def set_codes(self, codes):
+        """Membuat tombol kode sesuai tangga repetisi item aktif (dibuat ulang hanya jika tangganya berbeda)."""
+        if codes == self.button_codes:
+            return
+        self.button_codes = list(codes)
+        for button in self.code_buttons:
+            self.code_layout.removeWidget(button)
+            button.deleteLater()
+        self.code_buttons = []
+        for number, code in enumerate(codes, start=1):
+            button = QPushButton(f"{number}. {code}" if number <= 9 else code)
+            if number <= 9:
+                button.setShortcut(str(number))
+            button.clicked.connect(lambda checked, c=code: self.answer(c))
+            self.code_layout.addWidget(button)
+            self.code_buttons.append(button)
+
+    def show_current(self):
+        current = self.session.current()
+        total = len(self.session)
+        if current is None:
+            self.progress_label.setText(f"Sesi selesai: {self.session.reviewed} dari {total} item direview.")
+            self.location_label.setText("")
+            self.text_label.setText("Tidak ada lagi item yang jatuh tempo." if total else "Tidak ada item yang jatuh tempo hari ini.")
+            self.schedule_label.setText("")
+            for button in self.code_buttons + [self.skip_button]:
+                button.setEnabled(False)
+            return
+
+        path, record = current
+        self.set_codes(self.session.data_manager.ladder_for(path).codes)
+        topic_name = os.path.basename(os.path.dirname(path))
+        subject_name = os.path.splitext(os.path.basename(path))[0]
+        self.progress_label.setText(f"Item {self.session.position + 1} dari {total}")
+        self.location_label.setText(f"{topic_name} › {subject_name}")
+        text_key = "point_text" if "point_text" in record else "discussion"
+        self.text_label.setText(record.get(text_key, ""))
+        self.schedule_label.setText(
+            f"Jatuh tempo: {utils.format_date(record.get('date'), self.date_format)} "
+            f"(kode sekarang: {record.get('repetition_code') or '-'})"
+        )
+
+    def answer(self, code):
+        self.session.answer(code)
+        self.show_current()
+
+    def skip(self):
+        self.session.skip()
+        self.show_current()
+
+    def done(self, result):
+        """Semua perubahan yang tertunda disimpan saat dialog ditutup dengan cara apa pun."""
+        self.session.stop()
+        super().done(result)
@@ -0,0 +1,102 @@
+# file: core/ui_components/search_dialog.py
+
+import os
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QLineEdit, QLabel, QTreeWidget, QTreeWidgetItem, QDialogButtonBox, QCheckBox
+)
+from PyQt6.QtCore import Qt, QTimer
+from core.search_index import DISCUSSION_LOCATION
+
+class GlobalSearchDialog(QDialog):
+    """
+    Dialog pencarian diskusi dan point di semua topic.
+    Hasil diambil dari indeks pencarian DataManager, tanpa membuka file subject.
+    """
+    def __init__(self, data_manager, parent=None, initial_query="", fuzzy=False):
+        super().__init__(parent)
+        self.setWindowTitle("Cari di Semua Topic")
+        self.setMinimumSize(600, 400)
+        self.data_manager = data_manager
+        # (path subject, lokasi) dari hasil yang dipilih pengguna
+        self.selected_result = None
+
+        self.layout = QVBoxLayout(self)
+
+        self.query_input = QLineEdit(initial_query)
+        self.query_input.setPlaceholderText("Cari discussion atau point di semua topic...")
+        self.query_input.returnPressed.connect(self.run_search)
+        self.layout.addWidget(self.query_input)
+
+        self.fuzzy_checkbox = QCheckBox("Fuzzy (toleran salah ketik, diurutkan menurut kemiripan)")
+        self.fuzzy_checkbox.setChecked(fuzzy)
+        self.fuzzy_checkbox.toggled.connect(self.run_search)
+        self.layout.addWidget(self.fuzzy_checkbox)
+
+        self.status_label = QLabel("")
+        self.layout.addWidget(self.status_label)
+
+        self.result_tree = QTreeWidget()
+        self.result_tree.setHeaderLabels(["Teks", "Topic", "Subject"])
+        self.result_tree.setColumnWidth(0, 340)
+        self.result_tree.itemDoubleClicked.connect(self.open_result)
+        self.layout.addWidget(self.result_tree)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Open | QDialogButtonBox.StandardButton.Close)
+        self.button_box.accepted.connect(lambda: self.open_result(self.result_tree.currentItem()))
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+        # Selama indeks masih dibangun di latar belakang, hasil dicari ulang setelah selesai
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(300)
+        self.index_timer.timeout.connect(self._check_index_finished)
+        if self.data_manager.search_index.building:
+            self.index_timer.start()
+
+        if initial_query:
+            self.run_search()
+        else:
+            self._update_status(None)
+
+    def _update_status(self, result_count):
+        text = "" if result_count is None else f"{result_count} hasil ditemukan."
+        if self.data_manager.search_index.building:
+            text = (text + " Indeks pencarian sedang diperbarui...").strip()
+        self.status_label.setText(text)
+
+    def _check_index_finished(self):
+        if not self.data_manager.search_index.building:
+            self.index_timer.stop()
+            self.run_search()
+
+    def run_search(self):
+        """Menjalankan pencarian dan mengisi daftar hasil."""
+        query = self.query_input.text().strip()
+        self.result_tree.clear()
+        if not query:
+            self._update_status(None)
+            return
+
+        if self.fuzzy_checkbox.isChecked():
+            # Sudah terurut dari yang paling mirip
+            rows = self.data_manager.fuzzy_search_all(query)
+        else:
+            results = self.data_manager.search_all(query)
+            rows = [(None, path, location, text)
+                    for path in sorted(results) for location, text in sorted(results[path].items())]
+
+        for score, path, location, text in rows:
+            item = QTreeWidgetItem(self.result_tree)
+            prefix = "" if location[1] == DISCUSSION_LOCATION else "  • "
+            item.setText(0, f"{prefix}{text}")
+            item.setText(1, os.path.basename(os.path.dirname(path)))
+            item.setText(2, os.path.splitext(os.path.basename(path))[0])
+            item.setData(0, Qt.ItemDataRole.UserRole, (path, location))
+            if score is not None:
+                item.setToolTip(0, f"Kemiripan: {score:.0%}")
+        self._update_status(len(rows))
+
+    def open_result(self, item, column=0):
+        if not item: return
+        self.selected_result = item.data(0, Qt.ItemDataRole.UserRole)
+        self.accept()
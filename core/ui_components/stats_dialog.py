@@ -0,0 +1,261 @@
+# file: core/ui_components/stats_dialog.py
+
+from datetime import date
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QTabWidget, QWidget, QTableWidget,
+    QTableWidgetItem, QTreeWidget, QTreeWidgetItem, QHeaderView, QAbstractItemView, QDialogButtonBox
+)
+from PyQt6.QtGui import QColor, QBrush
+from PyQt6.QtCore import Qt, QTimer
+import config
+import utils
+from core.content_records import ordinal_to_date, today_ordinal
+from core.repetition_ladders import FINISH_CODE
+from core.workload import forecast
+from core.ui_components.forecast_dialog import BAR_WIDTH
+
+def _streaks(review_days, today):
+    """(runtun saat ini, runtun terpanjang) dalam hari dari himpunan ordinal yang ada review-nya."""
+    longest = run = 0
+    previous = None
+    for ordinal in sorted(review_days):
+        run = run + 1 if previous == ordinal - 1 else 1
+        longest = max(longest, run)
+        previous = ordinal
+    # Runtun saat ini tetap dihitung jika hari ini belum ada review
+    current = 0
+    ordinal = today if today in review_days else today - 1
+    while ordinal in review_days:
+        current += 1
+        ordinal -= 1
+    return current, longest
+
+def _heat_level(count, peak):
+    """Tingkat warna 0-4: 0 untuk hari tanpa review, sisanya relatif terhadap hari tersibuk."""
+    if not count or not peak:
+        return 0
+    levels = len(config.STATS_HEATMAP_COLORS) - 1
+    return max(1, min(levels, -(-count * levels // peak)))
+
+class StatisticsDialog(QDialog):
+    """
+    Statistik koleksi: kalender review per hari, beban mendatang, jumlah item per
+    kode repetisi, dan item selesai serta retensi per topic.
+
+    Semua angka diambil dari agregat yang sudah ada (agregat log review dan
+    ringkasan per subject di indeks jatuh tempo), jadi membuka jendela ini tidak
+    membaca file subject apa pun.
+    """
+    def __init__(self, data_manager, parent=None, date_format="long"):
+        super().__init__(parent)
+        self.setWindowTitle("Statistik")
+        self.setMinimumSize(820, 520)
+        self.data_manager = data_manager
+        self.date_format = date_format
+        self.review_days = {}  # ordinal -> jumlah review, dari agregat log
+
+        self.layout = QVBoxLayout(self)
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self._build_activity_tab(), "Aktivitas")
+        self.code_tree = self._make_tree(["Kode", "Jumlah Item", ""])
+        self.tabs.addTab(self.code_tree, "Kode Repetisi")
+        self.topic_tree = self._make_tree(["Topic", "Subject", "Item", "Selesai", "% Selesai",
+                                           f"Selesai {config.STATS_FINISHED_RECENT_DAYS} Hari",
+                                           "Review", "Lupa", "Retensi"])
+        self.tabs.addTab(self.topic_tree, "Topic")
+        self.layout.addWidget(self.tabs)
+
+        self.index_label = QLabel("")
+        self.layout.addWidget(self.index_label)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        self.button_box.rejected.connect(self.reject)
+        self.layout.addWidget(self.button_box)
+
+        # Selama indeks masih diisi di latar belakang, angka dari indeks dimuat ulang setelah selesai
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(300)
+        self.index_timer.timeout.connect(self._check_index_finished)
+        if self.data_manager.search_index.building:
+            self.index_timer.start()
+
+        self.populate()
+
+    # --- Pembuatan Widget ---
+
+    def _make_tree(self, labels):
+        tree = QTreeWidget()
+        tree.setRootIsDecorated(False)
+        tree.setHeaderLabels(labels)
+        tree.header().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        return tree
+
+    def _build_activity_tab(self):
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        year_layout = QHBoxLayout()
+        year_layout.addWidget(QLabel("Tahun:"))
+        self.year_combo = QComboBox()
+        self.year_combo.currentIndexChanged.connect(self.populate_heatmap)
+        year_layout.addWidget(self.year_combo)
+        year_layout.addStretch()
+        layout.addLayout(year_layout)
+
+        # Kalender: baris 0 = nama bulan, baris 1-7 = hari dalam minggu; kolom 0 = nama
+        # hari, kolom berikutnya = minggu dalam tahun. Header bawaan disembunyikan agar
+        # label bulan bisa melebar melewati beberapa kolom (setSpan).
+        self.heatmap = QTableWidget(8, 0)
+        self.heatmap.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.heatmap.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.heatmap.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.heatmap.setShowGrid(False)
+        self.heatmap.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.label_font = self.heatmap.font()
+        self.label_font.setPointSizeF(self.label_font.pointSizeF() * 0.8)
+        for header in (self.heatmap.horizontalHeader(), self.heatmap.verticalHeader()):
+            header.hide()
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            header.setMinimumSectionSize(config.STATS_HEATMAP_CELL_SIZE)
+            header.setDefaultSectionSize(config.STATS_HEATMAP_CELL_SIZE)
+        self.heatmap.setRowHeight(0, config.STATS_HEATMAP_CELL_SIZE + 4)
+        layout.addWidget(self.heatmap)
+
+        self.heatmap_label = QLabel("")
+        layout.addWidget(self.heatmap_label)
+
+        layout.addWidget(QLabel("<b>Beban Mendatang</b>"))
+        self.load_label = QLabel("")
+        layout.addWidget(self.load_label)
+        layout.addStretch()
+        return tab
+
+    # --- Pengisian ---
+
+    def _check_index_finished(self):
+        if not self.data_manager.search_index.building:
+            self.index_timer.stop()
+            self.populate()
+
+    def populate(self):
+        today = today_ordinal()
+        aggregates = self.data_manager.review_log.aggregates()
+        self.review_days = {int(ordinal): count for ordinal, count in aggregates["days"].items()}
+        self._populate_years(today)
+        self.populate_heatmap()
+        self._populate_load(today)
+        summary = self.data_manager.due_index.collection_summary(today - config.STATS_FINISHED_RECENT_DAYS + 1)
+        self._populate_codes(summary["codes"])
+        self._populate_topics(summary["topics"], aggregates["topics"])
+        self.index_label.setText("Indeks sedang diperbarui..." if self.data_manager.search_index.building else "")
+
+    def _populate_years(self, today):
+        current_year = self.year_combo.currentData()
+        years = {date.fromordinal(ordinal).year for ordinal in self.review_days}
+        years.add(date.fromordinal(today).year)
+        self.year_combo.blockSignals(True)
+        self.year_combo.clear()
+        for year in sorted(years, reverse=True):
+            self.year_combo.addItem(str(year), year)
+        index = self.year_combo.findData(current_year) if current_year is not None else 0
+        self.year_combo.setCurrentIndex(max(index, 0))
+        self.year_combo.blockSignals(False)
+
+    def populate_heatmap(self):
+        year = self.year_combo.currentData()
+        if year is None:
+            return
+        first = date(year, 1, 1).toordinal()
+        last = date(year, 12, 31).toordinal()
+        # Kolom pertama dimulai dari Senin di minggu yang memuat 1 Januari
+        start = first - date.fromordinal(first).weekday()
+        weeks = (last - start) // 7 + 1
+        counts = {ordinal: count for ordinal, count in self.review_days.items() if first <= ordinal <= last}
+        peak = max(counts.values(), default=0)
+        colors = [QBrush(QColor(color)) for color in config.STATS_HEATMAP_COLORS]
+
+        self.heatmap.clearSpans()
+        self.heatmap.clear()
+        self.heatmap.setColumnCount(weeks + 1)
+        self.heatmap.setColumnWidth(0, self.heatmap.fontMetrics().horizontalAdvance("Sen") * 2)
+        for weekday in range(7):
+            self.heatmap.setItem(weekday + 1, 0, self._label_item(utils.weekday_abbreviation(weekday)))
+        month_columns = [(date(year, month, 1).toordinal() - start) // 7 + 1 for month in range(1, 13)]
+        for month, column in enumerate(month_columns, 1):
+            span = (month_columns[month] if month < 12 else weeks + 1) - column
+            self.heatmap.setItem(0, column, self._label_item(utils.month_abbreviation(month)))
+            if span > 1:
+                self.heatmap.setSpan(0, column, 1, span)
+        for ordinal in range(first, last + 1):
+            count = counts.get(ordinal, 0)
+            item = QTableWidgetItem()
+            item.setBackground(colors[_heat_level(count, peak)])
+            item.setToolTip(f"{utils.format_date(ordinal_to_date(ordinal), self.date_format)}: {count} review")
+            self.heatmap.setItem((ordinal - start) % 7 + 1, (ordinal - start) // 7 + 1, item)
+        self._fit_heatmap()
+
+        total = sum(counts.values())
+        current, longest = _streaks(self.review_days, today_ordinal())
+        self.heatmap_label.setText(
+            f"{total} review dalam {len(counts)} hari aktif di {year} "
+            f"(tertinggi {peak}/hari) · Runtun saat ini: {current} hari · Runtun terpanjang: {longest} hari"
+        )
+
+    def _label_item(self, text):
+        item = QTableWidgetItem(text)
+        item.setFont(self.label_font)
+        item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        return item
+
+    def _fit_heatmap(self):
+        """Menyesuaikan tinggi kalender dengan isinya, ditambah ruang untuk scrollbar horizontal."""
+        frame = 2 * self.heatmap.frameWidth()
+        self.heatmap.setFixedHeight(self.heatmap.verticalHeader().length()
+                                    + self.heatmap.horizontalScrollBar().sizeHint().height() + frame)
+
+    def _populate_load(self, today):
+        overdue, counts = forecast(self.data_manager.due_index, config.FORECAST_DAYS, today)
+        self.load_label.setText(
+            f"Terlambat: {overdue} · Hari ini: {counts[0] if counts else 0} · "
+            f"7 hari: {sum(counts[:7])} · {len(counts)} hari: {sum(counts)} "
+            f"(tertinggi {max(counts, default=0)}/hari)"
+        )
+
+    def _populate_codes(self, code_counts):
+        self.code_tree.clear()
+        # Urutan mengikuti tangga repetisi; kode lain (mis. dari tangga lama) dan item tanpa kode di akhir
+        known_codes = self.data_manager.repetition_ladders.all_codes()
+        codes = [code for code in known_codes if code in code_counts]
+        codes += sorted(code for code in code_counts if code not in known_codes and code)
+        if "" in code_counts:
+            codes.append("")
+        peak = max(code_counts.values(), default=0)
+        for code in codes:
+            count = code_counts[code]
+            item = QTreeWidgetItem(self.code_tree)
+            item.setText(0, code or "(tanpa kode)")
+            item.setText(1, str(count))
+            item.setText(2, "█" * round(count / peak * BAR_WIDTH) if peak else "")
+            if code == FINISH_CODE:
+                item.setForeground(0, QBrush(QColor("gray")))
+
+    def _populate_topics(self, topic_summaries, topic_reviews):
+        self.topic_tree.clear()
+        for name in sorted(topic_summaries, key=str.lower):
+            summary = topic_summaries[name]
+            reviews = topic_reviews.get(name, {})
+            review_count, lapses = reviews.get("reviews", 0), reviews.get("lapses", 0)
+            item = QTreeWidgetItem(self.topic_tree)
+            item.setText(0, name)
+            item.setText(1, str(summary["subjects"]))
+            item.setText(2, str(summary["items"]))
+            item.setText(3, str(summary["finished"]))
+            item.setText(4, f"{summary['finished'] / summary['items']:.0%}" if summary["items"] else "-")
+            item.setText(5, str(summary["finished_recent"]))
+            item.setText(6, str(review_count))
+            item.setText(7, str(lapses))
+            # Retensi: porsi review yang tidak dijawab "lupa"
+            item.setText(8, f"{(review_count - lapses) / review_count:.0%}" if review_count else "-")
+            for column in range(1, 9):
+                item.setTextAlignment(column, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
@@ -11,7 +11,7 @@ from PyQt6.QtCore import QSize
 from PyQt6.QtCore import Qt
 import config
 import json
-from utils import resource_path
+from utils import resource_path, clear_date_format_cache, date_format_cache_info
 
 class UIManager:
     """Kelas untuk mengelola elemen UI seperti menu, tema, dan skala."""
@@ -81,14 +81,68 @@ class UIManager:
         import_action.triggered.connect(self.win.handlers.import_backup)
         backup_menu.addAction(import_action)
 
+        search_menu = menu_bar.addMenu("Cari")
+        global_search_action = QAction("Cari di Semua Topic...", self.win)
+        global_search_action.setShortcut("Ctrl+Shift+F")
+        global_search_action.triggered.connect(self.win.handlers.show_global_search_dialog)
+        search_menu.addAction(global_search_action)
+        live_search_action = QAction("Cari Saat Mengetik", self.win, checkable=True)
+        live_search_action.setChecked(self.win.live_search.enabled)
+        live_search_action.toggled.connect(self.win.handlers.set_live_search)
+        search_menu.addAction(live_search_action)
+        fuzzy_search_action = QAction("Pencarian Fuzzy (Toleran Salah Ketik)", self.win, checkable=True)
+        fuzzy_search_action.setChecked(self.settings.value("fuzzy_search", False, type=bool))
+        fuzzy_search_action.toggled.connect(self.win.handlers.set_fuzzy_search)
+        search_menu.addAction(fuzzy_search_action)
+
+        review_menu = menu_bar.addMenu("Review")
+        due_today_action = QAction("Jatuh Tempo Hari Ini / Terlambat...", self.win)
+        due_today_action.setShortcut("Ctrl+Shift+D")
+        due_today_action.triggered.connect(self.win.handlers.show_due_today_dialog)
+        review_menu.addAction(due_today_action)
+        review_session_action = QAction("Mulai Sesi Review...", self.win)
+        review_session_action.setShortcut("Ctrl+Shift+R")
+        review_session_action.triggered.connect(self.win.handlers.show_review_session)
+        review_menu.addAction(review_session_action)
+        bulk_reschedule_action = QAction("Jadwalkan Ulang Massal...", self.win)
+        bulk_reschedule_action.triggered.connect(self.win.handlers.show_bulk_reschedule_dialog)
+        review_menu.addAction(bulk_reschedule_action)
+        forecast_action = QAction("Perkiraan Beban Review...", self.win)
+        forecast_action.triggered.connect(self.win.handlers.show_workload_forecast)
+        review_menu.addAction(forecast_action)
+        statistics_action = QAction("Statistik...", self.win)
+        statistics_action.triggered.connect(self.win.handlers.show_statistics)
+        review_menu.addAction(statistics_action)
+        review_menu.addSeparator()
+        load_balancing_action = QAction("Seimbangkan Beban Jadwal", self.win, checkable=True)
+        load_balancing_action.setChecked(self.settings.value("load_balancing", False, type=bool))
+        load_balancing_action.toggled.connect(self.win.handlers.set_load_balancing)
+        self.win.handlers.set_load_balancing(load_balancing_action.isChecked())
+        review_menu.addAction(load_balancing_action)
+        adaptive_action = QAction("Penjadwalan Adaptif (FSRS)", self.win, checkable=True)
+        adaptive_action.setChecked(self.settings.value("adaptive_scheduling", False, type=bool))
+        adaptive_action.toggled.connect(self.win.handlers.set_adaptive_scheduling)
+        self.win.handlers.set_adaptive_scheduling(adaptive_action.isChecked())
+        review_menu.addAction(adaptive_action)
+        fit_action = QAction("Sesuaikan Parameter Adaptif...", self.win)
+        fit_action.triggered.connect(self.win.handlers.fit_adaptive_parameters)
+        review_menu.addAction(fit_action)
+        ladder_action = QAction("Atur Tangga Repetisi...", self.win)
+        ladder_action.triggered.connect(self.win.handlers.show_repetition_ladder_dialog)
+        review_menu.addAction(ladder_action)
+
         help_menu = menu_bar.addMenu("Bantuan")
         about_action = QAction("Tentang Aplikasi", self.win)
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
+        diagnostics_action = QAction("Diagnostik Performa", self.win)
+        diagnostics_action.triggered.connect(self.show_diagnostics_dialog)
+        help_menu.addAction(diagnostics_action)
 
     def set_date_format(self, format_type):
         """Menyimpan format tanggal dan merefresh semua tampilan."""
         self.settings.setValue("date_format", format_type)
+        clear_date_format_cache()
         self.win.refresh_manager.refresh_all_views()
 
     def setup_theme_menu(self, menu_bar):
@@ -235,6 +289,59 @@ class UIManager:
         history_button.clicked.connect(self.show_version_history_dialog)
         msg_box.exec()
 
+    def show_diagnostics_dialog(self):
+        """Menampilkan statistik internal seperti efektivitas cache konten."""
+        cache_stats = self.win.data_manager.content_cache.stats()
+        text = (
+            f"<b>Backend penyimpanan:</b> {self.win.data_manager.storage.name}<br><br>"
+            f"<b>Cache Konten</b><br>"
+            f"Entri: {cache_stats['entries']} ({cache_stats['bytes'] / 1024:.0f} KB)<br>"
+            f"Hit: {cache_stats['hits']} &nbsp; Miss: {cache_stats['misses']} "
+            f"({cache_stats['hit_rate']:.0%})<br>"
+            f"Dibuang (eviction): {cache_stats['evictions']}"
+        )
+        search_index = self.win.data_manager.search_index
+        text += (
+            f"<br><br><b>Indeks Pencarian</b><br>"
+            f"Subject terindeks: {len(search_index)} &nbsp; Diindeks ulang: {search_index.subjects_reindexed}"
+            f"{' (sedang diperbarui)' if search_index.building else ''}"
+        )
+        date_cache = date_format_cache_info()
+        text += (
+            f"<br><br><b>Cache Format Tanggal</b><br>"
+            f"Entri: {date_cache.currsize}/{date_cache.maxsize} &nbsp; "
+            f"Hit: {date_cache.hits} &nbsp; Miss: {date_cache.misses}"
+        )
+        due_index = self.win.data_manager.due_index
+        text += (
+            f"<br><br><b>Indeks Jatuh Tempo</b><br>"
+            f"Subject terindeks: {len(due_index)} &nbsp; Jatuh tempo s.d. hari ini: {due_index.count_due()}"
+        )
+        refresh_manager = self.win.refresh_manager
+        text += (
+            f"<br><br><b>Refresh Tampilan</b><br>"
+            f"Dijalankan: {refresh_manager.refreshes_run} &nbsp; "
+            f"Digabung/dilewati: {refresh_manager.suppressed_refreshes}"
+        )
+        review_log = self.win.data_manager.review_log
+        log_stats = review_log.aggregates()
+        text += (
+            f"<br><br><b>Log Review</b><br>"
+            f"Entri: {log_stats['total']} &nbsp; Hari dengan review: {len(log_stats['days'])} &nbsp; "
+            f"Ukuran: {log_stats['offset'] / 1024:.0f} KB"
+        )
+        writer = getattr(self.win.data_manager.storage, "writer", None)
+        if writer:
+            text += (
+                f"<br><br><b>Penyimpanan di Belakang Layar</b><br>"
+                f"Penulisan ke disk: {writer.writes} &nbsp; Digabung: {writer.coalesced}"
+            )
+        msg_box = QMessageBox(self.win)
+        msg_box.setWindowTitle("Diagnostik Performa")
+        msg_box.setTextFormat(Qt.TextFormat.RichText)
+        msg_box.setText(text)
+        msg_box.exec()
+
     def show_version_history_dialog(self):
         """Menampilkan riwayat versi dari file JSON dalam dialog yang bisa di-scroll."""
         try:
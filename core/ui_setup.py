@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import QSize, Qt
+from core.ui_components.content_tree import ContentTreeView
 
 class UIBuilder:
     """Kelas untuk membangun komponen antarmuka pengguna untuk ContentManager."""
@@ -154,16 +155,20 @@ class UIBuilder:
         self.win.search_content_input = QLineEdit()
         self.win.search_content_input.setPlaceholderText("Cari discussion atau point...")
         self.win.search_content_input.returnPressed.connect(self.win.handlers.on_search_text_changed)
+        self.win.search_content_input.textEdited.connect(self.win.handlers.on_search_text_edited)
         search_layout.addWidget(self.win.search_content_input)
         
-        self.win.content_tree = QTreeWidget()
-        self.win.content_tree.setHeaderLabels(["Content", "Date", "Code"])
+        # Model/view: hanya baris yang terlihat yang digambar, editor kode dibuat saat diedit
+        self.win.content_tree = ContentTreeView()
+        self.win.content_tree.content_model.repetition_code_edited.connect(
+            self.win.handlers.repetition_code_changed, Qt.ConnectionType.QueuedConnection
+        )
         self.win.content_tree.header().resizeSection(0, 350)
         self.win.content_tree.header().resizeSection(1, 150)
         self.win.content_tree.header().setSectionsClickable(True)
         self.win.content_tree.header().setSortIndicatorShown(True)
         self.win.content_tree.header().sectionClicked.connect(self.win.handlers.sort_by_column)
-        self.win.content_tree.currentItemChanged.connect(self.win.handlers.update_button_states)
+        self.win.content_tree.current_item_changed.connect(self.win.handlers.update_button_states)
 
         discussion_buttons = self._create_button_layout([
             ("btn_tambah_diskusi", "Tambah Diskusi", self.win.handlers.add_discussion),
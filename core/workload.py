@@ -0,0 +1,62 @@
+# file: core/workload.py
+
+import config
+from core.content_records import today_ordinal
+
+def forecast(due_index, days=None, today=None):
+    """
+    Perkiraan beban review dari indeks jatuh tempo, tanpa membuka file subject.
+    Mengembalikan (jumlah item terlambat, list jumlah per hari untuk hari ini dan
+    days-1 hari berikutnya).
+    """
+    if today is None:
+        today = today_ordinal()
+    days = days or config.FORECAST_DAYS
+    counts = due_index.daily_counts(today, today + days - 1)
+    overdue = due_index.count_due(today - 1)
+    return overdue, [counts.get(today + offset, 0) for offset in range(days)]
+
+class LoadBalancer:
+    """
+    Menggeser tanggal jatuh tempo baru beberapa hari maju atau mundur ke hari
+    yang paling sepi, agar item yang dijadwalkan bersamaan tidak menumpuk di
+    tanggal yang sama.
+
+    Jumlah per hari diambil dari indeks jatuh tempo saat tanggal itu pertama kali
+    ditanya, lalu ditambah untuk setiap tanggal yang sudah dibagikan oleh balancer
+    ini; satu balancer dipakai untuk satu aksi (satu perubahan kode, satu sesi
+    review, atau satu penjadwalan ulang massal).
+    """
+    def __init__(self, due_index, today=None):
+        self.due_index = due_index
+        self.today = today if today is not None else today_ordinal()
+        self._counts = {}  # ordinal -> jumlah item (indeks + yang sudah dibagikan)
+
+    def _count(self, ordinal):
+        count = self._counts.get(ordinal)
+        if count is None:
+            count = self._counts[ordinal] = self.due_index.count_on(ordinal)
+        return count
+
+    def spread(self, interval):
+        """Jumlah hari pergeseran maksimum (±) untuk sebuah interval."""
+        if interval < config.LOAD_BALANCE_MIN_INTERVAL:
+            return 0
+        return min(config.LOAD_BALANCE_MAX_DAYS, max(1, round(interval * config.LOAD_BALANCE_RATIO)))
+
+    def preview(self, due):
+        """
+        Tanggal paling sepi dalam due ± spread (tidak pernah sebelum besok);
+        jika sama sepinya, yang paling dekat dengan due.
+        """
+        spread = self.spread(due - self.today)
+        if not spread:
+            return due
+        candidates = range(max(due - spread, self.today + 1), due + spread + 1)
+        return min(candidates, key=lambda ordinal: (self._count(ordinal), abs(ordinal - due), ordinal))
+
+    def choose(self, due):
+        """Seperti preview(), lalu tanggal terpilih dihitung sebagai terisi satu item."""
+        best = self.preview(due)
+        self._counts[best] = self._count(best) + 1
+        return best
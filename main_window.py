@@ -2,7 +2,7 @@
 
 from PyQt6.QtWidgets import QMainWindow, QStatusBar
 from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, QObject, pyqtSignal
 
 import config
 from core.ui_setup import UIBuilder
@@ -11,8 +11,13 @@ from core.event_handlers import EventHandlers
 from core.ui_manager import UIManager
 from core.state_manager import StateManager
 from core.refresh_manager import RefreshManager # MODIFIED
+from core.live_search import LiveSearch
 from utils import resource_path
 
+class SaveErrorNotifier(QObject):
+    """Meneruskan kegagalan simpan dari thread penulis ke thread UI."""
+    save_failed = pyqtSignal(str, str)
+
 class ContentManager(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -27,6 +32,8 @@ class ContentManager(QMainWindow):
         self.current_topic_path = None
         self.current_subject_path = None
         self.current_content = None
+        # ID diskusi/point -> (indeks diskusi, indeks point) untuk current_content
+        self.content_locations = {}
         self.current_task_category = None
         self.sort_column = 1
         self.sort_order = Qt.SortOrder.AscendingOrder
@@ -43,6 +50,7 @@ class ContentManager(QMainWindow):
         self.ui_manager = UIManager(self)
         self.state_manager = StateManager(self)
         self.refresh_manager = RefreshManager(self) # MODIFIED
+        self.live_search = LiveSearch(self)
 
         # --- Setup UI ---
         self.ui_builder.setup_ui()
@@ -50,6 +58,13 @@ class ContentManager(QMainWindow):
         self.setStatusBar(QStatusBar())
         self.status_bar = self.statusBar()
 
+        # Penyimpanan berjalan di belakang layar; kegagalannya dilaporkan ke status bar
+        self.save_error_notifier = SaveErrorNotifier()
+        self.save_error_notifier.save_failed.connect(self.show_save_error)
+        self.data_manager.set_save_error_handler(
+            lambda path, error: self.save_error_notifier.save_failed.emit(path, str(error))
+        )
+
         # --- Load Data dan Preferensi Awal ---
         self.ui_manager.load_theme()
         self.ui_manager.load_scale()
@@ -61,7 +76,17 @@ class ContentManager(QMainWindow):
         # --- Memuat Status Terakhir ---
         self.state_manager.load_state()
 
+        # Indeks pencarian semua topic dibangun di latar belakang
+        self.data_manager.refresh_search_index()
+
+    def show_save_error(self, path, message):
+        """Menampilkan pesan kegagalan simpan di status bar."""
+        self.status_bar.showMessage(f"Gagal menyimpan {path}: {message}", 8000)
+
     def closeEvent(self, event):
         """Dipanggil saat jendela ditutup."""
         self.state_manager.save_state()
+        self.refresh_manager.stop()
+        self.live_search.stop()
+        self.data_manager.close()
         event.accept()
\ No newline at end of file
@@ -0,0 +1 @@
+# file: tests/__init__.py
@@ -0,0 +1,98 @@
+# file: tests/test_content_tree.py
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt, QModelIndex, QPersistentModelIndex, qInstallMessageHandler
+from PyQt6.QtTest import QAbstractItemModelTester
+from PyQt6.QtWidgets import QApplication
+
+from core.ui_components.content_tree import ContentNode, ContentTreeModel
+
+_app = QApplication.instance() or QApplication([])
+
+def _node(item_type, item_id, text):
+    code = "R1D" if item_type == "point" else None
+    return ContentNode({"type": item_type, "id": item_id}, [text, "", ""], code=code)
+
+def _build(spec, texts=None):
+    """spec: [(ID diskusi, [ID point])]; texts mengganti teks baris tertentu per ID."""
+    texts = texts or {}
+    roots = []
+    for row, (disc_id, point_ids) in enumerate(spec):
+        discussion = _node("discussion", disc_id, texts.get(disc_id, f"d{disc_id}"))
+        discussion.row = row
+        for point_id in point_ids:
+            discussion.add_child(_node("point", point_id, texts.get(point_id, f"p{point_id}")))
+        roots.append(discussion)
+    return roots
+
+def _shape(model, parent=QModelIndex()):
+    """Struktur yang dilihat view: [(ID, teks, [anak])], lewat antarmuka model saja."""
+    shape = []
+    for row in range(model.rowCount(parent)):
+        index = model.index(row, 0, parent)
+        assert model.parent(index) == parent
+        shape.append((index.data(Qt.ItemDataRole.UserRole)["id"], index.data(), _shape(model, index)))
+    return shape
+
+def _expected(spec, texts=None):
+    texts = texts or {}
+    return [(disc_id, texts.get(disc_id, f"d{disc_id}"),
+             [(point_id, texts.get(point_id, f"p{point_id}"), []) for point_id in point_ids])
+            for disc_id, point_ids in spec]
+
+def _update(old_spec, new_spec, texts=None):
+    messages = []
+    qInstallMessageHandler(lambda mode, context, message: messages.append(message))
+    try:
+        model = ContentTreeModel()
+        model.set_nodes(_build(old_spec))
+        tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Warning)
+        old_nodes = {}
+        persistent = {}
+        for row in range(model.rowCount()):
+            index = model.index(row, 0)
+            old_nodes[index.internalPointer().item_data["id"]] = index.internalPointer()
+            persistent[index.internalPointer().item_data["id"]] = QPersistentModelIndex(index)
+            for child_row in range(model.rowCount(index)):
+                child = model.index(child_row, 0, index)
+                old_nodes[child.internalPointer().item_data["id"]] = child.internalPointer()
+                persistent[child.internalPointer().item_data["id"]] = QPersistentModelIndex(child)
+
+        plan = model.plan_update(_build(new_spec, texts))
+        assert plan is not None
+        model.apply_update(plan)
+        del tester
+    finally:
+        qInstallMessageHandler(None)
+    assert messages == []
+    assert _shape(model) == _expected(new_spec, texts)
+
+    # Point yang pindah ke diskusi lain dihapus lalu disisipkan sebagai node baru
+    kept = {disc_id for disc_id, _ in new_spec} | {point_id for disc_id, point_ids in new_spec for point_id in point_ids
+                                                   if point_id in dict(old_spec).get(disc_id, ())}
+    for item_id, node in old_nodes.items():
+        index = QModelIndex(persistent[item_id])
+        if item_id not in kept:
+            assert not index.isValid()
+            continue
+        # Node yang tetap ada tidak diganti, dan indeks persisten view ikut mengikutinya
+        assert index.isValid() and index.internalPointer() is node
+        assert model.index_for_item_data(node.item_data).internalPointer() is node
+    return model
+
+def test_remove_move_and_insert_rows():
+    _update([(1, [10, 11, 12]), (2, [20, 21]), (3, []), (4, [40])],
+            [(4, [40, 41]), (1, [12, 10]), (5, [50]), (2, [21])])
+
+def test_point_moves_to_another_discussion():
+    _update([(1, [10, 11]), (2, [20])], [(1, [10]), (2, [11, 20])])
+
+def test_changed_texts_update_in_place():
+    _update([(1, [10, 11]), (2, [])], [(1, [11, 10]), (2, [])], texts={1: "diskusi baru", 10: "point baru"})
+
+def test_clear_and_refill():
+    _update([(1, [10])], [])
+    _update([], [(1, [10, 11]), (2, [])])
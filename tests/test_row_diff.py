@@ -0,0 +1,80 @@
+# file: tests/test_row_diff.py
+
+import random
+
+from core.row_diff import diff_keyed_rows
+
+def _apply(old_keys, ops):
+    """Menerapkan operasi diff_keyed_rows satu per satu, seperti ContentTreeModel.apply_update."""
+    rows = list(old_keys)
+    for op in ops:
+        if op[0] == "remove":
+            rows.pop(op[1])
+        elif op[0] == "move":
+            rows.insert(op[2], rows.pop(op[1]))
+        else:
+            rows.insert(op[1], op[2])
+    return rows
+
+def _lis_length(values):
+    best = []
+    for i, value in enumerate(values):
+        best.append(1 + max((best[j] for j in range(i) if values[j] < value), default=0))
+    return max(best, default=0)
+
+def _minimal_moves(old_keys, new_keys):
+    new_positions = {key: i for i, key in enumerate(new_keys)}
+    kept = [new_positions[key] for key in old_keys if key in new_positions]
+    return len(kept) - _lis_length(kept)
+
+def _assert_diff(old_keys, new_keys):
+    ops = diff_keyed_rows(old_keys, new_keys)
+    assert _apply(old_keys, ops) == new_keys
+    moves = sum(1 for op in ops if op[0] == "move")
+    assert moves <= _minimal_moves(old_keys, new_keys)
+    assert sum(1 for op in ops if op[0] == "remove") == len(set(old_keys) - set(new_keys))
+    assert sum(1 for op in ops if op[0] == "insert") == len(set(new_keys) - set(old_keys))
+    return ops
+
+def test_identical_rows_need_no_ops():
+    assert diff_keyed_rows(["a", "b", "c"], ["a", "b", "c"]) == []
+    assert diff_keyed_rows([], []) == []
+
+def test_edge_cases():
+    _assert_diff([], ["a", "b"])
+    _assert_diff(["a", "b"], [])
+    _assert_diff(["a", "b", "c", "d"], ["d", "c", "b", "a"])
+    _assert_diff(["a", "b", "c"], ["x", "y", "z"])
+    _assert_diff(["a", "b", "c", "d"], ["b", "d"])
+
+def test_single_move_to_front():
+    ops = _assert_diff(["a", "b", "c", "d", "e"], ["e", "a", "b", "c", "d"])
+    assert ops == [("move", 4, 0)]
+
+def test_insert_and_remove_do_not_move_other_rows():
+    ops = _assert_diff(["a", "b", "c", "d"], ["new", "a", "c", "d", "tail"])
+    assert [op[0] for op in ops] == ["remove", "insert", "insert"]
+
+def test_random_orders():
+    rng = random.Random(12)
+    for _ in range(500):
+        old_keys = rng.sample(range(40), rng.randint(0, 25))
+        new_keys = [key for key in old_keys if rng.random() < 0.8] + rng.sample(range(40, 60), rng.randint(0, 5))
+        if rng.random() < 0.5:
+            rng.shuffle(new_keys)
+        else:
+            # Hanya beberapa baris yang dipindah, seperti pengeditan biasa
+            for _ in range(rng.randint(0, 3)):
+                if new_keys:
+                    new_keys.insert(rng.randrange(len(new_keys)), new_keys.pop(rng.randrange(len(new_keys))))
+        _assert_diff(old_keys, new_keys)
+
+def test_budget():
+    rng = random.Random(7)
+    for _ in range(200):
+        old_keys = rng.sample(range(30), rng.randint(0, 20))
+        new_keys = rng.sample(old_keys, len(old_keys) * 3 // 4) + rng.sample(range(30, 40), rng.randint(0, 4))
+        ops = diff_keyed_rows(old_keys, new_keys)
+        assert diff_keyed_rows(old_keys, new_keys, budget=len(ops)) == ops
+        if ops:
+            assert diff_keyed_rows(old_keys, new_keys, budget=len(ops) - 1) is None
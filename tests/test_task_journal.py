@@ -0,0 +1,108 @@
+# file: tests/test_task_journal.py
+
+import json
+import os
+
+import config
+from core.storage.json_storage import JsonStorage
+from core.storage.task_journal import TaskJournal
+from core.storage.task_operations import make_operation
+
+def _write_journal(path, ops, tail=""):
+    with open(path, "w", encoding="utf-8") as f:
+        for seq, op in enumerate(ops, 1):
+            f.write(json.dumps(dict(op, seq=seq)) + "\n")
+        f.write(tail)
+
+def _storage(tmp_path):
+    base_path = tmp_path / "topics"
+    base_path.mkdir(exist_ok=True)
+    return JsonStorage(str(base_path), str(tmp_path / "my_tasks.json"))
+
+def _task(name, checked=False):
+    return {"name": name, "count": 0, "date": "2026-10-18", "checked": checked}
+
+def test_torn_tail_is_dropped_before_next_append(tmp_path):
+    path = tmp_path / "my_tasks.journal"
+    ops = [make_operation("create_category", name="A"), make_operation("create_category", name="B")]
+    _write_journal(path, ops, tail='{"op": "create_category", "na')
+
+    journal = TaskJournal(str(path))
+    assert [op["seq"] for op in journal.read_operations()] == [1, 2]
+    assert path.read_text(encoding="utf-8").endswith("\n")
+    assert journal.size_bytes == os.path.getsize(path)
+
+    assert journal.append(make_operation("create_category", name="C")) == 3
+    reread = TaskJournal(str(path)).read_operations()
+    assert [(op["seq"], op["name"]) for op in reread] == [(1, "A"), (2, "B"), (3, "C")]
+
+def test_last_seq_survives_truncation(tmp_path):
+    path = tmp_path / "my_tasks.journal"
+    _write_journal(path, [make_operation("create_category", name=str(i)) for i in range(5)])
+
+    journal = TaskJournal(str(path))
+    assert [op["seq"] for op in journal.read_operations(after_seq=3)] == [4, 5]
+    assert journal.last_seq == 5
+
+    journal.truncate_through(5)
+    assert not path.exists() and journal.size_bytes == 0
+    assert journal.append(make_operation("create_category", name="x")) == 6
+
+    # Snapshot yang lebih baru dari jurnal (jurnal sudah dilipat) tetap menentukan seq berikutnya
+    empty = TaskJournal(str(tmp_path / "other.journal"))
+    assert empty.read_operations(after_seq=8) == []
+    assert empty.append(make_operation("create_category", name="y")) == 9
+
+def test_replay_applies_only_operations_after_snapshot(tmp_path):
+    # Snapshot sudah memuat seq 1 (B dipindah ke depan); memutarnya ulang akan mengembalikan urutan
+    snapshot = {"categories": [{"name": "B", "icon": "", "tasks": []},
+                               {"name": "A", "icon": "", "tasks": [_task("t1")]}],
+                "journal_seq": 1}
+    (tmp_path / "my_tasks.json").write_text(json.dumps(snapshot), encoding="utf-8")
+    _write_journal(tmp_path / "my_tasks.journal", [
+        make_operation("move_category", index=0, new_index=1),
+        make_operation("set_task_checked", category="A", task_name="t1", checked=True),
+    ])
+
+    storage = _storage(tmp_path)
+    try:
+        data = storage.load_tasks()
+        assert [category["name"] for category in data["categories"]] == ["B", "A"]
+        assert data["categories"][1]["tasks"][0]["checked"] is True
+        assert "journal_seq" not in data
+        assert storage.task_journal.last_seq == 2
+    finally:
+        storage.close()
+
+def test_snapshot_folds_journal_and_new_operations_replay_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "TASK_JOURNAL_COMPACT_BYTES", 300)
+    storage = _storage(tmp_path)
+    try:
+        storage.save_tasks({"categories": []})
+        storage.apply_task_operation(make_operation("create_category", name="A"))
+        for i in range(6):
+            storage.apply_task_operation(make_operation("save_task", category="A", task_name=f"t{i}", data=_task(f"t{i}")))
+        # Kompaksi berjalan lewat penulis latar belakang; setelah tertulis, jurnal sampai journal_seq dibuang
+        storage.flush()
+        folded_seq = json.loads((tmp_path / "my_tasks.json").read_text(encoding="utf-8"))["journal_seq"]
+        assert folded_seq > 0
+        remaining = TaskJournal(storage.task_journal.journal_path).read_operations()
+        assert all(op["seq"] > folded_seq for op in remaining)
+
+        monkeypatch.setattr(config, "TASK_JOURNAL_COMPACT_BYTES", 1 << 20)
+        last_seq = storage.task_journal.last_seq
+        storage.apply_task_operation(make_operation("set_task_checked", category="A", task_name="t0", checked=True))
+        assert storage.task_journal.last_seq == last_seq + 1
+        expected = json.loads(json.dumps(storage.load_tasks()))
+    finally:
+        storage.writer.close()
+
+    # Operasi terakhir hanya ada di jurnal, jadi harus diputar di atas snapshot
+    snapshot_seq = json.loads((tmp_path / "my_tasks.json").read_text(encoding="utf-8"))["journal_seq"]
+    assert snapshot_seq < last_seq + 1
+    reopened = _storage(tmp_path)
+    try:
+        assert reopened.load_tasks() == expected
+        assert [task["name"] for task in expected["categories"][0]["tasks"]] == [f"t{i}" for i in range(6)]
+    finally:
+        reopened.close()
@@ -2,27 +2,96 @@
 
 import sys
 import os
-from datetime import datetime
+import locale
+import functools
+from datetime import date, datetime
+
+# Ukuran cache format_date: cukup untuk semua tanggal yang tampil di beberapa tahun data
+DATE_FORMAT_CACHE_SIZE = 4096
+
+# Nama hari dan bulan untuk locale Indonesia yang diatur main.py, sehingga
+# format_date tidak perlu strftime (dan tetap benar meski locale OS tidak lengkap)
+_DAY_NAMES_ID = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu"]
+_MONTH_NAMES_ID = ["Januari", "Februari", "Maret", "April", "Mei", "Juni",
+                   "Juli", "Agustus", "September", "Oktober", "November", "Desember"]
+_MONTH_ABBR_ID = ["Jan", "Feb", "Mar", "Apr", "Mei", "Jun", "Jul", "Agu", "Sep", "Okt", "Nov", "Des"]
+
+# Locale LC_TIME dibaca sekali lalu disimpan; diperbarui oleh clear_date_format_cache()
+_time_locale = None
+
+def _current_time_locale():
+    global _time_locale
+    if _time_locale is None:
+        try:
+            language = locale.setlocale(locale.LC_TIME)
+        except locale.Error:
+            language = "C"
+        _time_locale = language
+    return _time_locale
+
+def _is_indonesian(locale_name):
+    return locale_name.lower().startswith(("id_", "id-", "indonesian"))
+
+@functools.lru_cache(maxsize=DATE_FORMAT_CACHE_SIZE)
+def _format_date_cached(date_str, format_type, locale_name):
+    try:
+        date_obj = date.fromisoformat(date_str)
+    except ValueError:
+        # fromisoformat menolak tanggal tanpa nol di depan (mis. "2026-1-5")
+        try:
+            date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+        except ValueError:
+            return date_str
+    if format_type == "short":
+        return date_obj.isoformat()
+    if _is_indonesian(locale_name):
+        day, month, year = date_obj.day, date_obj.month, date_obj.year
+        if format_type == "medium":
+            return f"{day:02d} {_MONTH_ABBR_ID[month - 1]} {year} "
+        elif format_type == "no_year":
+            return f"{day:02d} {_MONTH_ABBR_ID[month - 1]}"
+        return f"{_DAY_NAMES_ID[date_obj.weekday()]}, {day:02d} {_MONTH_NAMES_ID[month - 1]} {year}"
+    # Locale lain (mis. locale Indonesia tidak tersedia): ikuti strftime seperti sebelumnya
+    if format_type == "medium":
+        return date_obj.strftime("%d %b %Y ")
+    elif format_type == "no_year":
+        return date_obj.strftime("%d %b")
+    return date_obj.strftime("%A, %d %B %Y")
 
 def format_date(date_str, format_type="long"):
     """
     Mengubah format tanggal YYYY-MM-DD ke format yang ditentukan.
-    format_type: "short", "medium", "long"
+    format_type: "short", "medium", "no_year", "long"
+    Hasil disimpan di cache LRU per (tanggal, format, locale), jadi biaya refresh
+    tidak bergantung pada jumlah baris yang menampilkan tanggal yang sama.
     """
     if not date_str:
         return ""
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        if format_type == "short":
-            return date_obj.strftime("%Y-%m-%d")
-        elif format_type == "medium":
-            return date_obj.strftime("%d %b %Y ")
-        elif format_type == "no_year":
-            return date_obj.strftime("%d %b")
-        # Default to long format
-        return date_obj.strftime("%A, %d %B %Y")
-    except ValueError:
+    if not isinstance(date_str, str):
         return date_str
+    return _format_date_cached(date_str, format_type, _current_time_locale())
+
+def month_abbreviation(month):
+    """Singkatan nama bulan (1-12) sesuai locale, untuk label kalender."""
+    if _is_indonesian(_current_time_locale()):
+        return _MONTH_ABBR_ID[month - 1]
+    return date(2000, month, 1).strftime("%b")
+
+def weekday_abbreviation(weekday):
+    """Singkatan nama hari (0 = Senin) sesuai locale, untuk label kalender."""
+    if _is_indonesian(_current_time_locale()):
+        return _DAY_NAMES_ID[weekday][:3]
+    return date(2024, 1, 1 + weekday).strftime("%a")
+
+def clear_date_format_cache():
+    """Dipanggil saat format tanggal (atau locale) berubah."""
+    global _time_locale
+    _time_locale = None
+    _format_date_cached.cache_clear()
+
+def date_format_cache_info():
+    """Statistik cache format_date untuk dialog diagnostik."""
+    return _format_date_cached.cache_info()
 
 def resource_path(relative_path):
     """ Mendapatkan path absolut ke resource, berfungsi untuk mode dev dan PyInstaller """